@@ -0,0 +1,110 @@
+"""Run the benchmark suite and compare it with a baseline.
+
+Run with ``python -m benchmarks``. ``--update-baseline`` records the
+current results in ``benchmarks/baseline.json``; ``--check`` exits with
+status 1 when a metric regressed by more than ``--tolerance``.
+"""
+import argparse
+import importlib
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+MODULES = (
+    "bench_bulk_create",
+    "bench_codec",
+    "bench_entity_memory",
+    "bench_fairness",
+    "bench_lifecycle",
+    "bench_status_transition",
+)
+BASELINE = Path(__file__).with_name("baseline.json")
+HIGHER_IS_BETTER = ("_per_s",)
+LOWER_IS_BETTER = ("_ms", "_us", "_bytes", "_blocks")
+
+
+def run(modules: List[str]) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for module in modules:
+        print(f"running {module}...", file=sys.stderr)
+        results[module] = importlib.import_module(f"benchmarks.{module}").run()
+    return results
+
+
+def change(name: str, baseline: float, current: float) -> Optional[float]:
+    # Relative change where positive is always an improvement, or None for
+    # informational metrics without a better direction.
+    if not baseline:
+        return None
+    if name.endswith(HIGHER_IS_BETTER):
+        return (current - baseline) / baseline
+    if name.endswith(LOWER_IS_BETTER):
+        return (baseline - current) / baseline
+    return None
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    results: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> int:
+    regressions = 0
+    for module, metrics in results.items():
+        print(module)
+        for name, current in metrics.items():
+            previous = baseline.get(module, {}).get(name)
+            if previous is None:
+                print(f"  {name:>30}: {current:14.3f}  (new)")
+                continue
+            delta = change(name, previous, current)
+            flag = ""
+            if delta is not None and delta < -tolerance:
+                flag = "  REGRESSION"
+                regressions += 1
+            shown = f"{delta:+8.1%}" if delta is not None else " " * 8
+            print(
+                f"  {name:>30}: {current:14.3f}  "
+                f"baseline {previous:14.3f} {shown}{flag}"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", metavar="module")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+    unknown = sorted(set(args.modules) - set(MODULES))
+    if unknown:
+        parser.error(f"unknown modules {unknown}, choose from {MODULES}")
+
+    results = run(args.modules or list(MODULES))
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(baseline, results, tolerance=args.tolerance)
+
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": baseline},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n"
+        )
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+    if args.check and regressions:
+        print(f"{regressions} regression(s)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
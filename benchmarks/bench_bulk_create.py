@@ -0,0 +1,86 @@
+"""Throughput of CreateNotification per item vs streaming CreateNotifications.
+
+Both paths build, store and publish the same specs against the in-memory
+repository and bus. Run with ``python -m benchmarks.bench_bulk_create``.
+"""
+import time
+from typing import Dict, Iterator
+from uuid import uuid4
+
+from sl_notifications_broker.application.use_cases.create_notification import (
+    CreateNotification,
+)
+from sl_notifications_broker.application.use_cases.create_notifications import (
+    CreateNotifications,
+    NotificationSpec,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    SecondLifeUser,
+)
+from sl_notifications_broker.domain.factories.event_factory import EventFactory
+from sl_notifications_broker.infrastructure.in_memory.message_bus import (
+    InMemoryMessageBus,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+
+NOTIFICATIONS = 20_000
+CHUNK_SIZE = 500
+
+
+def specs(count: int) -> Iterator[NotificationSpec]:
+    for index in range(count):
+        yield NotificationSpec(
+            second_life_uuid=uuid4(),
+            second_life_username="resident",
+            message=f"message {index}",
+        )
+
+
+def single(count: int) -> float:
+    create_notification = CreateNotification(
+        notification_repository=InMemoryNotificationRepository(),
+        message_bus=InMemoryMessageBus(max_queue_size=0),
+        event_factory=EventFactory(),
+    )
+    started_at = time.perf_counter()
+    for spec in specs(count):
+        create_notification(
+            notification=Notification(
+                send_to=SecondLifeUser(
+                    second_life_username=spec.second_life_username,
+                    second_life_uuid=spec.second_life_uuid,
+                ),
+                message=NotificationMessage(body=spec.message),
+            )
+        )
+    return time.perf_counter() - started_at
+
+
+def bulk(count: int) -> float:
+    create_notifications = CreateNotifications(
+        notification_repository=InMemoryNotificationRepository(),
+        message_bus=InMemoryMessageBus(max_queue_size=0),
+        event_factory=EventFactory(),
+        chunk_size=CHUNK_SIZE,
+    )
+    started_at = time.perf_counter()
+    for result in create_notifications(specs(count)):
+        if result.error is not None:
+            raise result.error
+    return time.perf_counter() - started_at
+
+
+def run(count: int = NOTIFICATIONS) -> Dict[str, float]:
+    return {
+        "single_create_per_s": count / single(count),
+        "bulk_create_per_s": count / bulk(count),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:>30}: {value:12.3f}")
@@ -0,0 +1,63 @@
+"""Notification serialization throughput, in notifications per second.
+
+Run with ``python -m benchmarks.bench_codec``.
+"""
+import timeit
+from datetime import datetime
+from typing import Dict, Tuple
+
+from sl_notifications_broker.domain.codecs.notification_codec import (
+    NotificationCodec,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+BATCH = 1_000
+
+
+def strptime_from_dict(data: Dict) -> Tuple[datetime, datetime]:
+    # The pre-codec parsing path of Notification.from_dict.
+    return (
+        datetime.strptime(data["created_at"], "%Y-%m-%d %H:%M:%S.%f"),
+        datetime.strptime(data["updated_at"], "%Y-%m-%d %H:%M:%S.%f"),
+    )
+
+
+def throughput(function) -> float:
+    seconds = min(timeit.repeat(function, number=1, repeat=5))
+    return BATCH / seconds
+
+
+def run() -> Dict[str, float]:
+    codec = NotificationCodec()
+    notifications = [get_notification_fixture() for _ in range(BATCH)]
+    as_dicts = [notification.as_dict() for notification in notifications]
+    codec_dicts = codec.to_dict_many(notifications)
+    encoded = codec.encode_many(notifications)
+
+    return {
+        "as_dict_per_s": throughput(
+            lambda: [notification.as_dict() for notification in notifications]
+        ),
+        "strptime_dates_per_s": throughput(
+            lambda: [strptime_from_dict(data) for data in as_dicts]
+        ),
+        "from_dict_per_s": throughput(
+            lambda: [codec.from_dict(data) for data in as_dicts]
+        ),
+        "codec_to_dict_per_s": throughput(
+            lambda: codec.to_dict_many(notifications)
+        ),
+        "codec_from_dict_per_s": throughput(
+            lambda: codec.from_dict_many(codec_dicts)
+        ),
+        "encode_many_per_s": throughput(
+            lambda: codec.encode_many(notifications)
+        ),
+        "decode_many_per_s": throughput(lambda: codec.decode_many(encoded)),
+        "binary_bytes_per_notification": len(encoded) / BATCH,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:>30}: {value:12.1f}")
@@ -0,0 +1,103 @@
+"""Bytes per Notification/Worker instance, dict layout vs __slots__.
+
+Run with ``python -m benchmarks.bench_entity_memory``.
+"""
+import gc
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict
+from uuid import uuid4
+
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    NotificationStatus,
+    SecondLifeUser,
+)
+from sl_notifications_broker.domain.entities.worker import (
+    CircuitState,
+    Worker,
+    WorkerStatus,
+)
+
+INSTANCES = 100_000
+
+
+class DictNotification:
+    # Attribute layout of Notification before it moved to __slots__.
+    def __init__(self, send_to, message, notification_id, created_at):
+        self.__send_to = send_to
+        self.__message = message
+        self.__status = NotificationStatus.PENDING
+        self.__notification_id = notification_id
+        self.__created_at = created_at
+        self.__updated_at = created_at
+
+
+class DictWorker:
+    # Attribute layout of Worker before it moved to __slots__.
+    def __init__(self, worker_uuid, worker_url, created_at):
+        self.__worker_uuid = worker_uuid
+        self.__worker_status = WorkerStatus.ONLINE
+        self.__worker_url = worker_url
+        self.__created_at = created_at
+        self.__updated_at = created_at
+        self.__circuit_state = CircuitState.CLOSED
+        self.__failure_count = 0
+        self.__circuit_opened_at = None
+
+
+def bytes_per_instance(factory: Callable[[], object]) -> float:
+    # Identifiers and timestamps are built before tracing starts, so only
+    # the entity objects themselves are measured.
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(INSTANCES)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_overhead = len(instances) * 8
+    return (after - before - list_overhead) / INSTANCES
+
+
+def run() -> Dict[str, float]:
+    send_to = SecondLifeUser(
+        second_life_username="slusername", second_life_uuid=uuid4()
+    )
+    message = NotificationMessage(body="This is a notification message.")
+    created_at = datetime.now()
+    notification_ids = iter([uuid4() for _ in range(INSTANCES * 2)])
+    worker_ids = iter([uuid4() for _ in range(INSTANCES * 2)])
+    worker_url = "https://lslurlforworker.com"
+
+    return {
+        "notification_dict_bytes": bytes_per_instance(
+            lambda: DictNotification(
+                send_to, message, next(notification_ids), created_at
+            )
+        ),
+        "notification_slots_bytes": bytes_per_instance(
+            lambda: Notification(
+                send_to=send_to,
+                message=message,
+                notification_id=next(notification_ids),
+                created_at=created_at,
+            )
+        ),
+        "worker_dict_bytes": bytes_per_instance(
+            lambda: DictWorker(next(worker_ids), worker_url, created_at)
+        ),
+        "worker_slots_bytes": bytes_per_instance(
+            lambda: Worker(
+                worker_uuid=next(worker_ids),
+                worker_status=WorkerStatus.ONLINE,
+                worker_url=worker_url,
+                created_at=created_at,
+            )
+        ),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:>28}: {value:8.1f}")
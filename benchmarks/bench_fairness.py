@@ -0,0 +1,103 @@
+"""Queueing delay per priority while a low-priority blast is drained.
+
+A blast of LOW notifications arrives first, then HIGH and NORMAL ones keep
+arriving every tick while the broker dispatches a fixed number per tick.
+Delays are in ticks. Run with ``python -m benchmarks.bench_fairness``.
+"""
+from collections import deque
+from typing import Dict, List
+
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationPriority,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_queue import (
+    InMemoryWeightedFairQueue,
+)
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+BLAST = 5_000
+ARRIVALS_PER_TICK = {
+    NotificationPriority.HIGH: 2,
+    NotificationPriority.NORMAL: 6,
+}
+DISPATCH_PER_TICK = 20
+TICKS = 400
+MAX_WAIT = 100
+
+
+class FifoQueue:
+    def __init__(self) -> None:
+        self.__queue: deque = deque()
+
+    def push_many(self, notifications: List[Notification]) -> None:
+        self.__queue.extend(notifications)
+
+    def pop_many(self, limit: int) -> List[Notification]:
+        return [
+            self.__queue.popleft()
+            for _ in range(min(limit, len(self.__queue)))
+        ]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def simulate(queue, clock: FakeClock) -> Dict[str, float]:
+    pushed_at: Dict[Notification, float] = {}
+    waits: Dict[NotificationPriority, List[float]] = {
+        priority: [] for priority in NotificationPriority
+    }
+
+    def push(priority: NotificationPriority, count: int) -> None:
+        notifications = [
+            get_notification_fixture({"priority": priority})
+            for _ in range(count)
+        ]
+        for notification in notifications:
+            pushed_at[notification] = clock.now
+        queue.push_many(notifications)
+
+    push(NotificationPriority.LOW, BLAST)
+    for tick in range(TICKS):
+        clock.now = tick
+        for priority, count in ARRIVALS_PER_TICK.items():
+            push(priority, count)
+        for notification in queue.pop_many(DISPATCH_PER_TICK):
+            waits[notification.priority].append(
+                clock.now - pushed_at[notification]
+            )
+
+    results = {}
+    for priority, values in waits.items():
+        results[f"{priority.value}_p50"] = percentile(values, 0.5)
+        results[f"{priority.value}_p99"] = percentile(values, 0.99)
+        results[f"{priority.value}_served"] = len(values)
+    return results
+
+
+def run() -> Dict[str, float]:
+    results = {}
+    for name, clock, queue_factory in (
+        ("fifo", FakeClock(), lambda clock: FifoQueue()),
+        (
+            "fair",
+            FakeClock(),
+            lambda clock: InMemoryWeightedFairQueue(
+                max_wait=MAX_WAIT, clock=clock
+            ),
+        ),
+    ):
+        for key, value in simulate(queue_factory(clock), clock).items():
+            results[f"{name}_{key}"] = value
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:>22}: {value:8.1f}")
@@ -0,0 +1,211 @@
+"""Throughput, latency percentiles and allocations of the lifecycle paths.
+
+CreateNotification and ProcessNotification run end to end against the
+in-memory adapters. Latency and failures are injected into the repository,
+bus and worker interface. Run with ``python -m benchmarks.bench_lifecycle``
+and see ``--help`` for the fault-injection knobs.
+"""
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from benchmarks.fault_injection import FaultInjector, InjectedFault
+from sl_notifications_broker.application.use_cases.create_notification import (
+    CreateNotification,
+)
+from sl_notifications_broker.application.use_cases.process_notification import (
+    ProcessNotification,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.events.notification_created_event import (
+    NotificationCreatedEvent,
+)
+from sl_notifications_broker.domain.factories.event_factory import EventFactory
+from sl_notifications_broker.infrastructure.in_memory.message_bus import (
+    InMemoryMessageBus,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+from sl_notifications_broker.infrastructure.in_memory.worker_interface import (
+    InMemoryWorkerInterface,
+)
+from sl_notifications_broker.infrastructure.in_memory.worker_repository import (
+    InMemoryWorkerRepository,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+NOTIFICATIONS = 2_000
+WORKERS = 4
+SEED = 1234
+
+
+def percentile(latencies: Sequence[float], fraction: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(
+    name: str,
+    function: Callable[[object], object],
+    items: Tuple[List, List],
+) -> Dict[str, float]:
+    # Latencies come from an untraced pass and allocations from a second
+    # pass over fresh items, since tracemalloc slows every allocation down.
+    latencies = []
+    errors = 0
+    started_at = time.perf_counter()
+    for item in items[0]:
+        call_started_at = time.perf_counter()
+        try:
+            function(item)
+        except InjectedFault:
+            errors += 1
+        latencies.append(time.perf_counter() - call_started_at)
+    elapsed = time.perf_counter() - started_at
+
+    # Results are kept alive, so what remains traced afterwards is what
+    # each call allocated for its result and side effects (stored copies,
+    # queued events), not transient garbage.
+    results = []
+    gc.collect()
+    tracemalloc.start()
+    bytes_before, _ = tracemalloc.get_traced_memory()
+    blocks_before = len(tracemalloc.take_snapshot().traces)
+    for item in items[1]:
+        try:
+            results.append(function(item))
+        except InjectedFault:
+            pass
+    bytes_after, _ = tracemalloc.get_traced_memory()
+    blocks_after = len(tracemalloc.take_snapshot().traces)
+    tracemalloc.stop()
+
+    count = len(items[0])
+    return {
+        f"{name}_per_s": count / elapsed,
+        f"{name}_p50_ms": percentile(latencies, 0.50) * 1000,
+        f"{name}_p95_ms": percentile(latencies, 0.95) * 1000,
+        f"{name}_p99_ms": percentile(latencies, 0.99) * 1000,
+        f"{name}_alloc_bytes": (bytes_after - bytes_before) / len(items[1]),
+        f"{name}_alloc_blocks": (blocks_after - blocks_before)
+        / len(items[1]),
+        f"{name}_errors": errors,
+    }
+
+
+def notifications(count: int) -> List[Notification]:
+    return [get_notification_fixture() for _ in range(count)]
+
+
+def run(
+    repository_latency: float = 0.0,
+    bus_latency: float = 0.0,
+    worker_latency: float = 0.0,
+    failure_rate: float = 0.0,
+    count: int = NOTIFICATIONS,
+) -> Dict[str, float]:
+    notification_repository = InMemoryNotificationRepository()
+    faulty_repository = FaultInjector(
+        notification_repository,
+        latency=repository_latency,
+        failure_rate=failure_rate,
+        seed=SEED,
+    )
+    faulty_bus = FaultInjector(
+        InMemoryMessageBus(max_queue_size=0),
+        latency=bus_latency,
+        failure_rate=failure_rate,
+        seed=SEED + 1,
+    )
+    worker_repository = InMemoryWorkerRepository()
+    for _ in range(WORKERS):
+        worker_repository.insert(worker=get_worker_fixture())
+
+    create_notification = CreateNotification(
+        notification_repository=faulty_repository,
+        message_bus=faulty_bus,
+        event_factory=EventFactory(),
+    )
+    worker_interface = InMemoryWorkerInterface(
+        latency=worker_latency, failure_rate=failure_rate, seed=SEED
+    )
+    process_notification = ProcessNotification(
+        worker_repository=worker_repository,
+        worker_interface=worker_interface,
+        notification_repository=notification_repository,
+    )
+
+    created = (notifications(count), notifications(count))
+    for batch in created:
+        notification_repository.insert_many(notifications=batch)
+    as_dicts = tuple(
+        [notification.as_dict() for notification in batch] for batch in created
+    )
+
+    # Failure logs would turn the run into a stderr benchmark.
+    logging.disable(logging.CRITICAL)
+    try:
+        results = measure_all(
+            create_notification=create_notification,
+            process_notification=process_notification,
+            created=created,
+            as_dicts=as_dicts,
+            count=count,
+        )
+    finally:
+        logging.disable(logging.NOTSET)
+    results["process_delivered_ratio"] = len(worker_interface.delivered) / (
+        2 * count
+    )
+    return results
+
+
+def measure_all(
+    create_notification: CreateNotification,
+    process_notification: ProcessNotification,
+    created: Tuple[List, List],
+    as_dicts: Tuple[List, List],
+    count: int,
+) -> Dict[str, float]:
+    results = {}
+    for name, function, items in (
+        ("as_dict", Notification.as_dict, created),
+        ("from_dict", Notification.from_dict, as_dicts),
+        ("event_factory", NotificationCreatedEvent.factory, created),
+        (
+            "create",
+            create_notification,
+            (notifications(count), notifications(count)),
+        ),
+        ("process", process_notification, created),
+    ):
+        results.update(measure(name, function, items))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repository-latency", type=float, default=0.0)
+    parser.add_argument("--bus-latency", type=float, default=0.0)
+    parser.add_argument("--worker-latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--notifications", type=int, default=NOTIFICATIONS)
+    args = parser.parse_args()
+    results = run(
+        repository_latency=args.repository_latency,
+        bus_latency=args.bus_latency,
+        worker_latency=args.worker_latency,
+        failure_rate=args.failure_rate,
+        count=args.notifications,
+    )
+    for name, value in results.items():
+        print(f"{name:>30}: {value:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
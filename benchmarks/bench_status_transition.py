@@ -0,0 +1,46 @@
+"""Per-notification cost of the IN_PROGRESS copy in ProcessNotification.
+
+Run with ``python -m benchmarks.bench_status_transition``.
+"""
+import timeit
+from copy import deepcopy
+from typing import Dict
+
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationStatus,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+NUMBER = 20_000
+
+
+def deepcopy_transition(notification: Notification) -> Notification:
+    notification_to_process = deepcopy(notification)
+    notification_to_process.set_in_progress()
+    return notification_to_process
+
+
+def with_status_transition(notification: Notification) -> Notification:
+    return notification.with_status(status=NotificationStatus.IN_PROGRESS)
+
+
+def run() -> Dict[str, float]:
+    notification = get_notification_fixture()
+    results = {}
+    for name, transition in (
+        ("deepcopy_us", deepcopy_transition),
+        ("with_status_us", with_status_transition),
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: transition(notification), number=NUMBER, repeat=5
+            )
+        )
+        results[name] = seconds / NUMBER * 1_000_000
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:>16}: {value:8.2f}")
@@ -0,0 +1,45 @@
+"""Latency and failure injection around any in-memory adapter."""
+import random
+import threading
+import time
+from typing import Optional
+
+
+class InjectedFault(Exception):
+    pass
+
+
+class FaultInjector:
+    # Wraps every public method of the target: each call first sleeps for
+    # latency seconds, then fails with InjectedFault at failure_rate.
+    def __init__(
+        self,
+        target,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.__target = target
+        self.__latency = latency
+        self.__failure_rate = failure_rate
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.__target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            self.__inject()
+            return attribute(*args, **kwargs)
+
+        return call
+
+    def __inject(self) -> None:
+        if self.__latency:
+            time.sleep(self.__latency)
+        with self.__lock:
+            failed = self.__random.random() < self.__failure_rate
+        if failed:
+            raise InjectedFault
@@ -0,0 +1,163 @@
+import threading
+import time
+from copy import copy
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class _Load:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.workers: List[Worker] = []
+        self.error: Optional[BaseException] = None
+        self.changes: Dict[UUID, Worker] = {}
+        self.invalidated = False
+
+
+class CachingWorkerRepository(WorkerRepositoryPort):
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__worker_repository = worker_repository
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__workers: Dict[UUID, Worker] = {}
+        self.__expires_at: Optional[float] = None
+        self.__load: Optional[_Load] = None
+        self.__lock = threading.Lock()
+
+    def get_all(self) -> List[Worker]:
+        with self.__lock:
+            if self.__is_fresh():
+                return self.__copies(self.__workers.values())
+            # Single flight: concurrent misses wait for the one load.
+            load = self.__load
+            is_loader = load is None
+            if is_loader:
+                load = self.__load = _Load()
+
+        if not is_loader:
+            load.done.wait()
+            if load.error is not None:
+                raise load.error
+            return self.__copies(load.workers)
+
+        try:
+            workers = self.__worker_repository.get_all()
+        except BaseException as error:
+            load.error = error
+            with self.__lock:
+                self.__load = None
+            load.done.set()
+            raise
+
+        with self.__lock:
+            # Writes that happened while loading are newer than the result.
+            by_id = {worker.id: copy(worker) for worker in workers}
+            by_id.update(load.changes)
+            load.workers = list(by_id.values())
+            if not load.invalidated:
+                self.__workers = by_id
+                self.__expires_at = self.__clock() + self.__ttl
+            self.__load = None
+        load.done.set()
+        return self.__copies(load.workers)
+
+    def get(self, worker_uuid: UUID) -> Worker:
+        with self.__lock:
+            if self.__is_fresh() and worker_uuid in self.__workers:
+                return copy(self.__workers[worker_uuid])
+        return self.__worker_repository.get(worker_uuid=worker_uuid)
+
+    def insert(self, worker: Worker) -> None:
+        self.__worker_repository.insert(worker=worker)
+        self.__put(worker=worker)
+
+    def update(self, worker: Worker) -> None:
+        self.__worker_repository.update(worker=worker)
+        self.__put(worker=worker)
+
+    def update_many(self, workers: List[Worker]) -> None:
+        self.__worker_repository.update_many(workers=workers)
+        for worker in workers:
+            self.__put(worker=worker)
+
+    def record_circuit_failure(
+        self, worker_uuid: UUID, failure_threshold: int
+    ) -> Worker:
+        worker = self.__worker_repository.record_circuit_failure(
+            worker_uuid=worker_uuid, failure_threshold=failure_threshold
+        )
+        self.__put(worker=worker)
+        return worker
+
+    def record_circuit_success(self, worker_uuid: UUID) -> Worker:
+        worker = self.__worker_repository.record_circuit_success(
+            worker_uuid=worker_uuid
+        )
+        self.__put(worker=worker)
+        return worker
+
+    def half_open_circuit(
+        self, worker_uuid: UUID, reset_timeout: timedelta
+    ) -> Worker:
+        worker = self.__worker_repository.half_open_circuit(
+            worker_uuid=worker_uuid, reset_timeout=reset_timeout
+        )
+        self.__put(worker=worker)
+        return worker
+
+    def record_heartbeats(
+        self, heartbeats: Dict[UUID, datetime]
+    ) -> List[Worker]:
+        workers = self.__worker_repository.record_heartbeats(
+            heartbeats=heartbeats
+        )
+        for worker in workers:
+            self.__put(worker=worker)
+        return workers
+
+    def mark_offline(
+        self, worker_uuid: UUID, last_seen_before: datetime
+    ) -> Optional[Worker]:
+        worker = self.__worker_repository.mark_offline(
+            worker_uuid=worker_uuid, last_seen_before=last_seen_before
+        )
+        if worker is not None:
+            self.__put(worker=worker)
+        return worker
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__expires_at = None
+            if self.__load is not None:
+                self.__load.invalidated = True
+
+    def __is_fresh(self) -> bool:
+        expires_at = self.__expires_at
+        return expires_at is not None and self.__clock() < expires_at
+
+    @staticmethod
+    def __copies(workers) -> List[Worker]:
+        # Callers get their own copies, as from the wrapped repository, so
+        # a cached entry only ever changes through __put.
+        return [copy(worker) for worker in workers]
+
+    def __put(self, worker: Worker) -> None:
+        # Registrations and heartbeats patch the cached entry in place
+        # instead of forcing a full reload.
+        worker = copy(worker)
+        with self.__lock:
+            if self.__load is not None:
+                self.__load.changes[worker.id] = worker
+            if self.__expires_at is not None:
+                self.__workers[worker.id] = worker
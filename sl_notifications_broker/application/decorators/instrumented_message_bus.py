@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from sl_notifications_broker.application.decorators.port_instrumentation import (
+    PortInstrumentation,
+)
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+    NoOpMetricsSink,
+)
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    Message,
+    MessageBusPort,
+)
+
+
+class InstrumentedMessageBus(MessageBusPort):
+    def __init__(
+        self,
+        message_bus: MessageBusPort,
+        metrics_sink: Optional[MetricsSinkPort] = None,
+    ) -> None:
+        self.__message_bus = message_bus
+        self.__instrumentation = PortInstrumentation(
+            metrics_sink=metrics_sink or NoOpMetricsSink(),
+            prefix="message_bus",
+        )
+
+    def publish(self, message: Message) -> None:
+        self.__instrumentation.call(
+            "publish", lambda: self.__message_bus.publish(message=message)
+        )
+
+    def publish_many(self, messages: List[Message]) -> None:
+        self.__instrumentation.call(
+            "publish_many",
+            lambda: self.__message_bus.publish_many(messages=messages),
+            batch_size=len(messages),
+        )
@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.decorators.port_instrumentation import (
+    PortInstrumentation,
+)
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+    NoOpMetricsSink,
+)
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationCursor,
+    NotificationPage,
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.ports.message_bus_port import Message
+
+
+class InstrumentedNotificationRepository(NotificationRepositoryPort):
+    def __init__(
+        self,
+        notification_repository: NotificationRepositoryPort,
+        metrics_sink: Optional[MetricsSinkPort] = None,
+    ) -> None:
+        self.__notification_repository = notification_repository
+        self.__instrumentation = PortInstrumentation(
+            metrics_sink=metrics_sink or NoOpMetricsSink(),
+            prefix="notification_repository",
+        )
+
+    def get(self, notification_id: UUID) -> Notification:
+        return self.__instrumentation.call(
+            "get",
+            lambda: self.__notification_repository.get(
+                notification_id=notification_id
+            ),
+        )
+
+    def insert(self, notification: Notification) -> None:
+        self.__instrumentation.call(
+            "insert",
+            lambda: self.__notification_repository.insert(
+                notification=notification
+            ),
+        )
+
+    def update(self, notification: Notification) -> None:
+        self.__instrumentation.call(
+            "update",
+            lambda: self.__notification_repository.update(
+                notification=notification
+            ),
+        )
+
+    def insert_with_outbox(
+        self, notification: Notification, message: Message
+    ) -> None:
+        self.__instrumentation.call(
+            "insert_with_outbox",
+            lambda: self.__notification_repository.insert_with_outbox(
+                notification=notification, message=message
+            ),
+        )
+
+    def insert_many(self, notifications: List[Notification]) -> None:
+        self.__instrumentation.call(
+            "insert_many",
+            lambda: self.__notification_repository.insert_many(
+                notifications=notifications
+            ),
+            batch_size=len(notifications),
+        )
+
+    def insert_many_with_outbox(
+        self, notifications: List[Notification], messages: List[Message]
+    ) -> None:
+        self.__instrumentation.call(
+            "insert_many_with_outbox",
+            lambda: self.__notification_repository.insert_many_with_outbox(
+                notifications=notifications, messages=messages
+            ),
+            batch_size=len(notifications),
+        )
+
+    def update_many(self, notifications: List[Notification]) -> None:
+        self.__instrumentation.call(
+            "update_many",
+            lambda: self.__notification_repository.update_many(
+                notifications=notifications
+            ),
+            batch_size=len(notifications),
+        )
+
+    def claim_pending(
+        self, limit: int, lease_seconds: float
+    ) -> List[Notification]:
+        return self.__instrumentation.call(
+            "claim_pending",
+            lambda: self.__notification_repository.claim_pending(
+                limit=limit, lease_seconds=lease_seconds
+            ),
+        )
+
+    def find_stale_in_progress(
+        self,
+        updated_before: datetime,
+        limit: int,
+        after: Optional[NotificationCursor] = None,
+    ) -> NotificationPage:
+        return self.__instrumentation.call(
+            "find_stale_in_progress",
+            lambda: self.__notification_repository.find_stale_in_progress(
+                updated_before=updated_before, limit=limit, after=after
+            ),
+        )
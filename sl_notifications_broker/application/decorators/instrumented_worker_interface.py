@@ -0,0 +1,37 @@
+from typing import Optional
+
+from sl_notifications_broker.application.decorators.port_instrumentation import (
+    PortInstrumentation,
+)
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+    NoOpMetricsSink,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerInterfacePort,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class InstrumentedWorkerInterface(WorkerInterfacePort):
+    def __init__(
+        self,
+        worker_interface: WorkerInterfacePort,
+        metrics_sink: Optional[MetricsSinkPort] = None,
+    ) -> None:
+        self.__worker_interface = worker_interface
+        self.__instrumentation = PortInstrumentation(
+            metrics_sink=metrics_sink or NoOpMetricsSink(),
+            prefix="worker_interface",
+        )
+
+    def process_notification(
+        self, worker: Worker, notification: Notification
+    ) -> None:
+        self.__instrumentation.call(
+            "process_notification",
+            lambda: self.__worker_interface.process_notification(
+                worker=worker, notification=notification
+            ),
+        )
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.decorators.port_instrumentation import (
+    PortInstrumentation,
+)
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+    NoOpMetricsSink,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class InstrumentedWorkerRepository(WorkerRepositoryPort):
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        metrics_sink: Optional[MetricsSinkPort] = None,
+    ) -> None:
+        self.__worker_repository = worker_repository
+        self.__instrumentation = PortInstrumentation(
+            metrics_sink=metrics_sink or NoOpMetricsSink(),
+            prefix="worker_repository",
+        )
+
+    def get_all(self) -> List[Worker]:
+        return self.__instrumentation.call(
+            "get_all", self.__worker_repository.get_all
+        )
+
+    def get(self, worker_uuid: UUID) -> Worker:
+        return self.__instrumentation.call(
+            "get",
+            lambda: self.__worker_repository.get(worker_uuid=worker_uuid),
+        )
+
+    def insert(self, worker: Worker) -> None:
+        self.__instrumentation.call(
+            "insert", lambda: self.__worker_repository.insert(worker=worker)
+        )
+
+    def update(self, worker: Worker) -> None:
+        self.__instrumentation.call(
+            "update", lambda: self.__worker_repository.update(worker=worker)
+        )
+
+    def update_many(self, workers: List[Worker]) -> None:
+        self.__instrumentation.call(
+            "update_many",
+            lambda: self.__worker_repository.update_many(workers=workers),
+            batch_size=len(workers),
+        )
+
+    def record_circuit_failure(
+        self, worker_uuid: UUID, failure_threshold: int
+    ) -> Worker:
+        return self.__instrumentation.call(
+            "record_circuit_failure",
+            lambda: self.__worker_repository.record_circuit_failure(
+                worker_uuid=worker_uuid, failure_threshold=failure_threshold
+            ),
+        )
+
+    def record_circuit_success(self, worker_uuid: UUID) -> Worker:
+        return self.__instrumentation.call(
+            "record_circuit_success",
+            lambda: self.__worker_repository.record_circuit_success(
+                worker_uuid=worker_uuid
+            ),
+        )
+
+    def half_open_circuit(
+        self, worker_uuid: UUID, reset_timeout: timedelta
+    ) -> Worker:
+        return self.__instrumentation.call(
+            "half_open_circuit",
+            lambda: self.__worker_repository.half_open_circuit(
+                worker_uuid=worker_uuid, reset_timeout=reset_timeout
+            ),
+        )
+
+    def record_heartbeats(
+        self, heartbeats: Dict[UUID, datetime]
+    ) -> List[Worker]:
+        return self.__instrumentation.call(
+            "record_heartbeats",
+            lambda: self.__worker_repository.record_heartbeats(
+                heartbeats=heartbeats
+            ),
+            batch_size=len(heartbeats),
+        )
+
+    def mark_offline(
+        self, worker_uuid: UUID, last_seen_before: datetime
+    ) -> Optional[Worker]:
+        return self.__instrumentation.call(
+            "mark_offline",
+            lambda: self.__worker_repository.mark_offline(
+                worker_uuid=worker_uuid, last_seen_before=last_seen_before
+            ),
+        )
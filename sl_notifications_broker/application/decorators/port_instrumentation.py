@@ -0,0 +1,44 @@
+import time
+from typing import Callable, Optional, TypeVar
+
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+)
+
+Result = TypeVar("Result")
+
+
+class PortInstrumentation:
+    # Each instrumented call records <prefix>.<method>.calls, .errors
+    # (tagged with the exception type) and .seconds, plus .batch_size for
+    # bulk methods.
+    def __init__(self, metrics_sink: MetricsSinkPort, prefix: str) -> None:
+        self.__metrics_sink = metrics_sink
+        self.__enabled = metrics_sink.enabled
+        self.__prefix = prefix
+
+    def call(
+        self,
+        method: str,
+        function: Callable[[], Result],
+        batch_size: Optional[int] = None,
+    ) -> Result:
+        if not self.__enabled:
+            return function()
+        name = f"{self.__prefix}.{method}"
+        self.__metrics_sink.increment(f"{name}.calls")
+        if batch_size is not None:
+            self.__metrics_sink.observe(f"{name}.batch_size", batch_size)
+        started_at = time.perf_counter()
+        try:
+            result = function()
+        except Exception as error:
+            self.__metrics_sink.increment(
+                f"{name}.errors", tags={"error": type(error).__name__}
+            )
+            raise
+        finally:
+            self.__metrics_sink.observe(
+                f"{name}.seconds", time.perf_counter() - started_at
+            )
+        return result
@@ -0,0 +1,79 @@
+import threading
+import time
+from typing import Callable, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    RecipientRateLimited,
+    WorkerInterfacePort,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.services.token_buckets import (
+    TokenBuckets,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class RateLimitedWorkerInterface(WorkerInterfacePort):
+    def __init__(
+        self,
+        worker_interface: WorkerInterfacePort,
+        recipient_limiter: Optional[TokenBuckets] = None,
+        worker_limiter: Optional[TokenBuckets] = None,
+        max_wait: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.__worker_interface = worker_interface
+        self.__recipient_limiter = recipient_limiter
+        self.__worker_limiter = worker_limiter
+        self.__max_wait = max_wait
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__lock = threading.Lock()
+
+    def process_notification(
+        self, worker: Worker, notification: Notification
+    ) -> None:
+        self.__acquire(
+            recipient=notification.to.second_life_uuid, worker=worker
+        )
+        self.__worker_interface.process_notification(
+            worker=worker, notification=notification
+        )
+
+    def __acquire(self, recipient: UUID, worker: Worker) -> None:
+        limits = [
+            (limiter, key, error)
+            for limiter, key, error in (
+                (self.__recipient_limiter, recipient, RecipientRateLimited),
+                (self.__worker_limiter, worker.id, WorkerRateLimited),
+            )
+            if limiter is not None
+        ]
+        # Every bucket is checked before any is consumed, so a call held
+        # back by one limit does not spend a token of the other.
+        deadline = self.__clock() + self.__max_wait
+        while True:
+            with self.__lock:
+                now = self.__clock()
+                waits = [
+                    (limiter.wait_time(key=key, now=now), error)
+                    for limiter, key, error in limits
+                ]
+                wait_time = max((wait for wait, _ in waits), default=0.0)
+                if not wait_time:
+                    for limiter, key, _ in limits:
+                        limiter.consume(key=key, now=now)
+                    return
+            if now + wait_time > deadline:
+                # The recipient's limit is listed first and wins whenever it
+                # alone is too long: then no other worker can help.
+                wait, error = next(
+                    (wait, error)
+                    for wait, error in waits
+                    if now + wait > deadline
+                )
+                raise error(retry_after=wait)
+            self.__sleep(wait_time)
@@ -0,0 +1,233 @@
+import logging
+import threading
+import time
+from copy import copy
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationCursor,
+    NotificationNotFound,
+    NotificationPage,
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.ports.message_bus_port import Message
+
+
+class WriteCoalescingNotificationRepository(NotificationRepositoryPort):
+    def __init__(
+        self,
+        notification_repository: NotificationRepositoryPort,
+        max_batch_size: int = 500,
+        max_delay: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__notification_repository = notification_repository
+        self.__max_batch_size = max_batch_size
+        self.__max_delay = max_delay
+        self.__clock = clock
+        self.__pending_inserts: Dict[UUID, Notification] = {}
+        self.__pending_updates: Dict[UUID, Notification] = {}
+        self.__first_write_at: Optional[float] = None
+        self.__buffer_lock = threading.Condition()
+        self.__flush_lock = threading.Lock()
+        self.__flusher: Optional[threading.Thread] = None
+        self.__closed = False
+        self.__logger = logging.getLogger()
+
+    @property
+    def pending_writes(self) -> int:
+        with self.__buffer_lock:
+            return len(self.__pending_inserts) + len(self.__pending_updates)
+
+    def get(self, notification_id: UUID) -> Notification:
+        # Reads see buffered writes without forcing a flush.
+        with self.__buffer_lock:
+            buffered = self.__pending_inserts.get(
+                notification_id
+            ) or self.__pending_updates.get(notification_id)
+        if buffered is not None:
+            return copy(buffered)
+        return self.__notification_repository.get(
+            notification_id=notification_id
+        )
+
+    def insert(self, notification: Notification) -> None:
+        self.insert_many(notifications=[notification])
+
+    def update(self, notification: Notification) -> None:
+        self.update_many(notifications=[notification])
+
+    def insert_with_outbox(
+        self, notification: Notification, message: Message
+    ) -> None:
+        # Outbox writes must stay atomic with the insert, so they bypass the
+        # buffer once earlier writes are flushed.
+        self.flush()
+        self.__notification_repository.insert_with_outbox(
+            notification=notification, message=message
+        )
+
+    def insert_many_with_outbox(
+        self, notifications: List[Notification], messages: List[Message]
+    ) -> None:
+        self.flush()
+        self.__notification_repository.insert_many_with_outbox(
+            notifications=notifications, messages=messages
+        )
+
+    def insert_many(self, notifications: List[Notification]) -> None:
+        with self.__buffer_lock:
+            for notification in notifications:
+                self.__pending_updates.pop(notification.id, None)
+                self.__pending_inserts[notification.id] = notification
+            should_flush = self.__after_buffering()
+        if should_flush:
+            self.flush()
+
+    def update_many(self, notifications: List[Notification]) -> None:
+        with self.__buffer_lock:
+            for notification in notifications:
+                # An update of a notification not yet inserted collapses into
+                # the insert, so the store only sees the final state.
+                if notification.id in self.__pending_inserts:
+                    self.__pending_inserts[notification.id] = notification
+                else:
+                    self.__pending_updates[notification.id] = notification
+            should_flush = self.__after_buffering()
+        if should_flush:
+            self.flush()
+
+    def claim_pending(
+        self, limit: int, lease_seconds: float
+    ) -> List[Notification]:
+        self.flush()
+        return self.__notification_repository.claim_pending(
+            limit=limit, lease_seconds=lease_seconds
+        )
+
+    def find_stale_in_progress(
+        self,
+        updated_before: datetime,
+        limit: int,
+        after: Optional[NotificationCursor] = None,
+    ) -> NotificationPage:
+        self.flush()
+        return self.__notification_repository.find_stale_in_progress(
+            updated_before=updated_before, limit=limit, after=after
+        )
+
+    def flush(self) -> None:
+        with self.__flush_lock:
+            with self.__buffer_lock:
+                inserts = list(self.__pending_inserts.values())
+                updates = list(self.__pending_updates.values())
+                self.__pending_inserts = {}
+                self.__pending_updates = {}
+                self.__first_write_at = None
+            try:
+                if inserts:
+                    self.__notification_repository.insert_many(
+                        notifications=inserts
+                    )
+                    inserts = []
+                if updates:
+                    try:
+                        self.__notification_repository.update_many(
+                            notifications=updates
+                        )
+                        updates = []
+                    except NotificationNotFound:
+                        self.__update_one_by_one(updates=updates)
+            except Exception:
+                self.__requeue(inserts=inserts, updates=updates)
+                raise
+
+    def close(self) -> None:
+        with self.__buffer_lock:
+            self.__closed = True
+            self.__buffer_lock.notify_all()
+        if self.__flusher is not None:
+            self.__flusher.join()
+        self.flush()
+
+    def __enter__(self) -> "WriteCoalescingNotificationRepository":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __after_buffering(self) -> bool:
+        pending = len(self.__pending_inserts) + len(self.__pending_updates)
+        if pending >= self.__max_batch_size:
+            return True
+        if self.__first_write_at is None:
+            self.__first_write_at = self.__clock()
+            self.__ensure_flusher()
+            self.__buffer_lock.notify_all()
+        return False
+
+    def __update_one_by_one(self, updates: List[Notification]) -> None:
+        # update_many is all or nothing, so a single unknown id fails the
+        # whole batch. Retried one by one, what the store rejects is dropped
+        # instead of being requeued, and failing, forever. Written updates
+        # leave the list, so a later error only requeues the rest.
+        while updates:
+            notification = updates[0]
+            try:
+                self.__notification_repository.update(
+                    notification=notification
+                )
+            except NotificationNotFound:
+                self.__logger.error(
+                    "Dropped buffered update of unknown notification %s.",
+                    notification,
+                )
+            del updates[0]
+
+    def __requeue(
+        self, inserts: List[Notification], updates: List[Notification]
+    ) -> None:
+        # Writes buffered while the flush was running are newer, keep them.
+        with self.__buffer_lock:
+            for notification in inserts:
+                self.__pending_inserts.setdefault(
+                    notification.id, notification
+                )
+            for notification in updates:
+                if notification.id not in self.__pending_inserts:
+                    self.__pending_updates.setdefault(
+                        notification.id, notification
+                    )
+            if self.__first_write_at is None and (inserts or updates):
+                self.__first_write_at = self.__clock()
+
+    def __ensure_flusher(self) -> None:
+        if self.__flusher is None and not self.__closed:
+            self.__flusher = threading.Thread(
+                target=self.__run_flusher,
+                name="notification-write-coalescer",
+                daemon=True,
+            )
+            self.__flusher.start()
+
+    def __run_flusher(self) -> None:
+        while True:
+            with self.__buffer_lock:
+                while not self.__closed and self.__first_write_at is None:
+                    self.__buffer_lock.wait()
+                if self.__closed:
+                    return
+                remaining = (
+                    self.__first_write_at + self.__max_delay - self.__clock()
+                )
+                if remaining > 0:
+                    self.__buffer_lock.wait(timeout=remaining)
+                    continue
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                self.__logger.exception("Failed to flush notification writes.")
+                time.sleep(self.__max_delay)
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class AsyncWorkerInterfacePort(ABC):
+    @abstractmethod
+    async def process_notification(
+        self,
+        worker: Worker,
+        notification: Notification,
+    ) -> None:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class NotificationCreationInProgress(Exception):
+    pass
+
+
+class IdempotencyIndexPort(ABC):
+    # reserve must be atomic put-if-absent: it maps key to notification_id
+    # for ttl_seconds unless the key is already mapped, and returns the id
+    # the key maps to after the call. Shared stores (e.g. SET NX EX) let
+    # every API replica see the same keys.
+    @abstractmethod
+    def reserve(
+        self, key: str, notification_id: UUID, ttl_seconds: float
+    ) -> UUID:
+        pass
+
+    @abstractmethod
+    def release(self, key: str, notification_id: UUID) -> None:
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+Tags = Optional[Dict[str, str]]
+
+
+class MetricsSinkPort(ABC):
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    @abstractmethod
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        pass
+
+    @abstractmethod
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        pass
+
+
+class NoOpMetricsSink(MetricsSinkPort):
+    # Instrumented adapters check enabled once and then skip the timing
+    # and the sink calls altogether.
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        pass
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        pass
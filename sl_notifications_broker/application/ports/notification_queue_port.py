@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from sl_notifications_broker.domain.entities.notification import Notification
+
+
+class NotificationQueuePort(ABC):
+    @abstractmethod
+    def push_many(self, notifications: List[Notification]) -> None:
+        pass
+
+    @abstractmethod
+    def pop_many(self, limit: int) -> List[Notification]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
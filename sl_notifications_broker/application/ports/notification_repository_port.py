@@ -1,9 +1,34 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
 
 from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.ports.message_bus_port import Message
+
+
+class NotificationNotFound(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class NotificationCursor:
+    updated_at: datetime
+    notification_id: UUID
+
+
+@dataclass(frozen=True)
+class NotificationPage:
+    notifications: List[Notification]
+    next_cursor: Optional[NotificationCursor]
 
 
 class NotificationRepositoryPort(ABC):
+    @abstractmethod
+    def get(self, notification_id: UUID) -> Notification:
+        pass
+
     @abstractmethod
     def insert(self, notification: Notification) -> None:
         pass
@@ -11,3 +36,39 @@ class NotificationRepositoryPort(ABC):
     @abstractmethod
     def update(self, notification: Notification) -> None:
         pass
+
+    @abstractmethod
+    def insert_with_outbox(
+        self, notification: Notification, message: Message
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def insert_many(self, notifications: List[Notification]) -> None:
+        pass
+
+    @abstractmethod
+    def insert_many_with_outbox(
+        self, notifications: List[Notification], messages: List[Message]
+    ) -> None:
+        # All or nothing, like insert_with_outbox for a single notification.
+        pass
+
+    @abstractmethod
+    def update_many(self, notifications: List[Notification]) -> None:
+        pass
+
+    @abstractmethod
+    def claim_pending(
+        self, limit: int, lease_seconds: float
+    ) -> List[Notification]:
+        pass
+
+    @abstractmethod
+    def find_stale_in_progress(
+        self,
+        updated_before: datetime,
+        limit: int,
+        after: Optional[NotificationCursor] = None,
+    ) -> NotificationPage:
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from sl_notifications_broker.domain.ports.message_bus_port import Message
+
+
+class OutboxRepositoryPort(ABC):
+    @abstractmethod
+    def get_unpublished(self, limit: int) -> List[Message]:
+        pass
+
+    @abstractmethod
+    def mark_published(self, message_ids: List[UUID]) -> None:
+        pass
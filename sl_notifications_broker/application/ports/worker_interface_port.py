@@ -8,7 +8,22 @@ class WorkerCommunicationFailure(Exception):
     pass
 
 
+class WorkerRateLimited(WorkerCommunicationFailure):
+    # Held back before reaching the worker; retry_after is the time in
+    # seconds until the limit would let the call through.
+    def __init__(self, *args, retry_after: float = 0.0) -> None:
+        super().__init__(*args)
+        self.retry_after = retry_after
+
+
+class RecipientRateLimited(WorkerRateLimited):
+    # The recipient's own limit: no other worker can deliver it sooner.
+    pass
+
+
 class WorkerInterfacePort(ABC):
+    # Adapters must send notification.idempotency_key along with the
+    # notification: hedged dispatch may deliver it to more than one worker.
     @abstractmethod
     def process_notification(
         self,
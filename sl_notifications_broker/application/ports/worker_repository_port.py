@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
 
 from sl_notifications_broker.domain.entities.worker import Worker
 
@@ -12,3 +14,55 @@ class WorkerRepositoryPort(ABC):
     @abstractmethod
     def get_all(self) -> List[Worker]:
         pass
+
+    @abstractmethod
+    def get(self, worker_uuid: UUID) -> Worker:
+        pass
+
+    @abstractmethod
+    def insert(self, worker: Worker) -> None:
+        pass
+
+    @abstractmethod
+    def update(self, worker: Worker) -> None:
+        pass
+
+    @abstractmethod
+    def update_many(self, workers: List[Worker]) -> None:
+        pass
+
+    # The circuit operations change only the circuit fields of the stored
+    # worker, atomically, and return it as stored. Status and updated_at
+    # belong to registration and heartbeats and are never overwritten.
+    @abstractmethod
+    def record_circuit_failure(
+        self, worker_uuid: UUID, failure_threshold: int
+    ) -> Worker:
+        pass
+
+    @abstractmethod
+    def record_circuit_success(self, worker_uuid: UUID) -> Worker:
+        pass
+
+    @abstractmethod
+    def half_open_circuit(
+        self, worker_uuid: UUID, reset_timeout: timedelta
+    ) -> Worker:
+        pass
+
+    # Liveness operations, atomic on the stored worker like the circuit
+    # ones, so neither overwrites what the other changed.
+    @abstractmethod
+    def record_heartbeats(
+        self, heartbeats: Dict[UUID, datetime]
+    ) -> List[Worker]:
+        # Returns the stored workers; unknown ids are left out.
+        pass
+
+    @abstractmethod
+    def mark_offline(
+        self, worker_uuid: UUID, last_seen_before: datetime
+    ) -> Optional[Worker]:
+        # Only an ONLINE worker last seen before last_seen_before goes
+        # offline; None when a newer heartbeat kept it online.
+        pass
@@ -0,0 +1,29 @@
+import hashlib
+from datetime import timedelta
+from typing import Optional, Tuple
+
+from sl_notifications_broker.domain.entities.notification import Notification
+
+
+class IdempotencyKeys:
+    def __init__(
+        self,
+        idempotency_key_ttl: timedelta = timedelta(hours=24),
+        duplicate_window: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self.__idempotency_key_ttl = idempotency_key_ttl.total_seconds()
+        self.__duplicate_window = duplicate_window.total_seconds()
+
+    def key_for(
+        self, notification: Notification, idempotency_key: Optional[str]
+    ) -> Tuple[str, float]:
+        # Index key and its ttl in seconds. Single and bulk creates share
+        # these keys, so they deduplicate against each other.
+        if idempotency_key is not None:
+            return f"key:{idempotency_key}", self.__idempotency_key_ttl
+        # Without a client key, the same body to the same recipient within
+        # duplicate_window is taken to be a retry.
+        content = hashlib.sha256()
+        content.update(notification.to.second_life_uuid.bytes)
+        content.update(notification.message.body.encode("utf-8"))
+        return f"content:{content.hexdigest()}", self.__duplicate_window
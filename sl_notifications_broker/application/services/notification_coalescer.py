@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Iterable, List
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    NotificationPriority,
+    NotificationStatus,
+)
+
+
+@dataclass(frozen=True)
+class CoalescedDelivery:
+    delivery: Notification
+    notifications: List[Notification]
+
+
+class NotificationCoalescer:
+    def __init__(
+        self,
+        window: timedelta = timedelta(seconds=5),
+        max_notifications: int = 10,
+        max_body_length: int = 1023,
+        separator: str = "\n",
+    ) -> None:
+        if max_notifications < 1:
+            raise ValueError("max_notifications must be at least 1")
+        self.__window = window
+        self.__max_notifications = max_notifications
+        self.__max_body_length = max_body_length
+        self.__separator = separator
+
+    def coalesce(
+        self, notifications: Iterable[Notification]
+    ) -> List[CoalescedDelivery]:
+        by_recipient: Dict[UUID, List[Notification]] = {}
+        for notification in notifications:
+            by_recipient.setdefault(
+                notification.to.second_life_uuid, []
+            ).append(notification)
+
+        deliveries = []
+        for pending in by_recipient.values():
+            pending.sort(key=lambda notification: notification.created_at)
+            for group in self.__group(pending):
+                deliveries.append(
+                    CoalescedDelivery(
+                        delivery=self.__merge(group), notifications=group
+                    )
+                )
+        return deliveries
+
+    def __group(
+        self, notifications: List[Notification]
+    ) -> Iterable[List[Notification]]:
+        group: List[Notification] = []
+        length = 0
+        for notification in notifications:
+            body_length = len(notification.message.body)
+            if group and (
+                len(group) == self.__max_notifications
+                or notification.created_at - group[0].created_at
+                > self.__window
+                or length + len(self.__separator) + body_length
+                > self.__max_body_length
+            ):
+                yield group
+                group, length = [], 0
+            length += body_length + (len(self.__separator) if group else 0)
+            group.append(notification)
+        if group:
+            yield group
+
+    def __merge(self, notifications: List[Notification]) -> Notification:
+        if len(notifications) == 1:
+            return notifications[0]
+        # The id, and so the idempotency key, is derived from the merged
+        # notifications: a retried or hedged group is the same delivery.
+        first = notifications[0]
+        return Notification(
+            send_to=first.to,
+            message=NotificationMessage(
+                body=self.__separator.join(
+                    notification.message.body for notification in notifications
+                )
+            ),
+            status=NotificationStatus.IN_PROGRESS,
+            notification_id=uuid5(
+                NAMESPACE_URL,
+                ",".join(
+                    notification.idempotency_key
+                    for notification in notifications
+                ),
+            ),
+            created_at=first.created_at,
+            priority=min(
+                (notification.priority for notification in notifications),
+                key=list(NotificationPriority).index,
+            ),
+        )
@@ -0,0 +1,212 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    RecipientRateLimited,
+    WorkerInterfacePort,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.services.notification_outcome_recorder import (
+    NotificationOutcomeRecorder,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.application.services.worker_attempts import (
+    WorkerAttempts,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.application.services.worker_selector import (
+    RoundRobinWorkerSelector,
+    WorkerSelector,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class NotificationDispatcher:
+    def __init__(
+        self,
+        worker_interface: WorkerInterfacePort,
+        notification_repository: NotificationRepositoryPort,
+        circuit_breaker: WorkerCircuitBreaker,
+        worker_selector: Optional[WorkerSelector] = None,
+        hedge_delay: Optional[float] = None,
+        max_parallel_calls: int = 2,
+        hedge_pool_size: int = 16,
+        retry_scheduler: Optional[RetryScheduler] = None,
+    ) -> None:
+        if max_parallel_calls < 1:
+            raise ValueError("max_parallel_calls must be at least 1")
+        self.__worker_interface = worker_interface
+        self.__circuit_breaker = circuit_breaker
+        self.__worker_selector = worker_selector or RoundRobinWorkerSelector()
+        self.__worker_attempts = WorkerAttempts(
+            circuit_breaker=circuit_breaker,
+            worker_selector=self.__worker_selector,
+        )
+        self.__outcome_recorder = NotificationOutcomeRecorder(
+            notification_repository=notification_repository,
+            retry_scheduler=retry_scheduler,
+        )
+        self.__hedge_delay = hedge_delay
+        self.__max_parallel_calls = max_parallel_calls
+        self.__hedge_executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=hedge_pool_size)
+            if hedge_delay is not None
+            else None
+        )
+
+    def dispatch(
+        self, notification: Notification, workers: List[Worker]
+    ) -> Notification:
+        self.dispatch_coalesced(
+            delivery=notification, notifications=[notification], workers=workers
+        )
+        return notification
+
+    def dispatch_coalesced(
+        self,
+        delivery: Notification,
+        notifications: List[Notification],
+        workers: List[Worker],
+    ) -> List[Notification]:
+        # delivery is what the worker receives; the outcome is recorded on
+        # each of the notifications it stands for.
+        candidates = self.__worker_selector.select(workers=workers)
+        try:
+            if self.__hedge_executor is None:
+                worker = self.__deliver(
+                    notification=delivery, candidates=candidates
+                )
+            else:
+                worker = self.__deliver_hedged(
+                    notification=delivery, candidates=candidates
+                )
+        except WorkerRateLimited as throttled:
+            for notification in notifications:
+                self.__outcome_recorder.record_deferred(
+                    notification=notification,
+                    retry_after=throttled.retry_after,
+                )
+            return notifications
+
+        for notification in notifications:
+            if worker is not None:
+                self.__outcome_recorder.record_success(
+                    notification=notification, worker=worker
+                )
+            else:
+                self.__outcome_recorder.record_failure(
+                    notification=notification
+                )
+        return notifications
+
+    def __deliver(
+        self, notification: Notification, candidates: List[Worker]
+    ) -> Optional[Worker]:
+        # A recipient limit ends the delivery at once. A worker limit only
+        # moves on to the next worker, and when nobody delivered, defers
+        # the notification rather than failing it.
+        throttled: Optional[WorkerRateLimited] = None
+        for worker in candidates:
+            if not self.__circuit_breaker.acquire(worker=worker):
+                continue
+            try:
+                if self.__attempt(worker=worker, notification=notification):
+                    return worker
+            except RecipientRateLimited:
+                raise
+            except WorkerRateLimited as error:
+                throttled = self.__worker_attempts.sooner(throttled, error)
+        if throttled is not None:
+            raise throttled
+        return None
+
+    def __deliver_hedged(
+        self, notification: Notification, candidates: List[Worker]
+    ) -> Optional[Worker]:
+        # The first call gets hedge_delay seconds to answer before the same
+        # notification is raced on the next worker. A failed call is replaced
+        # right away. Workers receive notification.idempotency_key so they
+        # can drop duplicates delivered by a losing call.
+        remaining = iter(candidates)
+        in_flight: Dict[Future, Worker] = {}
+        throttled: Optional[WorkerRateLimited] = None
+        exhausted = not self.__launch_next(
+            notification=notification, remaining=remaining, in_flight=in_flight
+        )
+        while in_flight:
+            can_hedge = (
+                not exhausted and len(in_flight) < self.__max_parallel_calls
+            )
+            done, _ = wait(
+                in_flight,
+                timeout=self.__hedge_delay if can_hedge else None,
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                exhausted = not self.__launch_next(
+                    notification=notification,
+                    remaining=remaining,
+                    in_flight=in_flight,
+                )
+                continue
+            failed = 0
+            for future in done:
+                worker = in_flight.pop(future)
+                try:
+                    if future.result():
+                        return worker
+                except RecipientRateLimited:
+                    raise
+                except WorkerRateLimited as error:
+                    throttled = self.__worker_attempts.sooner(throttled, error)
+                failed += 1
+            for _ in range(failed):
+                if exhausted:
+                    break
+                exhausted = not self.__launch_next(
+                    notification=notification,
+                    remaining=remaining,
+                    in_flight=in_flight,
+                )
+        if throttled is not None:
+            raise throttled
+        return None
+
+    def __launch_next(
+        self,
+        notification: Notification,
+        remaining: Iterator[Worker],
+        in_flight: Dict[Future, Worker],
+    ) -> bool:
+        for worker in remaining:
+            if not self.__circuit_breaker.acquire(worker=worker):
+                continue
+            future = self.__hedge_executor.submit(
+                self.__attempt, worker=worker, notification=notification
+            )
+            in_flight[future] = worker
+            return True
+        return False
+
+    def __attempt(self, worker: Worker, notification: Notification) -> bool:
+        started_at = self.__worker_attempts.start(worker=worker)
+        try:
+            self.__worker_interface.process_notification(
+                worker=worker,
+                notification=notification,
+            )
+        except BaseException as error:
+            return self.__worker_attempts.finish(
+                worker=worker, started_at=started_at, error=error
+            )
+        return self.__worker_attempts.finish(
+            worker=worker, started_at=started_at
+        )
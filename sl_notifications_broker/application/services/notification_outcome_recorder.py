@@ -0,0 +1,72 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class NotificationOutcomeRecorder:
+    def __init__(
+        self,
+        notification_repository: NotificationRepositoryPort,
+        retry_scheduler: Optional[RetryScheduler] = None,
+    ) -> None:
+        self.__notification_repository = notification_repository
+        self.__retry_scheduler = retry_scheduler
+        self.__logger = logging.getLogger()
+
+    def record_success(
+        self, notification: Notification, worker: Worker
+    ) -> None:
+        notification.set_success()
+        self.__notification_repository.update(notification=notification)
+        # Arguments are passed unformatted: the entities are only rendered
+        # when the record is actually emitted.
+        self.__logger.debug(
+            "Notification %s processed by worker %s with success.",
+            notification,
+            worker,
+        )
+
+    def record_deferred(
+        self, notification: Notification, retry_after: float
+    ) -> None:
+        # Throttled, not failed: the notification goes back to PENDING and
+        # is not due before the limit lets it through.
+        delay = timedelta(seconds=retry_after)
+        if self.__retry_scheduler is not None:
+            self.__retry_scheduler.defer(notification=notification, delay=delay)
+        else:
+            notification.defer(next_attempt_at=datetime.now() + delay)
+        self.__notification_repository.update(notification=notification)
+        self.__logger.info(
+            "Notification %s rate limited, deferred to %s.",
+            notification,
+            notification.next_attempt_at,
+        )
+
+    def record_failure(self, notification: Notification) -> None:
+        if self.__retry_scheduler is not None and (
+            self.__retry_scheduler.schedule(notification=notification)
+        ):
+            self.__notification_repository.update(notification=notification)
+            self.__logger.warning(
+                "Failed to process notification %s, retry %s at %s.",
+                notification,
+                notification.attempts,
+                notification.next_attempt_at,
+            )
+            return
+        notification.set_failed()
+        self.__notification_repository.update(notification=notification)
+        self.__logger.error(
+            "Failed to process notification %s.",
+            notification,
+        )
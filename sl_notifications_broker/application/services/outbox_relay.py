@@ -0,0 +1,44 @@
+import logging
+import threading
+from typing import Optional
+
+from sl_notifications_broker.application.use_cases.relay_outbox import (
+    RelayOutbox,
+)
+
+
+class OutboxRelay:
+    def __init__(
+        self, relay_outbox: RelayOutbox, poll_interval: float = 0.5
+    ) -> None:
+        self.__relay_outbox = relay_outbox
+        self.__poll_interval = poll_interval
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__logger = logging.getLogger()
+
+    def start(self) -> None:
+        if self.__thread is not None:
+            return
+        self.__stopped.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, name="outbox-relay", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self) -> None:
+        while not self.__stopped.is_set():
+            try:
+                published = self.__relay_outbox()
+            except Exception:  # pylint: disable=broad-except
+                self.__logger.exception("Failed to relay outbox messages.")
+                published = 0
+            # A full batch means more entries are probably waiting.
+            if published < self.__relay_outbox.batch_size:
+                self.__stopped.wait(timeout=self.__poll_interval)
@@ -0,0 +1,45 @@
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sl_notifications_broker.domain.entities.notification import Notification
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: timedelta = timedelta(seconds=1),
+        max_delay: timedelta = timedelta(minutes=5),
+        jitter: float = 0.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.__max_attempts = max_attempts
+        self.__base_delay = base_delay.total_seconds()
+        self.__max_delay = max_delay.total_seconds()
+        self.__jitter = jitter
+        self.__random = random.Random(seed)
+
+    @property
+    def max_attempts(self) -> int:
+        return self.__max_attempts
+
+    def next_attempt_at(
+        self, notification: Notification, now: datetime
+    ) -> Optional[datetime]:
+        # notification.attempts counts the retries already scheduled, so the
+        # attempt that just failed is number attempts + 1.
+        if notification.attempts + 1 >= self.__max_attempts:
+            return None
+        return now + timedelta(seconds=self.delay(notification.attempts))
+
+    def delay(self, attempts: int) -> float:
+        # Exponential backoff capped at max_delay, with up to jitter of it
+        # taken off at random so failures from one outage spread out.
+        exponent = min(attempts, 64)
+        delay = min(self.__max_delay, self.__base_delay * 2 ** exponent)
+        return delay * (1 - self.__jitter * self.__random.random())
@@ -0,0 +1,79 @@
+import heapq
+import threading
+from copy import copy
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.application.services.retry_policy import (
+    RetryPolicy,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+
+
+class RetryScheduler:
+    def __init__(
+        self,
+        retry_policy: RetryPolicy,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.__retry_policy = retry_policy
+        self.__clock = clock
+        # Delay queue: a min-heap on next_attempt_at. Rescheduling pushes a
+        # new entry and the stale one is skipped when popped.
+        self.__heap: List[Tuple[datetime, UUID]] = []
+        self.__scheduled: Dict[UUID, Notification] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__scheduled)
+
+    @property
+    def next_due_at(self) -> Optional[datetime]:
+        with self.__lock:
+            self.__drop_stale()
+            return self.__heap[0][0] if self.__heap else None
+
+    def schedule(self, notification: Notification) -> bool:
+        next_attempt_at = self.__retry_policy.next_attempt_at(
+            notification=notification, now=self.__clock()
+        )
+        if next_attempt_at is None:
+            return False
+        notification.schedule_retry(next_attempt_at=next_attempt_at)
+        self.__push(notification=notification)
+        return True
+
+    def defer(self, notification: Notification, delay: timedelta) -> None:
+        notification.defer(next_attempt_at=self.__clock() + delay)
+        self.__push(notification=notification)
+
+    def pop_due(self) -> List[Notification]:
+        now = self.__clock()
+        due = []
+        with self.__lock:
+            while self.__heap and self.__heap[0][0] <= now:
+                next_attempt_at, notification_id = heapq.heappop(self.__heap)
+                notification = self.__scheduled.get(notification_id)
+                if notification is None:
+                    continue
+                if notification.next_attempt_at != next_attempt_at:
+                    continue
+                del self.__scheduled[notification_id]
+                due.append(notification)
+        return due
+
+    def __push(self, notification: Notification) -> None:
+        with self.__lock:
+            self.__scheduled[notification.id] = copy(notification)
+            heapq.heappush(
+                self.__heap, (notification.next_attempt_at, notification.id)
+            )
+
+    def __drop_stale(self) -> None:
+        while self.__heap:
+            next_attempt_at, notification_id = self.__heap[0]
+            notification = self.__scheduled.get(notification_id)
+            if notification and notification.next_attempt_at == next_attempt_at:
+                return
+            heapq.heappop(self.__heap)
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+
+class TokenBuckets:
+    def __init__(self, rate: float, burst: float, max_keys: int = 10000):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.__rate = rate
+        self.__burst = burst
+        self.__max_keys = max_keys
+        # key -> (tokens, refilled_at), least recently used first. Not
+        # thread-safe: callers that share an instance hold their own lock.
+        self.__buckets: "OrderedDict[Hashable, Tuple[float, float]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def wait_time(self, key: Hashable, now: float) -> float:
+        tokens = self.__tokens(key=key, now=now)
+        return 0.0 if tokens >= 1 else (1 - tokens) / self.__rate
+
+    def consume(self, key: Hashable, now: float) -> None:
+        self.__buckets[key] = (self.__tokens(key=key, now=now) - 1, now)
+        self.__buckets.move_to_end(key)
+        self.__evict_full(now=now)
+
+    def __tokens(self, key: Hashable, now: float) -> float:
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            return self.__burst
+        tokens, refilled_at = bucket
+        return min(self.__burst, tokens + (now - refilled_at) * self.__rate)
+
+    def __evict_full(self, now: float) -> None:
+        # A bucket that has refilled is the same as no bucket, so idle
+        # recipients do not keep state around.
+        while len(self.__buckets) > self.__max_keys:
+            key = next(iter(self.__buckets))
+            if self.__tokens(key=key, now=now) < self.__burst:
+                return
+            del self.__buckets[key]
@@ -0,0 +1,65 @@
+import time
+from typing import Optional
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.application.services.worker_selector import (
+    WorkerSelector,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class WorkerAttempts:
+    # Bookkeeping around one call to a worker the circuit breaker let
+    # through, shared by the sync and async delivery paths. The call itself
+    # is made by the caller between start and finish.
+    def __init__(
+        self,
+        circuit_breaker: WorkerCircuitBreaker,
+        worker_selector: WorkerSelector,
+    ) -> None:
+        self.__circuit_breaker = circuit_breaker
+        self.__worker_selector = worker_selector
+
+    def start(self, worker: Worker) -> float:
+        self.__worker_selector.on_call_started(worker=worker)
+        return time.perf_counter()
+
+    def finish(
+        self,
+        worker: Worker,
+        started_at: float,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        # True when the worker delivered, False when it failed. Any other
+        # error, a rate limit included, is raised again after the breaker
+        # lets go of the worker.
+        self.__worker_selector.on_call_finished(
+            worker=worker,
+            elapsed=time.perf_counter() - started_at,
+            succeeded=error is None,
+        )
+        if error is None:
+            self.__circuit_breaker.record_success(worker=worker)
+            return True
+        if isinstance(error, WorkerCommunicationFailure) and not isinstance(
+            error, WorkerRateLimited
+        ):
+            self.__circuit_breaker.record_failure(worker=worker)
+            return False
+        # Held back before reaching the worker, or not the worker's fault.
+        self.__circuit_breaker.release(worker=worker)
+        raise error
+
+    @staticmethod
+    def sooner(
+        throttled: Optional[WorkerRateLimited], error: WorkerRateLimited
+    ) -> WorkerRateLimited:
+        if throttled is None or error.retry_after < throttled.retry_after:
+            return error
+        return throttled
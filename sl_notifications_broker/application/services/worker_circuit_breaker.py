@@ -0,0 +1,85 @@
+import threading
+from datetime import timedelta
+from typing import Set
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.worker import (
+    CircuitState,
+    Worker,
+)
+
+
+class WorkerCircuitBreaker:
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        failure_threshold: int = 3,
+        reset_timeout: timedelta = timedelta(seconds=30),
+    ) -> None:
+        self.__worker_repository = worker_repository
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout
+        self.__probing: Set[UUID] = set()
+        self.__lock = threading.Lock()
+
+    def acquire(self, worker: Worker) -> bool:
+        with self.__lock:
+            transitioned = worker.try_half_open(
+                reset_timeout=self.__reset_timeout
+            )
+        if transitioned:
+            # Another process may have reopened or closed it meanwhile.
+            self.__sync(
+                worker=worker,
+                stored=self.__worker_repository.half_open_circuit(
+                    worker_uuid=worker.id, reset_timeout=self.__reset_timeout
+                ),
+            )
+        with self.__lock:
+            state = worker.circuit_state
+            if state == CircuitState.HALF_OPEN:
+                # Only one trial call per half-open worker at a time.
+                if worker.id in self.__probing:
+                    return False
+                self.__probing.add(worker.id)
+        return state != CircuitState.OPEN
+
+    def release(self, worker: Worker) -> None:
+        with self.__lock:
+            self.__probing.discard(worker.id)
+
+    def record_success(self, worker: Worker) -> None:
+        with self.__lock:
+            self.__probing.discard(worker.id)
+            if (
+                worker.circuit_state == CircuitState.CLOSED
+                and not worker.failure_count
+            ):
+                return
+        self.__sync(
+            worker=worker,
+            stored=self.__worker_repository.record_circuit_success(
+                worker_uuid=worker.id
+            ),
+        )
+
+    def record_failure(self, worker: Worker) -> None:
+        with self.__lock:
+            self.__probing.discard(worker.id)
+        # The increment happens on the stored worker, so failures seen by
+        # other processes add up instead of overwriting each other.
+        self.__sync(
+            worker=worker,
+            stored=self.__worker_repository.record_circuit_failure(
+                worker_uuid=worker.id,
+                failure_threshold=self.__failure_threshold,
+            ),
+        )
+
+    def __sync(self, worker: Worker, stored: Worker) -> None:
+        # Only the circuit is taken over; this copy may hold an older status.
+        with self.__lock:
+            worker.copy_circuit_from(stored)
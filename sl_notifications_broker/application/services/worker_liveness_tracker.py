@@ -0,0 +1,60 @@
+import heapq
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from uuid import UUID
+
+
+class WorkerLivenessTracker:
+    def __init__(
+        self, timeout: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.__timeout = timeout
+        self.__clock = clock
+        # Expiry heap with lazy deletion: a heartbeat pushes a new deadline
+        # and older entries for the same worker are skipped when popped.
+        self.__heap: List[Tuple[float, UUID]] = []
+        self.__deadlines: Dict[UUID, float] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__deadlines)
+
+    @property
+    def timeout(self) -> float:
+        return self.__timeout
+
+    def track(self, worker_uuid: UUID, age: float = 0.0) -> None:
+        # age is how many seconds ago the worker was last seen, e.g. from a
+        # heartbeat persisted by another process. An older sighting never
+        # shortens a deadline set by a newer one.
+        deadline = self.__clock() + self.__timeout - age
+        with self.__lock:
+            if deadline <= self.__deadlines.get(worker_uuid, float("-inf")):
+                return
+            self.__deadlines[worker_uuid] = deadline
+            heapq.heappush(self.__heap, (deadline, worker_uuid))
+            if len(self.__heap) > 4 * len(self.__deadlines) + 64:
+                self.__compact()
+
+    def forget(self, worker_uuid: UUID) -> None:
+        with self.__lock:
+            self.__deadlines.pop(worker_uuid, None)
+
+    def pop_expired(self) -> List[UUID]:
+        now = self.__clock()
+        expired = []
+        with self.__lock:
+            while self.__heap and self.__heap[0][0] <= now:
+                deadline, worker_uuid = heapq.heappop(self.__heap)
+                if self.__deadlines.get(worker_uuid) == deadline:
+                    del self.__deadlines[worker_uuid]
+                    expired.append(worker_uuid)
+        return expired
+
+    def __compact(self) -> None:
+        self.__heap = [
+            (deadline, worker_uuid)
+            for worker_uuid, deadline in self.__deadlines.items()
+        ]
+        heapq.heapify(self.__heap)
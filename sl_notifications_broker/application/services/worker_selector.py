@@ -0,0 +1,104 @@
+import itertools
+import random
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class WorkerSelector(ABC):
+    def select(self, workers: List[Worker]) -> List[Worker]:
+        return self._order([worker for worker in workers if worker.is_online])
+
+    @abstractmethod
+    def _order(self, workers: List[Worker]) -> List[Worker]:
+        pass
+
+    def on_call_started(self, worker: Worker) -> None:
+        pass
+
+    def on_call_finished(
+        self, worker: Worker, elapsed: float, succeeded: bool
+    ) -> None:
+        pass
+
+
+class RoundRobinWorkerSelector(WorkerSelector):
+    def __init__(self) -> None:
+        self.__counter = itertools.count()
+
+    def _order(self, workers: List[Worker]) -> List[Worker]:
+        if not workers:
+            return workers
+        start = next(self.__counter) % len(workers)
+        return workers[start:] + workers[:start]
+
+
+class LeastInFlightWorkerSelector(WorkerSelector):
+    def __init__(self) -> None:
+        self.__in_flight: Dict[UUID, int] = {}
+        self.__lock = threading.Lock()
+
+    def in_flight(self, worker: Worker) -> int:
+        return self.__in_flight.get(worker.id, 0)
+
+    def _order(self, workers: List[Worker]) -> List[Worker]:
+        with self.__lock:
+            return sorted(workers, key=self.in_flight)
+
+    def on_call_started(self, worker: Worker) -> None:
+        with self.__lock:
+            self.__in_flight[worker.id] = self.in_flight(worker) + 1
+
+    def on_call_finished(
+        self, worker: Worker, elapsed: float, succeeded: bool
+    ) -> None:
+        with self.__lock:
+            in_flight = self.in_flight(worker) - 1
+            if in_flight > 0:
+                self.__in_flight[worker.id] = in_flight
+            else:
+                self.__in_flight.pop(worker.id, None)
+
+
+class LatencyWeightedWorkerSelector(WorkerSelector):
+    def __init__(
+        self, alpha: float = 0.2, seed: Optional[int] = None
+    ) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.__alpha = alpha
+        self.__latencies: Dict[UUID, float] = {}
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    def latency(self, worker: Worker) -> Optional[float]:
+        return self.__latencies.get(worker.id)
+
+    def _order(self, workers: List[Worker]) -> List[Worker]:
+        # Workers without observations go first so they get measured. The
+        # rest are sampled without replacement with weight 1 / EWMA, which
+        # favours fast workers without sending them all the traffic.
+        with self.__lock:
+            unmeasured = [w for w in workers if self.latency(w) is None]
+            measured = [
+                (self.__random.random() ** self.latency(w), w)
+                for w in workers
+                if self.latency(w) is not None
+            ]
+        measured.sort(key=lambda item: item[0], reverse=True)
+        return unmeasured + [worker for _, worker in measured]
+
+    def on_call_finished(
+        self, worker: Worker, elapsed: float, succeeded: bool
+    ) -> None:
+        with self.__lock:
+            previous = self.__latencies.get(worker.id)
+            if previous is None:
+                self.__latencies[worker.id] = elapsed
+            else:
+                self.__latencies[worker.id] = previous + self.__alpha * (
+                    elapsed - previous
+                )
@@ -0,0 +1,212 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable, List, Optional, TypeVar
+
+from sl_notifications_broker.application.ports.async_worker_interface_port import (
+    AsyncWorkerInterfacePort,
+)
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    RecipientRateLimited,
+    WorkerCommunicationFailure,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.notification_outcome_recorder import (
+    NotificationOutcomeRecorder,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.application.services.worker_attempts import (
+    WorkerAttempts,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.application.services.worker_selector import (
+    RoundRobinWorkerSelector,
+    WorkerSelector,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationInvalidStatus,
+    NotificationStatus,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+T = TypeVar("T")
+
+
+class AsyncProcessNotification:
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        worker_interface: AsyncWorkerInterfacePort,
+        notification_repository: NotificationRepositoryPort,
+        call_timeout: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        worker_selector: Optional[WorkerSelector] = None,
+        circuit_breaker: Optional[WorkerCircuitBreaker] = None,
+        retry_scheduler: Optional[RetryScheduler] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.__worker_repository = worker_repository
+        self.__worker_interface = worker_interface
+        self.__notification_repository = notification_repository
+        self.__outcome_recorder = NotificationOutcomeRecorder(
+            notification_repository=notification_repository,
+            retry_scheduler=retry_scheduler,
+        )
+        self.__worker_selector = worker_selector or RoundRobinWorkerSelector()
+        self.__circuit_breaker = circuit_breaker or WorkerCircuitBreaker(
+            worker_repository=worker_repository
+        )
+        self.__worker_attempts = WorkerAttempts(
+            circuit_breaker=self.__circuit_breaker,
+            worker_selector=self.__worker_selector,
+        )
+        # Repository calls, the circuit breaker's included, block. They run
+        # on this executor, or the loop's default one, never on the loop.
+        self.__executor = executor
+        self.__call_timeout = call_timeout
+        self.__max_in_flight = max_in_flight
+        self.__in_flight: Optional[asyncio.Semaphore] = None
+
+    async def __call__(self, notification: Notification) -> Notification:
+        self.__assert_notification_is_pending(notification=notification)
+        return await self.__process_notification(notification=notification)
+
+    @staticmethod
+    def __assert_notification_is_pending(notification: Notification) -> None:
+        if not notification.is_pending:
+            raise NotificationInvalidStatus
+
+    def __update_notification(self, notification: Notification) -> None:
+        self.__notification_repository.update(notification=notification)
+
+    def __get_all_workers(self) -> List[Worker]:
+        workers = self.__worker_repository.get_all()
+        if not workers:
+            raise WorkerNotFound
+        return workers
+
+    def __get_in_flight_semaphore(self) -> Optional[asyncio.Semaphore]:
+        # Created lazily so the semaphore binds to the running event loop.
+        if self.__max_in_flight is not None and self.__in_flight is None:
+            self.__in_flight = asyncio.Semaphore(self.__max_in_flight)
+        return self.__in_flight
+
+    async def __call_worker(
+        self, worker: Worker, notification: Notification
+    ) -> None:
+        call = self.__worker_interface.process_notification(
+            worker=worker, notification=notification
+        )
+        try:
+            await asyncio.wait_for(call, timeout=self.__call_timeout)
+        except asyncio.TimeoutError as error:
+            raise WorkerCommunicationFailure from error
+
+    async def __try_worker(
+        self, worker: Worker, notification: Notification
+    ) -> bool:
+        if not await self.__run_blocking(
+            self.__circuit_breaker.acquire, worker=worker
+        ):
+            return False
+        in_flight = self.__get_in_flight_semaphore()
+        if in_flight is None:
+            return await self.__attempt(
+                worker=worker, notification=notification
+            )
+        async with in_flight:
+            return await self.__attempt(
+                worker=worker, notification=notification
+            )
+
+    async def __attempt(
+        self, worker: Worker, notification: Notification
+    ) -> bool:
+        started_at = self.__worker_attempts.start(worker=worker)
+        try:
+            await self.__call_worker(worker=worker, notification=notification)
+        except BaseException as error:
+            return await self.__run_blocking(
+                self.__worker_attempts.finish,
+                worker=worker,
+                started_at=started_at,
+                error=error,
+            )
+        return await self.__run_blocking(
+            self.__worker_attempts.finish, worker=worker, started_at=started_at
+        )
+
+    async def __deliver(
+        self, notification: Notification, workers: List[Worker]
+    ) -> Optional[Worker]:
+        # Same rules as NotificationDispatcher: a recipient limit ends the
+        # delivery, a worker limit moves on and defers if nobody delivered.
+        throttled: Optional[WorkerRateLimited] = None
+        for worker in self.__worker_selector.select(workers=workers):
+            try:
+                if await self.__try_worker(
+                    worker=worker, notification=notification
+                ):
+                    return worker
+            except RecipientRateLimited:
+                raise
+            except WorkerRateLimited as error:
+                throttled = self.__worker_attempts.sooner(throttled, error)
+        if throttled is not None:
+            raise throttled
+        return None
+
+    async def __process_notification(
+        self, notification: Notification
+    ) -> Notification:
+        notification_to_process = notification.with_status(
+            status=NotificationStatus.IN_PROGRESS
+        )
+        await self.__run_blocking(
+            self.__update_notification, notification=notification_to_process
+        )
+        workers = await self.__run_blocking(self.__get_all_workers)
+
+        # A cancelled call leaves the notification IN_PROGRESS: the worker
+        # may or may not have delivered it, so no outcome is recorded.
+        try:
+            worker = await self.__deliver(
+                notification=notification_to_process, workers=workers
+            )
+        except WorkerRateLimited as throttled:
+            await self.__run_blocking(
+                self.__outcome_recorder.record_deferred,
+                notification=notification_to_process,
+                retry_after=throttled.retry_after,
+            )
+            return notification_to_process
+
+        if worker is not None:
+            await self.__run_blocking(
+                self.__outcome_recorder.record_success,
+                notification=notification_to_process,
+                worker=worker,
+            )
+        else:
+            await self.__run_blocking(
+                self.__outcome_recorder.record_failure,
+                notification=notification_to_process,
+            )
+        return notification_to_process
+
+    async def __run_blocking(self, function: Callable[..., T], **kwargs) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, partial(function, **kwargs)
+        )
@@ -1,10 +1,25 @@
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID
+
 from sl_notifications_broker.domain.factories.event_factory import EventFactory
 from sl_notifications_broker.domain.ports.message_bus_port import (
     MessageBusPort,
 )
+from sl_notifications_broker.application.ports.idempotency_index_port import (
+    IdempotencyIndexPort,
+    NotificationCreationInProgress,
+)
+from sl_notifications_broker.application.ports.notification_queue_port import (
+    NotificationQueuePort,
+)
 from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationNotFound,
     NotificationRepositoryPort,
 )
+from sl_notifications_broker.application.services.idempotency_keys import (
+    IdempotencyKeys,
+)
 from sl_notifications_broker.domain.entities.notification import Notification
 
 
@@ -14,15 +29,86 @@ class CreateNotification:
         notification_repository: NotificationRepositoryPort,
         message_bus: MessageBusPort,
         event_factory: EventFactory,
+        use_outbox: bool = False,
+        notification_queue: Optional[NotificationQueuePort] = None,
+        idempotency_index: Optional[IdempotencyIndexPort] = None,
+        idempotency_key_ttl: timedelta = timedelta(hours=24),
+        duplicate_window: timedelta = timedelta(minutes=1),
     ):
         self.__notification_repository = notification_repository
         self.__message_bus = message_bus
         self.__event_factory = event_factory
+        self.__use_outbox = use_outbox
+        self.__notification_queue = notification_queue
+        self.__idempotency_index = idempotency_index
+        self.__idempotency_keys = IdempotencyKeys(
+            idempotency_key_ttl=idempotency_key_ttl,
+            duplicate_window=duplicate_window,
+        )
 
-    def __call__(self, notification: Notification) -> None:
-        self.__notification_repository.insert(notification=notification)
+    def __call__(
+        self,
+        notification: Notification,
+        idempotency_key: Optional[str] = None,
+    ) -> Notification:
+        if self.__idempotency_index is None:
+            self.__store(notification=notification)
+            self.__announce(notification=notification)
+            return notification
 
+        key, ttl_seconds = self.__idempotency_keys.key_for(
+            notification=notification, idempotency_key=idempotency_key
+        )
+        notification_id = self.__idempotency_index.reserve(
+            key=key, notification_id=notification.id, ttl_seconds=ttl_seconds
+        )
+        if notification_id != notification.id:
+            return self.__get_existing(notification_id=notification_id)
+
+        try:
+            self.__store(notification=notification)
+        except BaseException:
+            # Nothing was stored, so the client's retry must not be blocked.
+            # Once stored, the key stays: a retry after a failed publish
+            # gets the stored notification instead of a second copy.
+            self.__idempotency_index.release(
+                key=key, notification_id=notification.id
+            )
+            raise
+        self.__announce(notification=notification)
+        return notification
+
+    def __get_existing(self, notification_id: UUID) -> Notification:
+        try:
+            return self.__notification_repository.get(
+                notification_id=notification_id
+            )
+        except NotificationNotFound as error:
+            # Reserved by a create that has not been stored yet.
+            raise NotificationCreationInProgress from error
+
+    def __store(self, notification: Notification) -> None:
+        if self.__use_outbox:
+            self.__insert_with_outbox(notification=notification)
+        else:
+            self.__notification_repository.insert(notification=notification)
+
+    def __announce(self, notification: Notification) -> None:
+        if not self.__use_outbox:
+            event = self.__event_factory.notification_created_factory(
+                notification=notification
+            )
+            self.__message_bus.publish(message=event)
+
+        if self.__notification_queue is not None:
+            self.__notification_queue.push_many(notifications=[notification])
+
+    def __insert_with_outbox(self, notification: Notification) -> None:
+        # The event is stored with the notification and published later by
+        # RelayOutbox, so a crash can no longer lose it between both steps.
         event = self.__event_factory.notification_created_factory(
             notification=notification
         )
-        self.__message_bus.publish(message=event)
+        self.__notification_repository.insert_with_outbox(
+            notification=notification, message=event
+        )
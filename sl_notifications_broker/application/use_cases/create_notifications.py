@@ -0,0 +1,315 @@
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.idempotency_index_port import (
+    IdempotencyIndexPort,
+    NotificationCreationInProgress,
+)
+from sl_notifications_broker.application.ports.notification_queue_port import (
+    NotificationQueuePort,
+)
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationNotFound,
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.services.idempotency_keys import (
+    IdempotencyKeys,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    NotificationPriority,
+    SecondLifeUser,
+    as_uuid,
+)
+from sl_notifications_broker.domain.factories.event_factory import EventFactory
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    Message,
+    MessageBusPort,
+)
+
+T = TypeVar("T")
+
+
+class InvalidNotificationSpec(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class NotificationSpec:
+    second_life_uuid: Union[UUID, str]
+    second_life_username: str
+    message: str
+    priority: Optional[Union[NotificationPriority, str]] = None
+    idempotency_key: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CreateNotificationResult:
+    index: int
+    # Set whenever the notification is stored. An error next to it means
+    # only announcing it failed; a retry then gets it back as a duplicate.
+    notification: Optional[Notification] = None
+    error: Optional[Exception] = None
+    duplicate: bool = False
+
+    @property
+    def is_created(self) -> bool:
+        return self.notification is not None and not self.duplicate
+
+
+class _Chunk:
+    def __init__(self) -> None:
+        # Results in input order; pending items still have no outcome.
+        self.results: List[Optional[CreateNotificationResult]] = []
+        self.pending: Dict[int, Tuple[int, Notification, Optional[str]]] = {}
+        self.reserved: Dict[UUID, Notification] = {}
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+class CreateNotifications:
+    def __init__(
+        self,
+        notification_repository: NotificationRepositoryPort,
+        message_bus: MessageBusPort,
+        event_factory: EventFactory,
+        chunk_size: int = 500,
+        use_outbox: bool = False,
+        notification_queue: Optional[NotificationQueuePort] = None,
+        idempotency_index: Optional[IdempotencyIndexPort] = None,
+        idempotency_key_ttl: timedelta = timedelta(hours=24),
+        duplicate_window: timedelta = timedelta(minutes=1),
+        max_body_length: int = 1023,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.__notification_repository = notification_repository
+        self.__message_bus = message_bus
+        self.__event_factory = event_factory
+        self.__chunk_size = chunk_size
+        self.__use_outbox = use_outbox
+        self.__notification_queue = notification_queue
+        self.__idempotency_index = idempotency_index
+        self.__idempotency_keys = IdempotencyKeys(
+            idempotency_key_ttl=idempotency_key_ttl,
+            duplicate_window=duplicate_window,
+        )
+        self.__max_body_length = max_body_length
+        self.__executor = executor
+
+    def __call__(
+        self, specs: Iterable[NotificationSpec]
+    ) -> Iterator[CreateNotificationResult]:
+        # Lazy on both ends: the input is only pulled as results are
+        # consumed, and at most one chunk is held at a time.
+        chunk = _Chunk()
+        try:
+            for index, spec in enumerate(specs):
+                self.__add(chunk=chunk, index=index, spec=spec)
+                if len(chunk) >= self.__chunk_size:
+                    flushing, chunk = chunk, _Chunk()
+                    yield from self.__flush(chunk=flushing)
+            flushing, chunk = chunk, _Chunk()
+            yield from self.__flush(chunk=flushing)
+        finally:
+            # The input or a reservation failed, or the caller stopped
+            # early: keys of a chunk that was never written are released.
+            self.__release(chunk=chunk)
+
+    async def stream(
+        self, specs: AsyncIterable[NotificationSpec]
+    ) -> AsyncIterator[CreateNotificationResult]:
+        # The index and repository calls block, so they run on the
+        # executor, or the loop's default one, never on the loop.
+        chunk = _Chunk()
+        index = 0
+        try:
+            async for spec in specs:
+                await self.__run_blocking(
+                    self.__add, chunk=chunk, index=index, spec=spec
+                )
+                index += 1
+                if len(chunk) >= self.__chunk_size:
+                    flushing, chunk = chunk, _Chunk()
+                    for result in await self.__run_blocking(
+                        self.__flush_all, chunk=flushing
+                    ):
+                        yield result
+            flushing, chunk = chunk, _Chunk()
+            for result in await self.__run_blocking(
+                self.__flush_all, chunk=flushing
+            ):
+                yield result
+        finally:
+            await self.__run_blocking(self.__release, chunk=chunk)
+
+    def __add(self, chunk: _Chunk, index: int, spec: NotificationSpec) -> None:
+        try:
+            notification = self.__build(spec=spec)
+        except InvalidNotificationSpec as error:
+            chunk.results.append(
+                CreateNotificationResult(index=index, error=error)
+            )
+            return
+
+        position = len(chunk.results)
+        chunk.results.append(None)
+        if self.__idempotency_index is None:
+            chunk.pending[position] = (index, notification, None)
+            return
+
+        key, ttl_seconds = self.__idempotency_keys.key_for(
+            notification=notification, idempotency_key=spec.idempotency_key
+        )
+        notification_id = self.__idempotency_index.reserve(
+            key=key, notification_id=notification.id, ttl_seconds=ttl_seconds
+        )
+        if notification_id == notification.id:
+            chunk.pending[position] = (index, notification, key)
+            chunk.reserved[notification.id] = notification
+        else:
+            chunk.results[position] = self.__duplicate_of(
+                chunk=chunk, index=index, notification_id=notification_id
+            )
+
+    def __build(self, spec: NotificationSpec) -> Notification:
+        if not spec.second_life_username:
+            raise InvalidNotificationSpec("second_life_username is empty")
+        if not spec.message:
+            raise InvalidNotificationSpec("message is empty")
+        if len(spec.message) > self.__max_body_length:
+            raise InvalidNotificationSpec(
+                f"message is longer than {self.__max_body_length} characters"
+            )
+        try:
+            second_life_uuid = as_uuid(spec.second_life_uuid)
+            priority = (
+                NotificationPriority(spec.priority)
+                if spec.priority is not None
+                else None
+            )
+        except (TypeError, ValueError, AttributeError) as error:
+            raise InvalidNotificationSpec(str(error)) from error
+        return Notification(
+            send_to=SecondLifeUser(
+                second_life_username=spec.second_life_username,
+                second_life_uuid=second_life_uuid,
+            ),
+            message=NotificationMessage(body=spec.message),
+            priority=priority,
+        )
+
+    def __duplicate_of(
+        self, chunk: _Chunk, index: int, notification_id: UUID
+    ) -> CreateNotificationResult:
+        existing = chunk.reserved.get(notification_id)
+        if existing is not None:
+            return CreateNotificationResult(
+                index=index, notification=existing, duplicate=True
+            )
+        try:
+            existing = self.__notification_repository.get(
+                notification_id=notification_id
+            )
+        except NotificationNotFound:
+            # Reserved by a create that has not been stored yet.
+            return CreateNotificationResult(
+                index=index, error=NotificationCreationInProgress()
+            )
+        return CreateNotificationResult(
+            index=index, notification=existing, duplicate=True
+        )
+
+    def __flush(self, chunk: _Chunk) -> Iterator[CreateNotificationResult]:
+        notifications = [
+            notification for _, notification, _ in chunk.pending.values()
+        ]
+        store_error = announce_error = None
+        if notifications:
+            try:
+                events = self.__event_factory.notification_created_many(
+                    notifications=notifications
+                )
+                self.__store(notifications=notifications, events=events)
+            except Exception as error:
+                # The chunk is stored all or nothing, so none of it is and
+                # the clients' retries must not be blocked.
+                store_error = error
+                self.__release(chunk=chunk)
+            else:
+                try:
+                    self.__announce(notifications=notifications, events=events)
+                except Exception as error:
+                    announce_error = error
+
+        for position, result in enumerate(chunk.results):
+            if result is None:
+                index, notification, _ = chunk.pending[position]
+                result = CreateNotificationResult(
+                    index=index,
+                    notification=None if store_error else notification,
+                    error=store_error or announce_error,
+                )
+            elif store_error and result.duplicate:
+                # A duplicate of an item in this chunk shares its failure.
+                if result.notification.id in chunk.reserved:
+                    result = CreateNotificationResult(
+                        index=result.index, error=store_error
+                    )
+            yield result
+
+    def __flush_all(self, chunk: _Chunk) -> List[CreateNotificationResult]:
+        return list(self.__flush(chunk=chunk))
+
+    def __store(
+        self, notifications: List[Notification], events: List[Message]
+    ) -> None:
+        if self.__use_outbox:
+            self.__notification_repository.insert_many_with_outbox(
+                notifications=notifications, messages=events
+            )
+        else:
+            self.__notification_repository.insert_many(
+                notifications=notifications
+            )
+
+    def __announce(
+        self, notifications: List[Notification], events: List[Message]
+    ) -> None:
+        if not self.__use_outbox:
+            self.__message_bus.publish_many(messages=events)
+
+        if self.__notification_queue is not None:
+            self.__notification_queue.push_many(notifications=notifications)
+
+    def __release(self, chunk: _Chunk) -> None:
+        for _, notification, key in chunk.pending.values():
+            if key is not None:
+                self.__idempotency_index.release(
+                    key=key, notification_id=notification.id
+                )
+
+    async def __run_blocking(self, function: Callable[..., T], **kwargs) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, partial(function, **kwargs)
+        )
@@ -0,0 +1,33 @@
+from typing import List
+
+from sl_notifications_broker.application.ports.notification_queue_port import (
+    NotificationQueuePort,
+)
+from sl_notifications_broker.application.use_cases.process_notification_batch import (
+    ProcessNotificationBatch,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+
+
+class DispatchNextNotifications:
+    def __init__(
+        self,
+        notification_queue: NotificationQueuePort,
+        process_notification_batch: ProcessNotificationBatch,
+        batch_size: int = 50,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.__notification_queue = notification_queue
+        self.__process_notification_batch = process_notification_batch
+        self.__batch_size = batch_size
+
+    def __call__(self) -> List[Notification]:
+        # The queue decides which pending notifications go next; the batch
+        # use case only ever sees what the scheduler picked.
+        notifications = self.__notification_queue.pop_many(
+            limit=self.__batch_size
+        )
+        if not notifications:
+            return []
+        return self.__process_notification_batch(notifications=notifications)
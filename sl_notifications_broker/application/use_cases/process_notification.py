@@ -1,21 +1,31 @@
-import logging
-from copy import deepcopy
-from typing import List
+from typing import List, Optional
 
 from sl_notifications_broker.application.ports.notification_repository_port import (
     NotificationRepositoryPort,
 )
 from sl_notifications_broker.application.ports.worker_interface_port import (
-    WorkerCommunicationFailure,
     WorkerInterfacePort,
 )
 from sl_notifications_broker.application.ports.worker_repository_port import (
     WorkerNotFound,
     WorkerRepositoryPort,
 )
+from sl_notifications_broker.application.services.notification_dispatcher import (
+    NotificationDispatcher,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.application.services.worker_selector import (
+    WorkerSelector,
+)
 from sl_notifications_broker.domain.entities.notification import (
     Notification,
     NotificationInvalidStatus,
+    NotificationStatus,
 )
 from sl_notifications_broker.domain.entities.worker import Worker
 
@@ -26,11 +36,22 @@ class ProcessNotification:
         worker_repository: WorkerRepositoryPort,
         worker_interface: WorkerInterfacePort,
         notification_repository: NotificationRepositoryPort,
+        worker_selector: Optional[WorkerSelector] = None,
+        circuit_breaker: Optional[WorkerCircuitBreaker] = None,
+        hedge_delay: Optional[float] = None,
+        retry_scheduler: Optional[RetryScheduler] = None,
     ) -> None:
         self.__worker_repository = worker_repository
-        self.__worker_interface = worker_interface
         self.__notification_repository = notification_repository
-        self.__logger = logging.getLogger()
+        self.__dispatcher = NotificationDispatcher(
+            worker_interface=worker_interface,
+            notification_repository=notification_repository,
+            circuit_breaker=circuit_breaker
+            or WorkerCircuitBreaker(worker_repository=worker_repository),
+            worker_selector=worker_selector,
+            hedge_delay=hedge_delay,
+            retry_scheduler=retry_scheduler,
+        )
 
     def __call__(self, notification: Notification) -> None:
         self.__assert_notification_is_pending(notification=notification)
@@ -54,34 +75,12 @@ class ProcessNotification:
     def __process_notification(
         self, notification: Notification
     ) -> Notification:
-        notification_to_process = deepcopy(notification)
-        notification_to_process.set_in_progress()
+        notification_to_process = notification.with_status(
+            status=NotificationStatus.IN_PROGRESS
+        )
         self.__update_notification(notification=notification_to_process)
 
         workers = self.__get_all_workers()
-        for worker in workers:
-            try:
-                self.__worker_interface.process_notification(
-                    worker=worker,
-                    notification=notification_to_process,
-                )
-                notification_to_process.set_success()
-                self.__notification_repository.update(
-                    notification=notification_to_process
-                )
-                self.__logger.debug(
-                    "Notification %s processed by worker %s with success.",
-                    str(notification_to_process),
-                    str(worker),
-                )
-                break
-            except WorkerCommunicationFailure:
-                pass
-
-        if notification_to_process.is_in_progress:
-            notification_to_process.set_failed()
-            self.__update_notification(notification=notification_to_process)
-            self.__logger.error(
-                "Failed to process notification %s.",
-                str(notification_to_process),
-            )
+        return self.__dispatcher.dispatch(
+            notification=notification_to_process, workers=workers
+        )
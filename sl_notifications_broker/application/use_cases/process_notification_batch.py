@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerInterfacePort,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.notification_coalescer import (
+    CoalescedDelivery,
+    NotificationCoalescer,
+)
+from sl_notifications_broker.application.services.notification_dispatcher import (
+    NotificationDispatcher,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.application.services.worker_selector import (
+    WorkerSelector,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationInvalidStatus,
+    NotificationStatus,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class ProcessNotificationBatch:
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        worker_interface: WorkerInterfacePort,
+        notification_repository: NotificationRepositoryPort,
+        worker_selector: Optional[WorkerSelector] = None,
+        circuit_breaker: Optional[WorkerCircuitBreaker] = None,
+        hedge_delay: Optional[float] = None,
+        retry_scheduler: Optional[RetryScheduler] = None,
+        max_concurrency: int = 8,
+        coalescer: Optional[NotificationCoalescer] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.__worker_repository = worker_repository
+        self.__notification_repository = notification_repository
+        self.__max_concurrency = max_concurrency
+        self.__coalescer = coalescer
+        self.__dispatcher = NotificationDispatcher(
+            worker_interface=worker_interface,
+            notification_repository=notification_repository,
+            circuit_breaker=circuit_breaker
+            or WorkerCircuitBreaker(worker_repository=worker_repository),
+            worker_selector=worker_selector,
+            hedge_delay=hedge_delay,
+            retry_scheduler=retry_scheduler,
+        )
+
+    def __call__(
+        self, notifications: Iterable[Notification]
+    ) -> List[Notification]:
+        notifications = list(notifications)
+        self.__assert_notifications_are_pending(notifications=notifications)
+        if not notifications:
+            return []
+        return self.__process_notifications(notifications=notifications)
+
+    @staticmethod
+    def __assert_notifications_are_pending(
+        notifications: List[Notification],
+    ) -> None:
+        if not all(notification.is_pending for notification in notifications):
+            raise NotificationInvalidStatus
+
+    def __update_notifications(self, notifications: List[Notification]) -> None:
+        self.__notification_repository.update_many(notifications=notifications)
+
+    def __get_all_workers(self) -> List[Worker]:
+        workers = self.__worker_repository.get_all()
+        if not workers:
+            raise WorkerNotFound
+        return workers
+
+    def __process_notifications(
+        self, notifications: List[Notification]
+    ) -> List[Notification]:
+        notifications_to_process = [
+            notification.with_status(status=NotificationStatus.IN_PROGRESS)
+            for notification in notifications
+        ]
+        self.__update_notifications(notifications=notifications_to_process)
+
+        workers = self.__get_all_workers()
+        if self.__coalescer is not None:
+            deliveries = self.__coalescer.coalesce(
+                notifications=notifications_to_process
+            )
+        else:
+            deliveries = [
+                CoalescedDelivery(
+                    delivery=notification, notifications=[notification]
+                )
+                for notification in notifications_to_process
+            ]
+        max_workers = min(self.__max_concurrency, len(deliveries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Outcomes are recorded on the entities in place, so the input
+            # order is kept regardless of how they were grouped.
+            list(
+                executor.map(
+                    lambda coalesced: self.__dispatcher.dispatch_coalesced(
+                        delivery=coalesced.delivery,
+                        notifications=coalesced.notifications,
+                        workers=workers,
+                    ),
+                    deliveries,
+                )
+            )
+        return notifications_to_process
@@ -0,0 +1,90 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.worker_liveness_tracker import (
+    WorkerLivenessTracker,
+)
+
+
+class RecordWorkerHeartbeat:
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        liveness_tracker: WorkerLivenessTracker,
+        flush_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__worker_repository = worker_repository
+        self.__liveness_tracker = liveness_tracker
+        self.__flush_interval = flush_interval
+        self.__clock = clock
+        self.__pending: Dict[UUID, datetime] = {}
+        self.__next_flush_at = clock() + flush_interval
+        self.__lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__logger = logging.getLogger()
+
+    def __call__(self, worker_uuid: UUID) -> None:
+        # Liveness is tracked right away; persisting is coalesced so a worker
+        # heartbeating several times per interval costs a single write.
+        # Without start(), the last heartbeats before a quiet period are
+        # only written by an explicit flush().
+        self.__liveness_tracker.track(worker_uuid=worker_uuid)
+        with self.__lock:
+            self.__pending[worker_uuid] = datetime.now()
+            should_flush = self.__clock() >= self.__next_flush_at
+        if should_flush:
+            self.flush()
+
+    def start(self) -> None:
+        if self.__thread is not None:
+            return
+        self.__stopped.clear()
+        self.__thread = threading.Thread(
+            target=self.__flush_periodically,
+            name="worker-heartbeat-flush",
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        # Heartbeats received before stop() are still persisted.
+        if self.__thread is not None:
+            self.__stopped.set()
+            self.__thread.join()
+            self.__thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        with self.__lock:
+            pending, self.__pending = self.__pending, {}
+            self.__next_flush_at = self.__clock() + self.__flush_interval
+        if not pending:
+            return 0
+        # Written as heartbeats, not as whole workers, so circuit changes
+        # made since this process last read a worker are kept.
+        workers = self.__worker_repository.record_heartbeats(
+            heartbeats=pending
+        )
+        known = {worker.id for worker in workers}
+        for worker_uuid in pending.keys() - known:
+            self.__liveness_tracker.forget(worker_uuid=worker_uuid)
+            self.__logger.warning(
+                "Heartbeat received from unknown worker %s.", worker_uuid
+            )
+        return len(workers)
+
+    def __flush_periodically(self) -> None:
+        while not self.__stopped.wait(self.__flush_interval):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                self.__logger.exception("Failed to flush worker heartbeats.")
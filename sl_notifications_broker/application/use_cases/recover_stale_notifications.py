@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationCursor,
+    NotificationRepositoryPort,
+)
+
+
+class RecoverStaleNotifications:
+    def __init__(
+        self,
+        notification_repository: NotificationRepositoryPort,
+        stale_after: timedelta,
+        page_size: int = 100,
+        max_pages: int = 10,
+    ) -> None:
+        self.__notification_repository = notification_repository
+        self.__stale_after = stale_after
+        self.__page_size = page_size
+        self.__max_pages = max_pages
+        self.__cursor: Optional[NotificationCursor] = None
+
+    def __call__(self) -> int:
+        # Each run reads at most max_pages pages and resumes from the cursor
+        # on the next run, so a sweep never loads the whole collection.
+        updated_before = datetime.now() - self.__stale_after
+        recovered = 0
+        for _ in range(self.__max_pages):
+            page = self.__notification_repository.find_stale_in_progress(
+                updated_before=updated_before,
+                limit=self.__page_size,
+                after=self.__cursor,
+            )
+            for notification in page.notifications:
+                notification.requeue()
+            if page.notifications:
+                self.__notification_repository.update_many(
+                    notifications=page.notifications
+                )
+            recovered += len(page.notifications)
+            self.__cursor = page.next_cursor
+            if self.__cursor is None:
+                break
+        return recovered
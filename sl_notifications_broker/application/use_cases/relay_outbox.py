@@ -0,0 +1,39 @@
+from sl_notifications_broker.application.ports.outbox_repository_port import (
+    OutboxRepositoryPort,
+)
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    MessageBusPort,
+)
+
+
+class RelayOutbox:
+    def __init__(
+        self,
+        outbox_repository: OutboxRepositoryPort,
+        message_bus: MessageBusPort,
+        batch_size: int = 100,
+    ) -> None:
+        self.__outbox_repository = outbox_repository
+        self.__message_bus = message_bus
+        self.__batch_size = batch_size
+
+    @property
+    def batch_size(self) -> int:
+        return self.__batch_size
+
+    def __call__(self) -> int:
+        messages = self.__outbox_repository.get_unpublished(
+            limit=self.__batch_size
+        )
+        if not messages:
+            return 0
+
+        self.__message_bus.publish_many(messages=messages)
+        # Delivery is at-least-once: a crash before this point publishes the
+        # batch again on the next run.
+        self.__outbox_repository.mark_published(
+            message_ids=[
+                message.message_header.message_id for message in messages
+            ]
+        )
+        return len(messages)
@@ -0,0 +1,22 @@
+from typing import Callable
+
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+
+
+class RetryDueNotifications:
+    def __init__(
+        self,
+        retry_scheduler: RetryScheduler,
+        process_notification: Callable[[Notification], None],
+    ) -> None:
+        self.__retry_scheduler = retry_scheduler
+        self.__process_notification = process_notification
+
+    def __call__(self) -> int:
+        due = self.__retry_scheduler.pop_due()
+        for notification in due:
+            self.__process_notification(notification)
+        return len(due)
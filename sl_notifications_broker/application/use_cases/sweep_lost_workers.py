@@ -0,0 +1,80 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.worker_liveness_tracker import (
+    WorkerLivenessTracker,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class SweepLostWorkers:
+    def __init__(
+        self,
+        worker_repository: WorkerRepositoryPort,
+        liveness_tracker: WorkerLivenessTracker,
+        resync_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.__worker_repository = worker_repository
+        self.__liveness_tracker = liveness_tracker
+        self.__resync_interval = (
+            resync_interval
+            if resync_interval is not None
+            else liveness_tracker.timeout
+        )
+        self.__clock = clock
+        self.__wall_clock = wall_clock
+        self.__next_resync_at: Optional[float] = None
+
+    def __call__(self) -> List[Worker]:
+        if self.__next_resync_at is None or (
+            self.__clock() >= self.__next_resync_at
+        ):
+            self.__resync()
+
+        lost_workers = []
+        for worker_uuid in self.__liveness_tracker.pop_expired():
+            try:
+                worker = self.__worker_repository.get(worker_uuid=worker_uuid)
+            except WorkerNotFound:
+                continue
+            if not worker.is_online:
+                continue
+            # The repository has the last persisted heartbeat, which may
+            # have reached another replica rather than this tracker.
+            age = self.__age(worker=worker)
+            if age < self.__liveness_tracker.timeout:
+                self.__liveness_tracker.track(worker_uuid=worker.id, age=age)
+                continue
+            # Conditional on the stored heartbeat, so one persisted after
+            # the read above keeps the worker online.
+            lost_worker = self.__worker_repository.mark_offline(
+                worker_uuid=worker.id,
+                last_seen_before=self.__wall_clock()
+                - timedelta(seconds=self.__liveness_tracker.timeout),
+            )
+            if lost_worker is None:
+                self.__liveness_tracker.track(worker_uuid=worker.id)
+                continue
+            lost_workers.append(lost_worker)
+        return lost_workers
+
+    def __resync(self) -> None:
+        # ONLINE workers this process never heard from, e.g. after a restart
+        # or with heartbeats served by other replicas, are tracked from the
+        # heartbeat time stored with them.
+        for worker in self.__worker_repository.get_all():
+            if worker.is_online:
+                self.__liveness_tracker.track(
+                    worker_uuid=worker.id, age=self.__age(worker=worker)
+                )
+        self.__next_resync_at = self.__clock() + self.__resync_interval
+
+    def __age(self, worker: Worker) -> float:
+        return (self.__wall_clock() - worker.updated_at).total_seconds()
@@ -0,0 +1,229 @@
+import struct
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, Iterable, List, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    NotificationPriority,
+    NotificationStatus,
+    SecondLifeUser,
+)
+
+
+class NotificationDecodeError(Exception):
+    pass
+
+
+class NotificationCodec:
+    # Binary record: version, status, priority, notification id, recipient
+    # uuid, created_at, updated_at and next_attempt_at as microseconds since
+    # the epoch, the attempt count, then the length-prefixed UTF-8 username
+    # and message body. A missing next_attempt_at is stored as
+    # __NO_TIMESTAMP.
+    FORMAT_VERSION = 3
+    __RECORD = struct.Struct("!BBB16s16sqqqIHI")
+    __NO_TIMESTAMP = -(2 ** 63)
+    __COUNT = struct.Struct("!I")
+    __EPOCH = datetime(1970, 1, 1)
+    __MICROSECOND = timedelta(microseconds=1)
+    __STATUS_CODES = {
+        NotificationStatus.PENDING: 0,
+        NotificationStatus.IN_PROGRESS: 1,
+        NotificationStatus.FAILED: 2,
+        NotificationStatus.SUCCESS: 3,
+    }
+    __STATUSES = {code: status for status, code in __STATUS_CODES.items()}
+    __PRIORITY_CODES = {
+        NotificationPriority.HIGH: 0,
+        NotificationPriority.NORMAL: 1,
+        NotificationPriority.LOW: 2,
+    }
+    __PRIORITIES = {
+        code: priority for priority, code in __PRIORITY_CODES.items()
+    }
+
+    def __init__(self, cache_size: int = 0) -> None:
+        # With cache_size, one serialization per notification version is
+        # shared by every caller of this codec, e.g. an event body and a
+        # repository adapter writing the same notification. Entries are
+        # keyed on every serialized field, not just on identity.
+        self.__cache_size = cache_size
+        self.__cache: "OrderedDict[Tuple[Hashable, ...], Dict]" = (
+            OrderedDict()
+        )
+        self.__lock = threading.Lock()
+
+    def to_dict(self, notification: Notification) -> Dict:
+        # A fresh dict per call: callers own it and may mutate it freely.
+        if not self.__cache_size:
+            return self.__build_dict(notification)
+        key = self.__version(notification)
+        with self.__lock:
+            cached = self.__cache.get(key)
+            if cached is not None:
+                self.__cache.move_to_end(key)
+        if cached is None:
+            cached = self.__build_dict(notification)
+            with self.__lock:
+                self.__cache[key] = cached
+                if len(self.__cache) > self.__cache_size:
+                    self.__cache.popitem(last=False)
+        # The cached dict never leaves the codec; every value in it is
+        # immutable, so copying both levels is enough.
+        return {**cached, "send_to": dict(cached["send_to"])}
+
+    @staticmethod
+    def __version(notification: Notification) -> Tuple[Hashable, ...]:
+        send_to = notification.to
+        return (
+            notification.id,
+            notification.status,
+            notification.updated_at,
+            notification.attempts,
+            notification.next_attempt_at,
+            notification.priority,
+            notification.message.body,
+            send_to.second_life_uuid,
+            send_to.second_life_username,
+        )
+
+    @staticmethod
+    def __build_dict(notification: Notification) -> Dict:
+        send_to = notification.to
+        return {
+            "send_to": {
+                "second_life_uuid": str(send_to.second_life_uuid),
+                "second_life_username": send_to.second_life_username,
+            },
+            "message": notification.message.body,
+            "status": notification.status.value,
+            "notification_id": str(notification.id),
+            "created_at": notification.created_at.isoformat(),
+            "updated_at": notification.updated_at.isoformat(),
+            "attempts": notification.attempts,
+            "next_attempt_at": notification.next_attempt_at.isoformat()
+            if notification.next_attempt_at
+            else None,
+            "priority": notification.priority.value,
+        }
+
+    def from_dict(self, data: Dict) -> Notification:
+        return Notification.from_dict(data=data)
+
+    def to_dict_many(self, notifications: Iterable[Notification]) -> List[Dict]:
+        return [self.to_dict(notification) for notification in notifications]
+
+    def from_dict_many(self, data: Iterable[Dict]) -> List[Notification]:
+        return [self.from_dict(item) for item in data]
+
+    def encode(self, notification: Notification) -> bytes:
+        send_to = notification.to
+        username = send_to.second_life_username.encode("utf-8")
+        body = notification.message.body.encode("utf-8")
+        return (
+            self.__RECORD.pack(
+                self.FORMAT_VERSION,
+                self.__STATUS_CODES[notification.status],
+                self.__PRIORITY_CODES[notification.priority],
+                notification.id.bytes,
+                send_to.second_life_uuid.bytes,
+                self.__to_microseconds(notification.created_at),
+                self.__to_microseconds(notification.updated_at),
+                self.__to_microseconds(notification.next_attempt_at)
+                if notification.next_attempt_at
+                else self.__NO_TIMESTAMP,
+                notification.attempts,
+                len(username),
+                len(body),
+            )
+            + username
+            + body
+        )
+
+    def decode(self, data: bytes) -> Notification:
+        notification, offset = self.__decode_from(data, 0)
+        if offset != len(data):
+            raise NotificationDecodeError("Trailing bytes after record")
+        return notification
+
+    def encode_many(self, notifications: Iterable[Notification]) -> bytes:
+        records = [self.encode(notification) for notification in notifications]
+        return self.__COUNT.pack(len(records)) + b"".join(records)
+
+    def decode_many(self, data: bytes) -> List[Notification]:
+        try:
+            (count,) = self.__COUNT.unpack_from(data, 0)
+        except struct.error as error:
+            raise NotificationDecodeError(str(error)) from error
+        offset = self.__COUNT.size
+        notifications = []
+        for _ in range(count):
+            notification, offset = self.__decode_from(data, offset)
+            notifications.append(notification)
+        if offset != len(data):
+            raise NotificationDecodeError("Trailing bytes after records")
+        return notifications
+
+    def __decode_from(self, data: bytes, offset: int):
+        try:
+            (
+                version,
+                status_code,
+                priority_code,
+                notification_id,
+                second_life_uuid,
+                created_at,
+                updated_at,
+                next_attempt_at,
+                attempts,
+                username_length,
+                body_length,
+            ) = self.__RECORD.unpack_from(data, offset)
+        except struct.error as error:
+            raise NotificationDecodeError(str(error)) from error
+        if version != self.FORMAT_VERSION:
+            raise NotificationDecodeError(f"Unsupported version {version}")
+        if status_code not in self.__STATUSES:
+            raise NotificationDecodeError(f"Unknown status {status_code}")
+        if priority_code not in self.__PRIORITIES:
+            raise NotificationDecodeError(f"Unknown priority {priority_code}")
+
+        start = offset + self.__RECORD.size
+        body_start = start + username_length
+        end = body_start + body_length
+        if end > len(data):
+            raise NotificationDecodeError("Truncated record")
+        notification = Notification(
+            send_to=SecondLifeUser(
+                second_life_username=data[start:body_start].decode("utf-8"),
+                second_life_uuid=UUID(bytes=second_life_uuid),
+            ),
+            message=NotificationMessage(
+                body=data[body_start:end].decode("utf-8")
+            ),
+            status=self.__STATUSES[status_code],
+            priority=self.__PRIORITIES[priority_code],
+            notification_id=UUID(bytes=notification_id),
+            created_at=self.__from_microseconds(created_at),
+            updated_at=self.__from_microseconds(updated_at),
+            attempts=attempts,
+            next_attempt_at=self.__from_microseconds(next_attempt_at)
+            if next_attempt_at != self.__NO_TIMESTAMP
+            else None,
+        )
+        return notification, end
+
+    def __to_microseconds(self, value: datetime) -> int:
+        return (value - self.__EPOCH) // self.__MICROSECOND
+
+    def __from_microseconds(self, value: int) -> datetime:
+        return self.__EPOCH + timedelta(microseconds=value)
+
+
+# Shared by NotificationCreatedEvent; adapters serializing notifications
+# should use it too, so a create is serialized once for both.
+DEFAULT_NOTIFICATION_CODEC = NotificationCodec(cache_size=1024)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from uuid import UUID, uuid4
 
 
@@ -16,6 +16,18 @@ class NotificationMessage:
     body: str
 
 
+def as_uuid(value: Union[UUID, str]) -> UUID:
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def as_datetime(value: Union[datetime, str]) -> datetime:
+    # fromisoformat accepts str(datetime) output with or without the
+    # microseconds part, which strptime with "%f" does not.
+    return (
+        value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    )
+
+
 class NotificationStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -23,11 +35,29 @@ class NotificationStatus(Enum):
     SUCCESS = "success"
 
 
+class NotificationPriority(Enum):
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
+
 class NotificationInvalidStatus(Exception):
     pass
 
 
 class Notification:
+    __slots__ = (
+        "__send_to",
+        "__message",
+        "__status",
+        "__notification_id",
+        "__created_at",
+        "__updated_at",
+        "__attempts",
+        "__next_attempt_at",
+        "__priority",
+    )
+
     def __init__(
         self,
         send_to: SecondLifeUser,
@@ -36,6 +66,9 @@ class Notification:
         notification_id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        attempts: int = 0,
+        next_attempt_at: Optional[datetime] = None,
+        priority: Optional[NotificationPriority] = None,
     ):
         self.__send_to = send_to
         self.__message = message
@@ -43,11 +76,18 @@ class Notification:
         self.__notification_id: UUID = notification_id or uuid4()
         self.__created_at: datetime = created_at or datetime.now()
         self.__updated_at: datetime = updated_at or self.__created_at
+        self.__attempts = attempts
+        self.__next_attempt_at = next_attempt_at
+        self.__priority = priority or NotificationPriority.NORMAL
 
     @property
     def id(self) -> UUID:
         return self.__notification_id
 
+    @property
+    def idempotency_key(self) -> str:
+        return str(self.__notification_id)
+
     @property
     def created_at(self) -> datetime:
         return self.__created_at
@@ -56,6 +96,18 @@ class Notification:
     def updated_at(self) -> datetime:
         return self.__updated_at
 
+    @property
+    def attempts(self) -> int:
+        return self.__attempts
+
+    @property
+    def next_attempt_at(self) -> Optional[datetime]:
+        return self.__next_attempt_at
+
+    @property
+    def available_at(self) -> datetime:
+        return self.__next_attempt_at or self.__created_at
+
     @property
     def message(self) -> NotificationMessage:
         return self.__message
@@ -68,6 +120,10 @@ class Notification:
     def status(self) -> NotificationStatus:
         return self.__status
 
+    @property
+    def priority(self) -> NotificationPriority:
+        return self.__priority
+
     @property
     def is_pending(self) -> bool:
         return self.__status == NotificationStatus.PENDING
@@ -93,6 +149,44 @@ class Notification:
         self.__assert_in_progress()
         self.__set_status(status=NotificationStatus.FAILED)
 
+    def requeue(self) -> None:
+        # Explicit recovery path for notifications stuck IN_PROGRESS, e.g.
+        # after the process handling them died.
+        self.__assert_in_progress()
+        self.__set_status(status=NotificationStatus.PENDING)
+
+    def schedule_retry(self, next_attempt_at: datetime) -> None:
+        # A failed attempt goes back to PENDING, but is not due before
+        # next_attempt_at.
+        self.__assert_in_progress()
+        self.__attempts += 1
+        self.__next_attempt_at = next_attempt_at
+        self.__set_status(status=NotificationStatus.PENDING)
+
+    def defer(self, next_attempt_at: datetime) -> None:
+        # Held back by a rate limit before any worker saw it: back to
+        # PENDING without spending an attempt.
+        self.__assert_in_progress()
+        self.__next_attempt_at = next_attempt_at
+        self.__set_status(status=NotificationStatus.PENDING)
+
+    def is_due(self, now: datetime) -> bool:
+        return self.is_pending and self.available_at <= now
+
+    def with_status(self, status: NotificationStatus) -> "Notification":
+        notification = self.__copy__()
+        if status == NotificationStatus.PENDING:
+            notification.requeue()
+        elif status == NotificationStatus.IN_PROGRESS:
+            notification.set_in_progress()
+        elif status == NotificationStatus.SUCCESS:
+            notification.set_success()
+        elif status == NotificationStatus.FAILED:
+            notification.set_failed()
+        else:
+            raise NotificationInvalidStatus
+        return notification
+
     def as_dict(self) -> Dict:
         return {
             "send_to": {
@@ -104,6 +198,11 @@ class Notification:
             "notification_id": self.__notification_id,
             "created_at": str(self.__created_at),
             "updated_at": str(self.__updated_at),
+            "attempts": self.__attempts,
+            "next_attempt_at": str(self.__next_attempt_at)
+            if self.__next_attempt_at
+            else None,
+            "priority": self.__priority.value,
         }
 
     @staticmethod
@@ -111,25 +210,28 @@ class Notification:
         return Notification(
             send_to=SecondLifeUser(
                 second_life_username=data["send_to"]["second_life_username"],
-                second_life_uuid=data["send_to"]["second_life_uuid"],
+                second_life_uuid=as_uuid(data["send_to"]["second_life_uuid"]),
             ),
             message=NotificationMessage(body=data["message"]),
             status=NotificationStatus(data["status"])
             if data.get("status")
             else None,
-            notification_id=data["notification_id"]
+            notification_id=as_uuid(data["notification_id"])
             if data.get("notification_id")
             else None,
-            created_at=datetime.strptime(
-                data["created_at"], "%Y-%m-%d %H:%M:%S.%f"
-            )
+            created_at=as_datetime(data["created_at"])
             if data.get("created_at")
             else None,
-            updated_at=datetime.strptime(
-                data["updated_at"], "%Y-%m-%d %H:%M:%S.%f"
-            )
+            updated_at=as_datetime(data["updated_at"])
             if data.get("updated_at")
             else None,
+            attempts=data.get("attempts", 0),
+            next_attempt_at=as_datetime(data["next_attempt_at"])
+            if data.get("next_attempt_at")
+            else None,
+            priority=NotificationPriority(data["priority"])
+            if data.get("priority")
+            else None,
         )
 
     def __assert_in_progress(self):
@@ -140,6 +242,28 @@ class Notification:
         self.__status = status
         self.__updated_at = datetime.now()
 
+    def __copy__(self) -> "Notification":
+        # Every field is immutable, so a copy only needs a new entity shell.
+        return Notification(
+            send_to=self.__send_to,
+            message=self.__message,
+            status=self.__status,
+            notification_id=self.__notification_id,
+            created_at=self.__created_at,
+            updated_at=self.__updated_at,
+            attempts=self.__attempts,
+            next_attempt_at=self.__next_attempt_at,
+            priority=self.__priority,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Notification(id={self.__notification_id}, "
+            f"status={self.__status.value})"
+        )
 
     def __eq__(self, other) -> bool:
         return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.__notification_id)
@@ -1,7 +1,7 @@
 from typing import Dict, Optional
 from uuid import UUID
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 class WorkerStatus(Enum):
@@ -9,7 +9,24 @@ class WorkerStatus(Enum):
     OFFLINE = "offline"
 
 
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
 class Worker:
+    __slots__ = (
+        "__worker_uuid",
+        "__worker_status",
+        "__worker_url",
+        "__created_at",
+        "__updated_at",
+        "__circuit_state",
+        "__failure_count",
+        "__circuit_opened_at",
+    )
+
     def __init__(
         self,
         worker_uuid: UUID,
@@ -17,12 +34,56 @@ class Worker:
         worker_url: str,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        circuit_state: Optional[CircuitState] = None,
+        failure_count: int = 0,
+        circuit_opened_at: Optional[datetime] = None,
     ):
         self.__worker_uuid = worker_uuid
         self.__worker_status = worker_status
         self.__worker_url = worker_url
         self.__created_at: datetime = created_at or datetime.now()
         self.__updated_at: datetime = updated_at or self.__created_at
+        self.__circuit_state: CircuitState = (
+            circuit_state or CircuitState.CLOSED
+        )
+        self.__failure_count = failure_count
+        self.__circuit_opened_at = circuit_opened_at
+
+    @property
+    def id(self) -> UUID:
+        return self.__worker_uuid
+
+    @property
+    def status(self) -> WorkerStatus:
+        return self.__worker_status
+
+    @property
+    def is_online(self) -> bool:
+        return self.__worker_status == WorkerStatus.ONLINE
+
+    @property
+    def url(self) -> str:
+        return self.__worker_url
+
+    @property
+    def created_at(self) -> datetime:
+        return self.__created_at
+
+    @property
+    def updated_at(self) -> datetime:
+        return self.__updated_at
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        return self.__circuit_state
+
+    @property
+    def failure_count(self) -> int:
+        return self.__failure_count
+
+    @property
+    def circuit_opened_at(self) -> Optional[datetime]:
+        return self.__circuit_opened_at
 
     def as_dict(self) -> Dict:
         return {
@@ -31,7 +92,82 @@ class Worker:
             "worker_url": self.__worker_url,
             "created_at": str(self.__created_at),
             "updated_at": str(self.__updated_at),
+            "circuit_state": self.__circuit_state.value,
+            "failure_count": self.__failure_count,
+            "circuit_opened_at": str(self.__circuit_opened_at)
+            if self.__circuit_opened_at
+            else None,
         }
 
-    def heartbeat(self) -> None:
+    @staticmethod
+    def from_dict(data: Dict):
+        return Worker(
+            worker_uuid=data["worker_uuid"],
+            worker_status=WorkerStatus(data["worker_status"]),
+            worker_url=data["worker_url"],
+            created_at=datetime.fromisoformat(data["created_at"])
+            if data.get("created_at")
+            else None,
+            updated_at=datetime.fromisoformat(data["updated_at"])
+            if data.get("updated_at")
+            else None,
+            circuit_state=CircuitState(data["circuit_state"])
+            if data.get("circuit_state")
+            else None,
+            failure_count=data.get("failure_count", 0),
+            circuit_opened_at=datetime.fromisoformat(data["circuit_opened_at"])
+            if data.get("circuit_opened_at")
+            else None,
+        )
+
+    def heartbeat(self, at: Optional[datetime] = None) -> None:
+        self.__updated_at = at or datetime.now()
+        self.__worker_status = WorkerStatus.ONLINE
+        if self.__circuit_state == CircuitState.OPEN:
+            self.__circuit_state = CircuitState.HALF_OPEN
+
+    def set_offline(self) -> None:
+        self.__worker_status = WorkerStatus.OFFLINE
         self.__updated_at = datetime.now()
+
+    def record_success(self) -> None:
+        self.__failure_count = 0
+        self.__circuit_state = CircuitState.CLOSED
+        self.__circuit_opened_at = None
+
+    def record_failure(self, failure_threshold: int) -> None:
+        self.__failure_count += 1
+        if (
+            self.__circuit_state == CircuitState.HALF_OPEN
+            or self.__failure_count >= failure_threshold
+        ):
+            self.__circuit_state = CircuitState.OPEN
+            self.__circuit_opened_at = datetime.now()
+
+    def try_half_open(self, reset_timeout: timedelta) -> bool:
+        if self.__circuit_state != CircuitState.OPEN:
+            return False
+        opened_at = self.__circuit_opened_at
+        if opened_at and datetime.now() - opened_at < reset_timeout:
+            return False
+        self.__circuit_state = CircuitState.HALF_OPEN
+        return True
+
+    def copy_circuit_from(self, other: "Worker") -> None:
+        self.__circuit_state = other.circuit_state
+        self.__failure_count = other.failure_count
+        self.__circuit_opened_at = other.circuit_opened_at
+
+    def __repr__(self) -> str:
+        return (
+            f"Worker(id={self.__worker_uuid}, "
+            f"status={self.__worker_status.value})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Worker):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.__worker_uuid)
@@ -1,27 +1,77 @@
-from dataclasses import dataclass
+from copy import copy
 from datetime import datetime
-from uuid import uuid4
+from typing import Dict, Optional
+from uuid import UUID, uuid4
 
+from sl_notifications_broker.domain.codecs.notification_codec import (
+    DEFAULT_NOTIFICATION_CODEC,
+)
 from sl_notifications_broker.domain.ports.message_bus_port import (
     Message,
     MessageHeader,
     MessageType,
 )
-from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationPriority,
+)
 
 
-@dataclass(frozen=True)
 class NotificationCreatedEvent(Message):
+    MESSAGE_NAME = "second_life_notification_created"
+
+    # The body is built on first access and memoized on this event only,
+    # from a snapshot of the notification taken at creation. Only picklable
+    # state is kept, so events can cross process and broker boundaries.
+    def __init__(
+        self,
+        message_header: MessageHeader,
+        notification: Notification,
+    ):  # pylint: disable=super-init-not-called
+        object.__setattr__(self, "message_header", message_header)
+        object.__setattr__(
+            self, "_NotificationCreatedEvent__notification", copy(notification)
+        )
+        object.__setattr__(
+            self, "_NotificationCreatedEvent__message_body", None
+        )
+
+    @property
+    def notification(self) -> Notification:
+        return self.__notification
+
+    @property
+    def priority(self) -> NotificationPriority:
+        # Lets consumers route on priority without decoding the body.
+        return self.__notification.priority
+
+    @property
+    def message_body(self) -> Dict:
+        if self.__message_body is None:
+            object.__setattr__(
+                self,
+                "_NotificationCreatedEvent__message_body",
+                DEFAULT_NOTIFICATION_CODEC.to_dict(self.__notification),
+            )
+        return self.__message_body
+
+    @staticmethod
+    def header(
+        message_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+    ) -> MessageHeader:
+        return MessageHeader(
+            message_id=message_id or uuid4(),
+            message_type=MessageType.EVENT,
+            message_name=NotificationCreatedEvent.MESSAGE_NAME,
+            created_at=created_at or datetime.now(),
+        )
+
     @staticmethod
     def factory(
         notification: Notification,
     ):
         return NotificationCreatedEvent(
-            message_header=MessageHeader(
-                message_id=uuid4(),
-                message_type=MessageType.EVENT,
-                message_name="second_life_notification_created",
-                created_at=datetime.now(),
-            ),
-            message_body=notification.as_dict(),
+            message_header=NotificationCreatedEvent.header(),
+            notification=notification,
         )
@@ -1,3 +1,8 @@
+import os
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
 from sl_notifications_broker.domain.entities.notification import Notification
 from sl_notifications_broker.domain.events.notification_created_event import (
     NotificationCreatedEvent,
@@ -10,3 +15,25 @@ class EventFactory:
         notification: Notification,
     ) -> NotificationCreatedEvent:
         return NotificationCreatedEvent.factory(notification=notification)
+
+    @staticmethod
+    def notification_created_many(
+        notifications: List[Notification],
+    ) -> List[NotificationCreatedEvent]:
+        # Headers are built in bulk: one clock read and one urandom call
+        # for the whole batch instead of one of each per event.
+        created_at = datetime.now()
+        random_bytes = os.urandom(16 * len(notifications))
+        return [
+            NotificationCreatedEvent(
+                message_header=NotificationCreatedEvent.header(
+                    message_id=UUID(
+                        bytes=random_bytes[index * 16 : index * 16 + 16],
+                        version=4,
+                    ),
+                    created_at=created_at,
+                ),
+                notification=notification,
+            )
+            for index, notification in enumerate(notifications)
+        ]
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
 from uuid import UUID
 
 
@@ -30,6 +30,10 @@ class MessageBusPort(ABC):
     def publish(self, message: Message) -> None:
         pass
 
+    @abstractmethod
+    def publish_many(self, messages: List[Message]) -> None:
+        pass
+
 
 class MessageHandler(ABC):
     @abstractmethod
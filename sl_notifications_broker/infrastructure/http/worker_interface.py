@@ -0,0 +1,370 @@
+import http.client
+import json
+import ssl
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerInterfacePort,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.domain.codecs.notification_codec import (
+    NotificationCodec,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+# Errors from a pooled connection the server already closed. Anything else,
+# a timeout in particular, may mean the worker got the request.
+_STALE_CONNECTION_ERRORS = (
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+def _retry_after(value: Optional[str]) -> float:
+    # Retry-After holds either delay seconds or an HTTP date. Anything
+    # missing or unreadable means retry as soon as the limit allows.
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _Endpoint(NamedTuple):
+    scheme: str
+    host: str
+    port: Optional[int]
+    target: str
+    host_header: str
+
+
+@lru_cache(maxsize=1024)
+def _endpoint(url: str) -> _Endpoint:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise WorkerCommunicationFailure(f"Unsupported worker url {url!r}")
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+    return _Endpoint(
+        scheme=parts.scheme,
+        host=parts.hostname,
+        port=parts.port,
+        target=target,
+        host_header=parts.netloc.rpartition("@")[2],
+    )
+
+
+class _NonClosingReader:
+    # HTTPResponse closes its file once a response is read; pipelined
+    # responses share one buffered reader, which has to outlive each of them.
+    def __init__(self, reader) -> None:
+        self.__reader = reader
+
+    def __getattr__(self, name):
+        return getattr(self.__reader, name)
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedReaderSocket:
+    def __init__(self, reader) -> None:
+        self.__reader = reader
+
+    def makefile(self, *args, **kwargs) -> _NonClosingReader:
+        return _NonClosingReader(self.__reader)
+
+
+class HttpWorkerInterface(WorkerInterfacePort):
+    def __init__(
+        self,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        max_idle_per_host: int = 4,
+        idle_timeout: float = 30.0,
+        pipelining: bool = False,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        codec: Optional[NotificationCodec] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__connect_timeout = connect_timeout
+        self.__read_timeout = read_timeout
+        self.__max_idle_per_host = max_idle_per_host
+        self.__idle_timeout = idle_timeout
+        self.__pipelining = pipelining
+        self.__ssl_context = ssl_context
+        self.__codec = codec or NotificationCodec()
+        self.__clock = clock
+        # Idle keep-alive connections per (scheme, host, port), most
+        # recently used last.
+        self.__idle: Dict[
+            Tuple, List[Tuple[http.client.HTTPConnection, float]]
+        ] = defaultdict(list)
+        self.__lock = threading.Lock()
+
+    def process_notification(
+        self,
+        worker: Worker,
+        notification: Notification,
+    ) -> None:
+        endpoint = _endpoint(worker.url)
+        body, headers = self.__encode(notification=notification)
+        # A pooled connection may have been closed by the server while it
+        # sat idle; the request is then resent once on a fresh connection,
+        # which the idempotency key makes safe.
+        for reuse in (True, False):
+            connection, reused = self.__acquire(endpoint=endpoint, reuse=reuse)
+            try:
+                connection.request(
+                    "POST", endpoint.target, body=body, headers=headers
+                )
+                response = connection.getresponse()
+                response.read()
+                break
+            except _STALE_CONNECTION_ERRORS as error:
+                connection.close()
+                if not reused:
+                    raise WorkerCommunicationFailure from error
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                raise WorkerCommunicationFailure from error
+        self.__release(
+            endpoint=endpoint,
+            connection=connection,
+            keep_alive=not response.will_close,
+        )
+        self.__raise_for_status(worker=worker, response=response)
+
+    def process_notifications(
+        self,
+        worker: Worker,
+        notifications: List[Notification],
+    ) -> List[Optional[WorkerCommunicationFailure]]:
+        # One outcome per notification, None on success. Without pipelining
+        # the batch still goes over a single pooled connection.
+        if not self.__pipelining:
+            return [
+                self.__outcome(worker=worker, notification=notification)
+                for notification in notifications
+            ]
+        return self.__pipeline(worker=worker, notifications=notifications)
+
+    def close(self) -> None:
+        with self.__lock:
+            idle = [
+                connection
+                for connections in self.__idle.values()
+                for connection, _ in connections
+            ]
+            self.__idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def __outcome(
+        self, worker: Worker, notification: Notification
+    ) -> Optional[WorkerCommunicationFailure]:
+        try:
+            self.process_notification(worker=worker, notification=notification)
+        except WorkerCommunicationFailure as failure:
+            return failure
+        return None
+
+    def __pipeline(
+        self, worker: Worker, notifications: List[Notification]
+    ) -> List[Optional[WorkerCommunicationFailure]]:
+        # All requests go out in one write and the responses are read back
+        # in order, so the batch costs one round trip instead of one per
+        # notification. http.client allows a single outstanding response
+        # per connection, hence the raw socket.
+        endpoint = _endpoint(worker.url)
+        requests = b"".join(
+            self.__raw_request(endpoint=endpoint, notification=notification)
+            for notification in notifications
+        )
+        for reuse in (True, False):
+            try:
+                connection, reused = self.__acquire(
+                    endpoint=endpoint, reuse=reuse
+                )
+            except WorkerCommunicationFailure as failure:
+                return [failure] * len(notifications)
+            try:
+                connection.sock.sendall(requests)
+                break
+            except _STALE_CONNECTION_ERRORS as error:
+                connection.close()
+                if not reused:
+                    return self.__failures(error, len(notifications))
+            except OSError as error:
+                connection.close()
+                return self.__failures(error, len(notifications))
+
+        outcomes: List[Optional[WorkerCommunicationFailure]] = []
+        keep_alive = True
+        with connection.sock.makefile("rb") as reader:
+            responses = _SharedReaderSocket(reader)
+            for _ in notifications:
+                try:
+                    response = http.client.HTTPResponse(
+                        responses, method="POST"
+                    )
+                    response.begin()
+                    response.read()
+                except (OSError, http.client.HTTPException) as error:
+                    # The requests left unanswered were never processed.
+                    keep_alive = False
+                    outcomes.extend(
+                        self.__failures(
+                            error, len(notifications) - len(outcomes)
+                        )
+                    )
+                    break
+                outcomes.append(
+                    self.__failure_for(worker=worker, response=response)
+                )
+                if response.will_close:
+                    keep_alive = False
+                    outcomes.extend(
+                        self.__failures(
+                            http.client.RemoteDisconnected(),
+                            len(notifications) - len(outcomes),
+                        )
+                    )
+                    break
+        self.__release(
+            endpoint=endpoint, connection=connection, keep_alive=keep_alive
+        )
+        return outcomes
+
+    def __encode(self, notification: Notification) -> Tuple[bytes, Dict]:
+        body = json.dumps(
+            self.__codec.to_dict(notification), separators=(",", ":")
+        ).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Idempotency-Key": notification.idempotency_key,
+        }
+        return body, headers
+
+    def __raw_request(
+        self, endpoint: _Endpoint, notification: Notification
+    ) -> bytes:
+        body, headers = self.__encode(notification=notification)
+        lines = [
+            f"POST {endpoint.target} HTTP/1.1",
+            f"Host: {endpoint.host_header}",
+            f"Content-Length: {len(body)}",
+            *(f"{name}: {value}" for name, value in headers.items()),
+        ]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+    def __acquire(
+        self, endpoint: _Endpoint, reuse: bool
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        if reuse:
+            connection = self.__pop_idle(endpoint=endpoint)
+            if connection is not None:
+                return connection, True
+        return self.__connect(endpoint=endpoint), False
+
+    def __pop_idle(
+        self, endpoint: _Endpoint
+    ) -> Optional[http.client.HTTPConnection]:
+        expired = []
+        connection = None
+        with self.__lock:
+            idle = self.__idle[endpoint[:3]]
+            deadline = self.__clock() - self.__idle_timeout
+            while idle:
+                candidate, idle_since = idle.pop()
+                if idle_since >= deadline:
+                    connection = candidate
+                    break
+                expired.append(candidate)
+        for candidate in expired:
+            candidate.close()
+        return connection
+
+    def __connect(self, endpoint: _Endpoint) -> http.client.HTTPConnection:
+        if endpoint.scheme == "https":
+            connection = http.client.HTTPSConnection(
+                endpoint.host,
+                endpoint.port,
+                timeout=self.__connect_timeout,
+                context=self.__ssl_context,
+            )
+        else:
+            connection = http.client.HTTPConnection(
+                endpoint.host, endpoint.port, timeout=self.__connect_timeout
+            )
+        try:
+            connection.connect()
+        except OSError as error:
+            connection.close()
+            raise WorkerCommunicationFailure from error
+        # Connecting and waiting on a slow in-world script get separate
+        # budgets.
+        connection.sock.settimeout(self.__read_timeout)
+        return connection
+
+    def __release(
+        self,
+        endpoint: _Endpoint,
+        connection: http.client.HTTPConnection,
+        keep_alive: bool,
+    ) -> None:
+        if keep_alive:
+            with self.__lock:
+                idle = self.__idle[endpoint[:3]]
+                if len(idle) < self.__max_idle_per_host:
+                    idle.append((connection, self.__clock()))
+                    return
+        connection.close()
+
+    def __raise_for_status(
+        self, worker: Worker, response: http.client.HTTPResponse
+    ) -> None:
+        failure = self.__failure_for(worker=worker, response=response)
+        if failure is not None:
+            raise failure
+
+    @staticmethod
+    def __failure_for(
+        worker: Worker, response: http.client.HTTPResponse
+    ) -> Optional[WorkerCommunicationFailure]:
+        status = response.status
+        if 200 <= status < 300:
+            return None
+        if status == 429:
+            return WorkerRateLimited(
+                f"{worker.url} answered {status}",
+                retry_after=_retry_after(response.getheader("Retry-After")),
+            )
+        return WorkerCommunicationFailure(f"{worker.url} answered {status}")
+
+    @staticmethod
+    def __failures(
+        error: BaseException, count: int
+    ) -> List[WorkerCommunicationFailure]:
+        failure = WorkerCommunicationFailure()
+        failure.__cause__ = error
+        return [failure] * count
@@ -0,0 +1,56 @@
+import asyncio
+import random
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.async_worker_interface_port import (
+    AsyncWorkerInterfacePort,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class InMemoryAsyncWorkerInterface(AsyncWorkerInterfacePort):
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        failing_worker_ids: Optional[Iterable[UUID]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.__latency = latency
+        self.__failure_rate = failure_rate
+        self.__failing_worker_ids = set(failing_worker_ids or ())
+        self.__random = random.Random(seed)
+        self.__delivered: List[Tuple[UUID, UUID]] = []
+        self.__in_flight = 0
+        self.__max_in_flight = 0
+
+    @property
+    def delivered(self) -> List[Tuple[UUID, UUID]]:
+        return list(self.__delivered)
+
+    @property
+    def max_in_flight(self) -> int:
+        return self.__max_in_flight
+
+    async def process_notification(
+        self,
+        worker: Worker,
+        notification: Notification,
+    ) -> None:
+        self.__in_flight += 1
+        self.__max_in_flight = max(self.__max_in_flight, self.__in_flight)
+        try:
+            if self.__latency:
+                await asyncio.sleep(self.__latency)
+            if worker.id in self.__failing_worker_ids or (
+                self.__random.random() < self.__failure_rate
+            ):
+                raise WorkerCommunicationFailure
+            self.__delivered.append((worker.id, notification.id))
+        finally:
+            self.__in_flight -= 1
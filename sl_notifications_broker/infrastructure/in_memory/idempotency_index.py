@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.idempotency_index_port import (
+    IdempotencyIndexPort,
+)
+
+
+class InMemoryIdempotencyIndex(IdempotencyIndexPort):
+    def __init__(
+        self,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__max_keys = max_keys
+        self.__clock = clock
+        # key -> (notification_id, expires_at), least recently used first.
+        self.__keys: "OrderedDict[str, Tuple[UUID, float]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def reserve(
+        self, key: str, notification_id: UUID, ttl_seconds: float
+    ) -> UUID:
+        now = self.__clock()
+        with self.__lock:
+            entry = self.__keys.get(key)
+            if entry is not None and entry[1] > now:
+                self.__keys.move_to_end(key)
+                return entry[0]
+            self.__keys[key] = (notification_id, now + ttl_seconds)
+            self.__keys.move_to_end(key)
+            self.__evict(now=now)
+            return notification_id
+
+    def release(self, key: str, notification_id: UUID) -> None:
+        with self.__lock:
+            entry = self.__keys.get(key)
+            if entry is not None and entry[0] == notification_id:
+                del self.__keys[key]
+
+    def __evict(self, now: float) -> None:
+        # Expired keys at the cold end go first; past max_keys the least
+        # recently used key is dropped even if it has not expired.
+        while self.__keys:
+            key, (_, expires_at) = next(iter(self.__keys.items()))
+            if expires_at > now and len(self.__keys) <= self.__max_keys:
+                return
+            del self.__keys[key]
@@ -0,0 +1,94 @@
+import logging
+import queue
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    Message,
+    MessageBusPort,
+    MessageHandler,
+)
+
+
+class MessageBusFull(Exception):
+    pass
+
+
+class InMemoryMessageBus(MessageBusPort):
+    __STOP = object()
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        consumers: int = 1,
+        publish_timeout: Optional[float] = None,
+    ) -> None:
+        if consumers < 1:
+            raise ValueError("consumers must be at least 1")
+        self.__queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self.__consumers = consumers
+        self.__publish_timeout = publish_timeout
+        self.__handlers: Dict[str, List[MessageHandler]] = defaultdict(list)
+        self.__threads: List[threading.Thread] = []
+        self.__logger = logging.getLogger()
+
+    def subscribe(self, message_name: str, handler: MessageHandler) -> None:
+        self.__handlers[message_name].append(handler)
+
+    def publish(self, message: Message) -> None:
+        # A full queue blocks the publisher (backpressure) for up to
+        # publish_timeout seconds, forever when it is None.
+        try:
+            self.__queue.put(message, timeout=self.__publish_timeout)
+        except queue.Full as error:
+            raise MessageBusFull from error
+
+    def publish_many(self, messages: List[Message]) -> None:
+        for message in messages:
+            self.publish(message=message)
+
+    def start(self) -> None:
+        if self.__threads:
+            return
+        for index in range(self.__consumers):
+            thread = threading.Thread(
+                target=self.__consume,
+                name=f"message-bus-consumer-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self.__threads.append(thread)
+
+    def join(self) -> None:
+        self.__queue.join()
+
+    def stop(self) -> None:
+        # Messages published before stop() are still delivered.
+        for _ in self.__threads:
+            self.__queue.put(self.__STOP)
+        for thread in self.__threads:
+            thread.join()
+        self.__threads = []
+
+    def __consume(self) -> None:
+        while True:
+            message = self.__queue.get()
+            try:
+                if message is self.__STOP:
+                    return
+                self.__dispatch(message=message)
+            finally:
+                self.__queue.task_done()
+
+    def __dispatch(self, message: Message) -> None:
+        handlers = self.__handlers.get(message.message_header.message_name, ())
+        for handler in handlers:
+            try:
+                handler.handle(message=message)
+            except Exception:  # pylint: disable=broad-except
+                self.__logger.exception(
+                    "Handler %s failed to handle message %s.",
+                    handler,
+                    message.message_header.message_id,
+                )
@@ -0,0 +1,37 @@
+import threading
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Tuple
+
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+    Tags,
+)
+
+Key = Tuple[str, FrozenSet[Tuple[str, str]]]
+
+
+class InMemoryMetricsSink(MetricsSinkPort):
+    def __init__(self) -> None:
+        self.__counters: Dict[Key, int] = defaultdict(int)
+        self.__histograms: Dict[Key, List[float]] = defaultdict(list)
+        self.__lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        with self.__lock:
+            self.__counters[self.__key(name, tags)] += value
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        with self.__lock:
+            self.__histograms[self.__key(name, tags)].append(value)
+
+    def counter(self, name: str, tags: Tags = None) -> int:
+        with self.__lock:
+            return self.__counters.get(self.__key(name, tags), 0)
+
+    def histogram(self, name: str, tags: Tags = None) -> List[float]:
+        with self.__lock:
+            return list(self.__histograms.get(self.__key(name, tags), ()))
+
+    @staticmethod
+    def __key(name: str, tags: Tags) -> Key:
+        return name, frozenset((tags or {}).items())
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from sl_notifications_broker.application.ports.notification_queue_port import (
+    NotificationQueuePort,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationPriority,
+)
+
+DEFAULT_WEIGHTS = {
+    NotificationPriority.HIGH: 8,
+    NotificationPriority.NORMAL: 4,
+    NotificationPriority.LOW: 1,
+}
+
+
+class InMemoryWeightedFairQueue(NotificationQueuePort):
+    def __init__(
+        self,
+        weights: Optional[Dict[NotificationPriority, int]] = None,
+        max_wait: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__weights = dict(weights or DEFAULT_WEIGHTS)
+        if set(self.__weights) != set(NotificationPriority) or any(
+            weight < 1 for weight in self.__weights.values()
+        ):
+            raise ValueError("Every priority needs a weight of at least 1")
+        self.__max_wait = max_wait
+        self.__clock = clock
+        # One FIFO per priority level, in priority order.
+        self.__levels: Dict[
+            NotificationPriority, Deque[Tuple[float, Notification]]
+        ] = {priority: deque() for priority in NotificationPriority}
+        self.__credits = {priority: 0 for priority in NotificationPriority}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return sum(len(level) for level in self.__levels.values())
+
+    def push_many(self, notifications: List[Notification]) -> None:
+        now = self.__clock()
+        with self.__lock:
+            for notification in notifications:
+                self.__levels[notification.priority].append(
+                    (now, notification)
+                )
+
+    def pop_many(self, limit: int) -> List[Notification]:
+        now = self.__clock()
+        popped = []
+        with self.__lock:
+            while len(popped) < limit:
+                priority = self.__next_level(now=now)
+                if priority is None:
+                    break
+                _, notification = self.__levels[priority].popleft()
+                popped.append(notification)
+        return popped
+
+    def __next_level(self, now: float) -> Optional[NotificationPriority]:
+        active = [
+            priority for priority, level in self.__levels.items() if level
+        ]
+        if not active:
+            return None
+
+        # Smooth weighted round robin: every active level earns its weight,
+        # the richest is served and pays back the total, so levels are
+        # interleaved in proportion to their weights instead of in bursts.
+        # Starvation protection: a level whose head has waited max_wait
+        # earns the top weight until it catches up, so it gets parity with
+        # the highest priority without ever taking the queue over.
+        top_weight = max(self.__weights.values())
+        total = 0
+        for priority in active:
+            waited = now - self.__levels[priority][0][0]
+            weight = (
+                top_weight
+                if waited >= self.__max_wait
+                else self.__weights[priority]
+            )
+            self.__credits[priority] += weight
+            total += weight
+        chosen = max(active, key=lambda priority: self.__credits[priority])
+        self.__credits[chosen] -= total
+        for priority, level in self.__levels.items():
+            if not level:
+                self.__credits[priority] = 0
+        return chosen
@@ -0,0 +1,211 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from copy import copy
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationCursor,
+    NotificationNotFound,
+    NotificationPage,
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.ports.outbox_repository_port import (
+    OutboxRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.ports.message_bus_port import Message
+
+
+class InMemoryNotificationRepository(
+    NotificationRepositoryPort, OutboxRepositoryPort
+):
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.__clock = clock
+        self.__notifications: Dict[UUID, Notification] = {}
+        # Index on (status, available_at): only claimable notifications are
+        # in the heap, so a claim pops k entries instead of scanning all of
+        # them. available_at is created_at until a retry is scheduled, then
+        # next_attempt_at; entries whose key no longer matches __queued are
+        # stale and skipped.
+        self.__claimable: List[Tuple[datetime, UUID]] = []
+        self.__queued: Dict[UUID, datetime] = {}
+        self.__lease_expired: Set[UUID] = set()
+        self.__leases: List[Tuple[float, UUID]] = []
+        self.__lease_expiry: Dict[UUID, float] = {}
+        # Sorted (updated_at, id) of the IN_PROGRESS notifications, the
+        # index find_stale_in_progress pages through, so a page costs a
+        # bisect and a slice instead of a scan of every notification.
+        self.__in_progress: List[Tuple[datetime, UUID]] = []
+        self.__in_progress_keys: Dict[UUID, Tuple[datetime, UUID]] = {}
+        self.__outbox: Dict[UUID, Message] = {}
+        self.__lock = threading.RLock()
+
+    def get(self, notification_id: UUID) -> Notification:
+        with self.__lock:
+            if notification_id not in self.__notifications:
+                raise NotificationNotFound
+            return copy(self.__notifications[notification_id])
+
+    def insert(self, notification: Notification) -> None:
+        with self.__lock:
+            self.__store(notification=notification)
+
+    def insert_with_outbox(
+        self, notification: Notification, message: Message
+    ) -> None:
+        with self.__lock:
+            self.__store(notification=notification)
+            self.__outbox[message.message_header.message_id] = message
+
+    def insert_many_with_outbox(
+        self, notifications: List[Notification], messages: List[Message]
+    ) -> None:
+        with self.__lock:
+            for notification in notifications:
+                self.__store(notification=notification)
+            for message in messages:
+                self.__outbox[message.message_header.message_id] = message
+
+    def get_unpublished(self, limit: int) -> List[Message]:
+        with self.__lock:
+            return list(islice(self.__outbox.values(), limit))
+
+    def mark_published(self, message_ids: List[UUID]) -> None:
+        with self.__lock:
+            for message_id in message_ids:
+                self.__outbox.pop(message_id, None)
+
+    def update(self, notification: Notification) -> None:
+        with self.__lock:
+            if notification.id not in self.__notifications:
+                raise NotificationNotFound
+            self.__store(notification=notification)
+
+    def insert_many(self, notifications: List[Notification]) -> None:
+        with self.__lock:
+            for notification in notifications:
+                self.insert(notification=notification)
+
+    def update_many(self, notifications: List[Notification]) -> None:
+        with self.__lock:
+            for notification in notifications:
+                if notification.id not in self.__notifications:
+                    raise NotificationNotFound
+            for notification in notifications:
+                self.__store(notification=notification)
+
+    def claim_pending(
+        self, limit: int, lease_seconds: float
+    ) -> List[Notification]:
+        with self.__lock:
+            now = self.__clock()
+            self.__requeue_expired_leases(now=now)
+
+            due_at = datetime.now()
+            claimed: List[Notification] = []
+            while self.__claimable and len(claimed) < limit:
+                available_at, notification_id = self.__claimable[0]
+                if self.__queued.get(notification_id) != available_at:
+                    heapq.heappop(self.__claimable)
+                    continue
+                if available_at > due_at:
+                    break
+                heapq.heappop(self.__claimable)
+                del self.__queued[notification_id]
+                notification = self.__notifications[notification_id]
+                if notification.is_pending:
+                    notification.set_in_progress()
+                    self.__index_in_progress(notification=notification)
+                elif notification_id in self.__lease_expired:
+                    self.__lease_expired.discard(notification_id)
+                else:
+                    continue
+                expires_at = now + lease_seconds
+                self.__lease_expiry[notification_id] = expires_at
+                heapq.heappush(self.__leases, (expires_at, notification_id))
+                claimed.append(copy(notification))
+            return claimed
+
+    def find_stale_in_progress(
+        self,
+        updated_before: datetime,
+        limit: int,
+        after: Optional[NotificationCursor] = None,
+    ) -> NotificationPage:
+        # Keyset pagination on (updated_at, id), as a database index would.
+        lower_bound = (
+            (after.updated_at, after.notification_id) if after else None
+        )
+        with self.__lock:
+            start = (
+                bisect_right(self.__in_progress, lower_bound)
+                if lower_bound is not None
+                else 0
+            )
+            # (updated_before,) sorts before every key at updated_before.
+            end = bisect_left(self.__in_progress, (updated_before,))
+            keys = self.__in_progress[start : min(end, start + limit + 1)]
+            notifications = [
+                copy(self.__notifications[notification_id])
+                for _, notification_id in keys[:limit]
+            ]
+        next_cursor = None
+        if len(keys) > limit:
+            last = notifications[-1]
+            next_cursor = NotificationCursor(
+                updated_at=last.updated_at, notification_id=last.id
+            )
+        return NotificationPage(
+            notifications=notifications, next_cursor=next_cursor
+        )
+
+    def __store(self, notification: Notification) -> None:
+        stored = copy(notification)
+        self.__notifications[stored.id] = stored
+        if not stored.is_in_progress:
+            self.__lease_expiry.pop(stored.id, None)
+            self.__lease_expired.discard(stored.id)
+        if stored.is_pending:
+            self.__enqueue(notification=stored)
+        self.__index_in_progress(notification=stored)
+
+    def __index_in_progress(self, notification: Notification) -> None:
+        key = self.__in_progress_keys.get(notification.id)
+        new_key = (
+            (notification.updated_at, notification.id)
+            if notification.is_in_progress
+            else None
+        )
+        if key == new_key:
+            return
+        if key is not None:
+            del self.__in_progress[bisect_left(self.__in_progress, key)]
+            del self.__in_progress_keys[notification.id]
+        if new_key is not None:
+            insort(self.__in_progress, new_key)
+            self.__in_progress_keys[notification.id] = new_key
+
+    def __enqueue(self, notification: Notification) -> None:
+        available_at = notification.available_at
+        if self.__queued.get(notification.id) == available_at:
+            return
+        self.__queued[notification.id] = available_at
+        heapq.heappush(self.__claimable, (available_at, notification.id))
+
+    def __requeue_expired_leases(self, now: float) -> None:
+        # Leases are dropped lazily: a heap entry only counts if it still
+        # matches the current expiry of an IN_PROGRESS notification.
+        while self.__leases and self.__leases[0][0] <= now:
+            expires_at, notification_id = heapq.heappop(self.__leases)
+            if self.__lease_expiry.get(notification_id) != expires_at:
+                continue
+            del self.__lease_expiry[notification_id]
+            notification = self.__notifications[notification_id]
+            if notification.is_in_progress:
+                self.__lease_expired.add(notification_id)
+                self.__enqueue(notification=notification)
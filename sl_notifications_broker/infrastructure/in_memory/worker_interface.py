@@ -0,0 +1,49 @@
+import random
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerInterfacePort,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class InMemoryWorkerInterface(WorkerInterfacePort):
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        failing_worker_ids: Optional[Iterable[UUID]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.__latency = latency
+        self.__failure_rate = failure_rate
+        self.__failing_worker_ids = set(failing_worker_ids or ())
+        self.__random = random.Random(seed)
+        self.__delivered: List[Tuple[UUID, UUID]] = []
+        self.__lock = threading.Lock()
+
+    @property
+    def delivered(self) -> List[Tuple[UUID, UUID]]:
+        with self.__lock:
+            return list(self.__delivered)
+
+    def process_notification(
+        self,
+        worker: Worker,
+        notification: Notification,
+    ) -> None:
+        if self.__latency:
+            time.sleep(self.__latency)
+        with self.__lock:
+            failed = worker.id in self.__failing_worker_ids or (
+                self.__random.random() < self.__failure_rate
+            )
+            if not failed:
+                self.__delivered.append((worker.id, notification.id))
+        if failed:
+            raise WorkerCommunicationFailure
@@ -0,0 +1,107 @@
+import threading
+from copy import copy
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.worker import Worker
+
+
+class InMemoryWorkerRepository(WorkerRepositoryPort):
+    def __init__(self) -> None:
+        self.__workers: Dict[UUID, Worker] = {}
+        self.__lock = threading.Lock()
+
+    def get_all(self) -> List[Worker]:
+        with self.__lock:
+            return [copy(worker) for worker in self.__workers.values()]
+
+    def get(self, worker_uuid: UUID) -> Worker:
+        with self.__lock:
+            if worker_uuid not in self.__workers:
+                raise WorkerNotFound
+            return copy(self.__workers[worker_uuid])
+
+    def insert(self, worker: Worker) -> None:
+        with self.__lock:
+            self.__workers[worker.id] = copy(worker)
+
+    def update(self, worker: Worker) -> None:
+        with self.__lock:
+            if worker.id not in self.__workers:
+                raise WorkerNotFound
+            self.__workers[worker.id] = copy(worker)
+
+    def update_many(self, workers: List[Worker]) -> None:
+        with self.__lock:
+            for worker in workers:
+                if worker.id not in self.__workers:
+                    raise WorkerNotFound
+            for worker in workers:
+                self.__workers[worker.id] = copy(worker)
+
+    def record_circuit_failure(
+        self, worker_uuid: UUID, failure_threshold: int
+    ) -> Worker:
+        return self.__change(
+            worker_uuid=worker_uuid,
+            change=lambda worker: worker.record_failure(
+                failure_threshold=failure_threshold
+            ),
+        )
+
+    def record_circuit_success(self, worker_uuid: UUID) -> Worker:
+        return self.__change(
+            worker_uuid=worker_uuid,
+            change=lambda worker: worker.record_success(),
+        )
+
+    def half_open_circuit(
+        self, worker_uuid: UUID, reset_timeout: timedelta
+    ) -> Worker:
+        return self.__change(
+            worker_uuid=worker_uuid,
+            change=lambda worker: worker.try_half_open(
+                reset_timeout=reset_timeout
+            ),
+        )
+
+    def record_heartbeats(
+        self, heartbeats: Dict[UUID, datetime]
+    ) -> List[Worker]:
+        stored = []
+        with self.__lock:
+            for worker_uuid, heartbeat_at in heartbeats.items():
+                worker = self.__workers.get(worker_uuid)
+                if worker is None:
+                    continue
+                # A late flush must not move the last heartbeat backwards.
+                worker.heartbeat(at=max(heartbeat_at, worker.updated_at))
+                stored.append(copy(worker))
+        return stored
+
+    def mark_offline(
+        self, worker_uuid: UUID, last_seen_before: datetime
+    ) -> Optional[Worker]:
+        with self.__lock:
+            if worker_uuid not in self.__workers:
+                raise WorkerNotFound
+            worker = self.__workers[worker_uuid]
+            if not worker.is_online or worker.updated_at >= last_seen_before:
+                return None
+            worker.set_offline()
+            return copy(worker)
+
+    def __change(
+        self, worker_uuid: UUID, change: Callable[[Worker], object]
+    ) -> Worker:
+        with self.__lock:
+            if worker_uuid not in self.__workers:
+                raise WorkerNotFound
+            worker = self.__workers[worker_uuid]
+            change(worker)
+            return copy(worker)
@@ -0,0 +1,341 @@
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sl_notifications_broker.domain.codecs.notification_codec import (
+    NotificationCodec,
+)
+from sl_notifications_broker.domain.entities.notification import Notification
+
+ShardKey = Callable[[Notification], UUID]
+# Called once inside each shard process with the shard index. It returns the
+# shard's own ProcessNotification, typically built on a
+# CachingWorkerRepository so every shard keeps its own worker cache. Under
+# the spawn start method it must be picklable, e.g. a module level function
+# or a functools.partial of one.
+ProcessNotificationFactory = Callable[[int], Callable[[Notification], object]]
+
+
+class ProcessingEngineStopped(Exception):
+    pass
+
+
+class ShardFailed(Exception):
+    # Shard processes that died; the notifications were not handed to them.
+    def __init__(
+        self, shards: List[int], notifications: List[Notification]
+    ) -> None:
+        super().__init__(shards)
+        self.shards = shards
+        self.notifications = notifications
+
+
+@dataclass(frozen=True)
+class ShardReport:
+    shard: int
+    processed: int
+    failed: int
+    skipped: int
+    # False when the shard died or missed the shutdown timeout. What was
+    # still queued for it comes back in unprocessed; a batch it was working
+    # on is left to RecoverStaleNotifications.
+    drained: bool = True
+    unprocessed: Tuple[Notification, ...] = ()
+
+
+def by_recipient(notification: Notification) -> UUID:
+    return notification.to.second_life_uuid
+
+
+def by_notification_id(notification: Notification) -> UUID:
+    return notification.id
+
+
+def shard_for(key: UUID, shards: int) -> int:
+    # UUID.int is the same in every process, unlike hash() of a str under
+    # hash randomization.
+    return key.int % shards
+
+
+def _run_shard(
+    shard: int,
+    process_notification_factory: ProcessNotificationFactory,
+    inbox: multiprocessing.Queue,
+    reports: multiprocessing.Queue,
+    recently_processed: int,
+) -> None:
+    # Ctrl-C reaches the whole process group; the parent owns shutdown and
+    # drains the shards through their inboxes instead.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    process_notification = process_notification_factory(shard)
+    codec = NotificationCodec()
+    seen: "OrderedDict[Tuple[UUID, int, datetime], None]" = OrderedDict()
+    processed = failed = skipped = 0
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+        for notification in codec.decode_many(batch):
+            # The shard owns every notification routed to it, so a
+            # resubmitted notification can only show up here again. Keyed
+            # on the version: a retry, a deferral or a requeue changes
+            # attempts or updated_at and is processed again.
+            version = (
+                notification.id,
+                notification.attempts,
+                notification.updated_at,
+            )
+            if version in seen:
+                skipped += 1
+                continue
+            try:
+                process_notification(notification)
+                processed += 1
+            except Exception:
+                logging.getLogger().exception(
+                    "Shard %s failed to process %r", shard, notification
+                )
+                failed += 1
+                continue
+            seen[version] = None
+            if len(seen) > recently_processed:
+                seen.popitem(last=False)
+    reports.put(
+        ShardReport(
+            shard=shard, processed=processed, failed=failed, skipped=skipped
+        )
+    )
+
+
+class ShardedProcessingEngine:
+    # How often blocking waits look up whether the shard is still alive.
+    __POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        process_notification_factory: ProcessNotificationFactory,
+        shards: Optional[int] = None,
+        shard_key: ShardKey = by_recipient,
+        queue_size: int = 1024,
+        recently_processed: int = 10_000,
+        start_method: Optional[str] = None,
+    ) -> None:
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.__process_notification_factory = process_notification_factory
+        self.__shards = shards
+        self.__shard_key = shard_key
+        self.__queue_size = queue_size
+        self.__recently_processed = recently_processed
+        self.__context = multiprocessing.get_context(start_method)
+        self.__codec = NotificationCodec()
+        self.__inboxes: List[multiprocessing.Queue] = []
+        self.__processes: List[multiprocessing.Process] = []
+        self.__reports: Optional[multiprocessing.Queue] = None
+
+    @property
+    def shards(self) -> int:
+        return self.__shards
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self.__processes)
+
+    def shard_of(self, notification: Notification) -> int:
+        return shard_for(self.__shard_key(notification), self.__shards)
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self.__reports = self.__context.Queue()
+        # Each inbox is FIFO and read by a single process, which is what
+        # keeps per-recipient ordering when sharding by recipient.
+        self.__inboxes = [
+            self.__context.Queue(maxsize=self.__queue_size)
+            for _ in range(self.__shards)
+        ]
+        for shard, inbox in enumerate(self.__inboxes):
+            process = self.__context.Process(
+                target=_run_shard,
+                args=(
+                    shard,
+                    self.__process_notification_factory,
+                    inbox,
+                    self.__reports,
+                    self.__recently_processed,
+                ),
+                name=f"notification-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            self.__processes.append(process)
+
+    def submit(self, notification: Notification) -> int:
+        shard = self.shard_of(notification)
+        self.__put(shard=shard, notifications=[notification])
+        return shard
+
+    def submit_many(self, notifications: Iterable[Notification]) -> None:
+        # One encoded batch per shard keeps pickling and pipe writes per
+        # call, not per notification. Live shards still get their batch
+        # when another shard has died.
+        by_shard: Dict[int, List[Notification]] = defaultdict(list)
+        for notification in notifications:
+            by_shard[self.shard_of(notification)].append(notification)
+        failed_shards: List[int] = []
+        rejected: List[Notification] = []
+        for shard, shard_notifications in by_shard.items():
+            try:
+                self.__put(shard=shard, notifications=shard_notifications)
+            except ShardFailed:
+                failed_shards.append(shard)
+                rejected.extend(shard_notifications)
+        if failed_shards:
+            raise ShardFailed(shards=failed_shards, notifications=rejected)
+
+    def shutdown(self, timeout: Optional[float] = None) -> List[ShardReport]:
+        if not self.is_running:
+            return []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # The sentinel queues up behind everything already submitted, so
+        # each shard drains its in-flight notifications before it reports.
+        for shard in range(self.__shards):
+            try:
+                self.__put_payload(shard=shard, payload=None, deadline=deadline)
+            except (ShardFailed, queue.Full):
+                pass
+        reports = self.__collect_reports(deadline=deadline)
+        for process in self.__processes:
+            process.join(timeout=self.__remaining(deadline))
+            if process.is_alive():
+                logging.getLogger().error(
+                    "%s did not drain in time, terminating", process.name
+                )
+                process.terminate()
+                process.join()
+        for shard in range(self.__shards):
+            if shard not in reports:
+                reports[shard] = self.__undrained_report(shard=shard)
+        self.__processes = []
+        self.__inboxes = []
+        return [reports[shard] for shard in range(self.__shards)]
+
+    def __collect_reports(
+        self, deadline: Optional[float]
+    ) -> Dict[int, ShardReport]:
+        # Waits in short slices so that a dead shard, which will never
+        # report, ends the wait instead of blocking it forever.
+        reports: Dict[int, ShardReport] = {}
+        while len(reports) < self.__shards:
+            remaining = self.__remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                report = self.__reports.get(
+                    timeout=min(self.__POLL_INTERVAL, remaining)
+                    if remaining is not None
+                    else self.__POLL_INTERVAL
+                )
+                reports[report.shard] = report
+                continue
+            except queue.Empty:
+                pass
+            alive = [
+                shard
+                for shard, process in enumerate(self.__processes)
+                if shard not in reports and process.is_alive()
+            ]
+            if not alive:
+                # A shard that exited cleanly has flushed its report.
+                while True:
+                    try:
+                        report = self.__reports.get(timeout=0)
+                    except queue.Empty:
+                        break
+                    reports[report.shard] = report
+                break
+        return reports
+
+    def __undrained_report(self, shard: int) -> ShardReport:
+        unprocessed: List[Notification] = []
+        while True:
+            try:
+                payload = self.__inboxes[shard].get(timeout=0)
+            except (queue.Empty, OSError, ValueError):
+                break
+            if payload is not None:
+                unprocessed.extend(self.__codec.decode_many(payload))
+        logging.getLogger().error(
+            "Shard %s exited with %s before draining, %s notifications "
+            "returned unprocessed",
+            shard,
+            self.__processes[shard].exitcode,
+            len(unprocessed),
+        )
+        return ShardReport(
+            shard=shard,
+            processed=0,
+            failed=0,
+            skipped=0,
+            drained=False,
+            unprocessed=tuple(unprocessed),
+        )
+
+    def __put(self, shard: int, notifications: List[Notification]) -> None:
+        if not self.is_running:
+            raise ProcessingEngineStopped
+        # A full inbox blocks the caller: backpressure instead of unbounded
+        # buffering in front of a slow shard, but never in front of a dead
+        # one.
+        try:
+            self.__put_payload(
+                shard=shard,
+                payload=self.__codec.encode_many(notifications),
+                deadline=None,
+            )
+        except ShardFailed as error:
+            raise ShardFailed(
+                shards=error.shards, notifications=notifications
+            ) from None
+
+    def __put_payload(
+        self, shard: int, payload: Optional[bytes], deadline: Optional[float]
+    ) -> None:
+        process = self.__processes[shard]
+        while True:
+            if not process.is_alive():
+                raise ShardFailed(shards=[shard], notifications=[])
+            remaining = self.__remaining(deadline)
+            timeout = self.__POLL_INTERVAL
+            if remaining is not None:
+                if remaining <= 0:
+                    raise queue.Full
+                timeout = min(timeout, remaining)
+            try:
+                self.__inboxes[shard].put(payload, timeout=timeout)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def __remaining(deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def __enter__(self) -> "ShardedProcessingEngine":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
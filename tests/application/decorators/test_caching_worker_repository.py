@@ -0,0 +1,168 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.caching_worker_repository import (
+    CachingWorkerRepository,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.worker import WorkerStatus
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestCachingWorkerRepository(TestCase):
+    def setUp(self) -> None:
+        self.workers = [get_worker_fixture() for _ in range(3)]
+        self.worker_repository_mock = Mock(spec=WorkerRepositoryPort)
+        self.worker_repository_mock.get_all.return_value = self.workers
+        self.clock = FakeClock()
+        self.repository = CachingWorkerRepository(
+            worker_repository=self.worker_repository_mock,
+            ttl=10,
+            clock=self.clock,
+        )
+        super().setUp()
+
+    def test_get_all_is_cached_until_ttl_expires(self):
+        self.assertEqual(self.workers, self.repository.get_all())
+        self.assertEqual(self.workers, self.repository.get_all())
+        self.worker_repository_mock.get_all.assert_called_once_with()
+
+        self.clock.now = 10
+
+        self.repository.get_all()
+        self.assertEqual(2, self.worker_repository_mock.get_all.call_count)
+
+    def test_get_all_returns_a_copy_of_the_cached_list(self):
+        self.repository.get_all().clear()
+
+        self.assertEqual(self.workers, self.repository.get_all())
+
+    def test_invalidate_forces_reload(self):
+        self.repository.get_all()
+
+        self.repository.invalidate()
+        self.repository.get_all()
+
+        self.assertEqual(2, self.worker_repository_mock.get_all.call_count)
+
+    def test_insert_adds_worker_to_cache_in_place(self):
+        self.repository.get_all()
+        worker = get_worker_fixture()
+
+        self.repository.insert(worker=worker)
+
+        self.worker_repository_mock.insert.assert_called_once_with(
+            worker=worker
+        )
+        self.assertEqual(self.workers + [worker], self.repository.get_all())
+        self.worker_repository_mock.get_all.assert_called_once_with()
+
+    def test_update_replaces_cached_worker_in_place(self):
+        self.repository.get_all()
+        updated_worker = get_worker_fixture(
+            {
+                "worker_uuid": self.workers[1].id,
+                "worker_status": WorkerStatus.OFFLINE,
+            }
+        )
+
+        self.repository.update(worker=updated_worker)
+
+        actual = self.repository.get_all()
+        self.assertEqual(updated_worker, actual[1])
+        self.assertFalse(actual[1].is_online)
+        self.worker_repository_mock.get_all.assert_called_once_with()
+
+    def test_record_circuit_failure_caches_the_stored_worker(self):
+        self.repository.get_all()
+        stored = get_worker_fixture({"worker_uuid": self.workers[1].id})
+        stored.record_failure(failure_threshold=1)
+        self.worker_repository_mock.record_circuit_failure.return_value = stored
+
+        actual = self.repository.record_circuit_failure(
+            worker_uuid=stored.id, failure_threshold=1
+        )
+
+        self.assertIs(stored, actual)
+        self.assertEqual(1, self.repository.get_all()[1].failure_count)
+        self.worker_repository_mock.get_all.assert_called_once_with()
+
+    def test_concurrent_misses_trigger_a_single_load(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get_all():
+            started.set()
+            release.wait(timeout=2)
+            return self.workers
+
+        self.worker_repository_mock.get_all.side_effect = slow_get_all
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(self.repository.get_all) for _ in range(8)
+            ]
+            started.wait(timeout=2)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.worker_repository_mock.get_all.assert_called_once_with()
+        self.assertTrue(all(result == self.workers for result in results))
+
+    def test_load_failure_is_raised_and_not_cached(self):
+        self.worker_repository_mock.get_all.side_effect = [
+            Exception,
+            self.workers,
+        ]
+
+        with self.assertRaises(Exception):
+            self.repository.get_all()
+
+        self.assertEqual(self.workers, self.repository.get_all())
+
+    def test_get_is_served_from_fresh_cache(self):
+        self.repository.get_all()
+
+        actual = self.repository.get(worker_uuid=self.workers[0].id)
+
+        self.assertEqual(self.workers[0], actual)
+        self.worker_repository_mock.get.assert_not_called()
+
+    def test_cached_workers_only_change_through_writes(self):
+        self.repository.get_all()[0].set_offline()
+        self.repository.get(worker_uuid=self.workers[1].id).record_failure(
+            failure_threshold=1
+        )
+
+        actual = self.repository.get_all()
+
+        self.assertTrue(actual[0].is_online)
+        self.assertEqual(0, actual[1].failure_count)
+        self.assertTrue(self.workers[0].is_online)
+
+    def test_get_when_cache_is_cold(self):
+        self.worker_repository_mock.get.return_value = self.workers[0]
+
+        actual = self.repository.get(worker_uuid=self.workers[0].id)
+
+        self.assertIs(self.workers[0], actual)
+        self.worker_repository_mock.get.assert_called_once_with(
+            worker_uuid=self.workers[0].id
+        )
+
+    def test_update_many_patches_cache_in_place(self):
+        self.repository.get_all()
+        self.workers[0].set_offline()
+
+        self.repository.update_many(workers=[self.workers[0]])
+
+        self.worker_repository_mock.update_many.assert_called_once_with(
+            workers=[self.workers[0]]
+        )
+        self.assertFalse(self.repository.get_all()[0].is_online)
+        self.worker_repository_mock.get_all.assert_called_once_with()
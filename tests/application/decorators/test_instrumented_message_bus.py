@@ -0,0 +1,37 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.instrumented_message_bus import (
+    InstrumentedMessageBus,
+)
+from sl_notifications_broker.domain.events.notification_created_event import (
+    NotificationCreatedEvent,
+)
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    MessageBusPort,
+)
+from sl_notifications_broker.infrastructure.in_memory.metrics_sink import (
+    InMemoryMetricsSink,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestInstrumentedMessageBus(TestCase):
+    def test_publish_is_delegated_and_counted(self):
+        message_bus_mock = Mock(spec=MessageBusPort)
+        metrics_sink = InMemoryMetricsSink()
+        message_bus = InstrumentedMessageBus(
+            message_bus=message_bus_mock, metrics_sink=metrics_sink
+        )
+        event = NotificationCreatedEvent.factory(
+            notification=get_notification_fixture()
+        )
+
+        message_bus.publish(message=event)
+        message_bus.publish_many(messages=[event, event])
+
+        message_bus_mock.publish.assert_called_once_with(message=event)
+        self.assertEqual(1, metrics_sink.counter("message_bus.publish.calls"))
+        self.assertEqual(
+            [2], metrics_sink.histogram("message_bus.publish_many.batch_size")
+        )
@@ -0,0 +1,76 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.instrumented_notification_repository import (
+    InstrumentedNotificationRepository,
+)
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationNotFound,
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.infrastructure.in_memory.metrics_sink import (
+    InMemoryMetricsSink,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestInstrumentedNotificationRepository(TestCase):
+    def setUp(self) -> None:
+        self.notification_repository_mock = Mock(
+            spec=NotificationRepositoryPort
+        )
+        self.metrics_sink = InMemoryMetricsSink()
+        self.repository = InstrumentedNotificationRepository(
+            notification_repository=self.notification_repository_mock,
+            metrics_sink=self.metrics_sink,
+        )
+        super().setUp()
+
+    def test_insert_is_delegated_and_counted(self):
+        notification = get_notification_fixture()
+
+        self.repository.insert(notification=notification)
+
+        self.notification_repository_mock.insert.assert_called_once_with(
+            notification=notification
+        )
+        self.assertEqual(
+            1, self.metrics_sink.counter("notification_repository.insert.calls")
+        )
+
+    def test_update_many_records_batch_size(self):
+        notifications = [get_notification_fixture() for _ in range(3)]
+
+        self.repository.update_many(notifications=notifications)
+
+        self.assertEqual(
+            [3],
+            self.metrics_sink.histogram(
+                "notification_repository.update_many.batch_size"
+            ),
+        )
+
+    def test_get_returns_result_and_counts_errors(self):
+        notification = get_notification_fixture()
+        self.notification_repository_mock.get.side_effect = [
+            notification,
+            NotificationNotFound,
+        ]
+
+        self.assertEqual(
+            notification,
+            self.repository.get(notification_id=notification.id),
+        )
+        with self.assertRaises(NotificationNotFound):
+            self.repository.get(notification_id=notification.id)
+
+        self.assertEqual(
+            2, self.metrics_sink.counter("notification_repository.get.calls")
+        )
+        self.assertEqual(
+            1,
+            self.metrics_sink.counter(
+                "notification_repository.get.errors",
+                tags={"error": "NotificationNotFound"},
+            ),
+        )
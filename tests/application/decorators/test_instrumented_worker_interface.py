@@ -0,0 +1,41 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.instrumented_worker_interface import (
+    InstrumentedWorkerInterface,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerInterfacePort,
+)
+from sl_notifications_broker.infrastructure.in_memory.metrics_sink import (
+    InMemoryMetricsSink,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestInstrumentedWorkerInterface(TestCase):
+    def test_process_notification_counts_failures(self):
+        worker_interface_mock = Mock(spec=WorkerInterfacePort)
+        worker_interface_mock.process_notification.side_effect = (
+            WorkerCommunicationFailure
+        )
+        metrics_sink = InMemoryMetricsSink()
+        worker_interface = InstrumentedWorkerInterface(
+            worker_interface=worker_interface_mock, metrics_sink=metrics_sink
+        )
+
+        with self.assertRaises(WorkerCommunicationFailure):
+            worker_interface.process_notification(
+                worker=get_worker_fixture(),
+                notification=get_notification_fixture(),
+            )
+
+        self.assertEqual(
+            1,
+            metrics_sink.counter(
+                "worker_interface.process_notification.errors",
+                tags={"error": "WorkerCommunicationFailure"},
+            ),
+        )
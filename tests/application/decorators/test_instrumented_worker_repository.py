@@ -0,0 +1,34 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.instrumented_worker_repository import (
+    InstrumentedWorkerRepository,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.infrastructure.in_memory.metrics_sink import (
+    InMemoryMetricsSink,
+)
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestInstrumentedWorkerRepository(TestCase):
+    def test_get_all_is_delegated_and_timed(self):
+        workers = [get_worker_fixture()]
+        worker_repository_mock = Mock(spec=WorkerRepositoryPort)
+        worker_repository_mock.get_all.return_value = workers
+        metrics_sink = InMemoryMetricsSink()
+        repository = InstrumentedWorkerRepository(
+            worker_repository=worker_repository_mock,
+            metrics_sink=metrics_sink,
+        )
+
+        self.assertEqual(workers, repository.get_all())
+
+        self.assertEqual(
+            1, metrics_sink.counter("worker_repository.get_all.calls")
+        )
+        self.assertEqual(
+            1, len(metrics_sink.histogram("worker_repository.get_all.seconds"))
+        )
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.port_instrumentation import (
+    PortInstrumentation,
+)
+from sl_notifications_broker.application.ports.metrics_sink_port import (
+    MetricsSinkPort,
+    NoOpMetricsSink,
+)
+from sl_notifications_broker.infrastructure.in_memory.metrics_sink import (
+    InMemoryMetricsSink,
+)
+
+
+class TestPortInstrumentation(TestCase):
+    def setUp(self) -> None:
+        self.metrics_sink = InMemoryMetricsSink()
+        self.instrumentation = PortInstrumentation(
+            metrics_sink=self.metrics_sink, prefix="port"
+        )
+        super().setUp()
+
+    def test_call_records_count_and_duration(self):
+        actual = self.instrumentation.call("method", lambda: 42)
+
+        self.assertEqual(42, actual)
+        self.assertEqual(1, self.metrics_sink.counter("port.method.calls"))
+        self.assertEqual(
+            1, len(self.metrics_sink.histogram("port.method.seconds"))
+        )
+        self.assertEqual([], self.metrics_sink.histogram("port.method.errors"))
+
+    def test_call_records_errors_by_type(self):
+        def fail():
+            raise KeyError
+
+        with self.assertRaises(KeyError):
+            self.instrumentation.call("method", fail)
+
+        self.assertEqual(
+            1,
+            self.metrics_sink.counter(
+                "port.method.errors", tags={"error": "KeyError"}
+            ),
+        )
+        self.assertEqual(
+            1, len(self.metrics_sink.histogram("port.method.seconds"))
+        )
+
+    def test_call_records_batch_size(self):
+        self.instrumentation.call("method", lambda: None, batch_size=3)
+
+        self.assertEqual(
+            [3], self.metrics_sink.histogram("port.method.batch_size")
+        )
+
+    def test_call_when_sink_is_disabled(self):
+        metrics_sink_mock = Mock(spec=MetricsSinkPort)
+        metrics_sink_mock.enabled = False
+        instrumentation = PortInstrumentation(
+            metrics_sink=metrics_sink_mock, prefix="port"
+        )
+
+        self.assertEqual(42, instrumentation.call("method", lambda: 42))
+
+        metrics_sink_mock.increment.assert_not_called()
+        metrics_sink_mock.observe.assert_not_called()
+        self.assertFalse(NoOpMetricsSink().enabled)
@@ -0,0 +1,133 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.rate_limited_worker_interface import (
+    RateLimitedWorkerInterface,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    RecipientRateLimited,
+    WorkerInterfacePort,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.services.token_buckets import (
+    TokenBuckets,
+)
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestRateLimitedWorkerInterface(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.sleeps = []
+        self.worker_interface_mock = Mock(spec=WorkerInterfacePort)
+        self.worker = get_worker_fixture()
+        self.notification = get_notification_fixture()
+        super().setUp()
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.clock.now += seconds
+
+    def get_interface(self, max_wait: float = 0.0, **limiters):
+        return RateLimitedWorkerInterface(
+            worker_interface=self.worker_interface_mock,
+            max_wait=max_wait,
+            clock=self.clock,
+            sleep=self.sleep,
+            **limiters,
+        )
+
+    def test_process_notification_when_recipient_is_throttled(self):
+        interface = self.get_interface(
+            recipient_limiter=TokenBuckets(rate=1, burst=1)
+        )
+        interface.process_notification(
+            worker=self.worker, notification=self.notification
+        )
+
+        with self.assertRaises(WorkerRateLimited):
+            interface.process_notification(
+                worker=self.worker, notification=self.notification
+            )
+        interface.process_notification(
+            worker=self.worker, notification=get_notification_fixture()
+        )
+
+        self.assertEqual(
+            2, self.worker_interface_mock.process_notification.call_count
+        )
+
+    def test_process_notification_when_worker_is_throttled(self):
+        interface = self.get_interface(
+            worker_limiter=TokenBuckets(rate=1, burst=1)
+        )
+        interface.process_notification(
+            worker=self.worker, notification=self.notification
+        )
+
+        with self.assertRaises(WorkerRateLimited):
+            interface.process_notification(
+                worker=self.worker, notification=get_notification_fixture()
+            )
+        interface.process_notification(
+            worker=get_worker_fixture(), notification=self.notification
+        )
+
+    def test_process_notification_waits_up_to_max_wait(self):
+        interface = self.get_interface(
+            max_wait=1.0, recipient_limiter=TokenBuckets(rate=2, burst=1)
+        )
+
+        for _ in range(3):
+            interface.process_notification(
+                worker=self.worker, notification=self.notification
+            )
+
+        self.assertEqual([0.5, 0.5], self.sleeps)
+        self.assertEqual(
+            3, self.worker_interface_mock.process_notification.call_count
+        )
+
+    def test_throttled_call_does_not_spend_other_tokens(self):
+        worker_limiter = TokenBuckets(rate=1, burst=1)
+        interface = self.get_interface(
+            recipient_limiter=TokenBuckets(rate=1, burst=1),
+            worker_limiter=worker_limiter,
+        )
+        interface.process_notification(
+            worker=self.worker, notification=self.notification
+        )
+        other_worker = get_worker_fixture()
+
+        with self.assertRaises(WorkerRateLimited):
+            interface.process_notification(
+                worker=other_worker, notification=self.notification
+            )
+
+        self.assertEqual(
+            0, worker_limiter.wait_time(key=other_worker.id, now=0)
+        )
+
+    def test_process_notification_reports_the_blocking_limit(self):
+        interface = self.get_interface(
+            recipient_limiter=TokenBuckets(rate=1, burst=1),
+            worker_limiter=TokenBuckets(rate=4, burst=1),
+        )
+        interface.process_notification(
+            worker=self.worker, notification=self.notification
+        )
+
+        with self.assertRaises(RecipientRateLimited) as recipient_limited:
+            interface.process_notification(
+                worker=get_worker_fixture(), notification=self.notification
+            )
+        with self.assertRaises(WorkerRateLimited) as worker_limited:
+            interface.process_notification(
+                worker=self.worker, notification=get_notification_fixture()
+            )
+
+        self.assertEqual(1.0, recipient_limited.exception.retry_after)
+        self.assertNotIsInstance(worker_limited.exception, RecipientRateLimited)
+        self.assertEqual(0.25, worker_limited.exception.retry_after)
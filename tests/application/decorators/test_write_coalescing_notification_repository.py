@@ -0,0 +1,210 @@
+import time
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.decorators.write_coalescing_notification_repository import (
+    WriteCoalescingNotificationRepository,
+)
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationStatus,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestWriteCoalescingNotificationRepository(TestCase):
+    def setUp(self) -> None:
+        self.notification_repository_mock = Mock(
+            spec=NotificationRepositoryPort
+        )
+        self.repository = WriteCoalescingNotificationRepository(
+            notification_repository=self.notification_repository_mock,
+            max_batch_size=3,
+            max_delay=60,
+        )
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.repository.close()
+        super().tearDown()
+
+    def test_update_is_buffered_until_flush(self):
+        notification = get_notification_fixture()
+
+        self.repository.update(notification=notification)
+
+        self.notification_repository_mock.update_many.assert_not_called()
+        self.assertEqual(1, self.repository.pending_writes)
+
+        self.repository.flush()
+
+        self.notification_repository_mock.update_many.assert_called_once_with(
+            notifications=[notification]
+        )
+        self.assertEqual(0, self.repository.pending_writes)
+
+    def test_transitions_of_same_notification_collapse_into_one_write(self):
+        notification = get_notification_fixture()
+
+        notification.set_in_progress()
+        self.repository.update(notification=notification)
+        notification.set_success()
+        self.repository.update(notification=notification)
+        self.repository.flush()
+
+        written = self.notification_repository_mock.update_many.call_args[1][
+            "notifications"
+        ]
+        self.assertEqual(1, len(written))
+        self.assertEqual(NotificationStatus.SUCCESS, written[0].status)
+
+    def test_update_after_insert_collapses_into_insert(self):
+        notification = get_notification_fixture()
+
+        self.repository.insert(notification=notification)
+        notification.set_in_progress()
+        self.repository.update(notification=notification)
+        self.repository.flush()
+
+        self.notification_repository_mock.insert_many.assert_called_once_with(
+            notifications=[notification]
+        )
+        self.notification_repository_mock.update_many.assert_not_called()
+
+    def test_flush_when_size_limit_is_reached(self):
+        notifications = [get_notification_fixture() for _ in range(3)]
+
+        self.repository.update_many(notifications=notifications)
+
+        self.notification_repository_mock.update_many.assert_called_once_with(
+            notifications=notifications
+        )
+
+    def test_flush_when_time_limit_is_reached(self):
+        repository = WriteCoalescingNotificationRepository(
+            notification_repository=self.notification_repository_mock,
+            max_batch_size=100,
+            max_delay=0.01,
+        )
+        notification = get_notification_fixture()
+
+        repository.update(notification=notification)
+        deadline = time.monotonic() + 2
+        while repository.pending_writes and time.monotonic() < deadline:
+            time.sleep(0.005)
+        repository.close()
+
+        self.notification_repository_mock.update_many.assert_called_once_with(
+            notifications=[notification]
+        )
+
+    def test_flush_failure_keeps_writes_buffered(self):
+        notification = get_notification_fixture()
+        self.notification_repository_mock.update_many.side_effect = [
+            Exception,
+            None,
+        ]
+        self.repository.update(notification=notification)
+
+        with self.assertRaises(Exception):
+            self.repository.flush()
+
+        self.assertEqual(1, self.repository.pending_writes)
+        self.repository.flush()
+        self.assertEqual(0, self.repository.pending_writes)
+
+    def test_flush_drops_updates_of_unknown_notifications(self):
+        notification_repository = InMemoryNotificationRepository()
+        notifications = [get_notification_fixture() for _ in range(3)]
+        notification_repository.insert_many(notifications=notifications)
+        repository = WriteCoalescingNotificationRepository(
+            notification_repository=notification_repository,
+            max_batch_size=10,
+            max_delay=60,
+        )
+        repository.update(notification=get_notification_fixture())
+        for notification in notifications:
+            notification.set_in_progress()
+            repository.update(notification=notification)
+
+        with self.assertLogs(level="ERROR"):
+            repository.flush()
+        repository.close()
+
+        self.assertEqual(0, repository.pending_writes)
+        for notification in notifications:
+            self.assertTrue(
+                notification_repository.get(
+                    notification_id=notification.id
+                ).is_in_progress
+            )
+
+    def test_close_flushes_pending_writes(self):
+        notification = get_notification_fixture()
+        self.repository.insert(notification=notification)
+
+        self.repository.close()
+
+        self.notification_repository_mock.insert_many.assert_called_once_with(
+            notifications=[notification]
+        )
+
+    def test_claim_pending_flushes_before_reading(self):
+        notification = get_notification_fixture()
+        self.repository.insert(notification=notification)
+        self.notification_repository_mock.claim_pending.return_value = [
+            notification
+        ]
+
+        actual = self.repository.claim_pending(limit=1, lease_seconds=30)
+
+        self.assertEqual([notification], actual)
+        self.notification_repository_mock.insert_many.assert_called_once_with(
+            notifications=[notification]
+        )
+
+    def test_find_stale_in_progress_flushes_before_reading(self):
+        notification = get_notification_fixture(
+            {"status": NotificationStatus.IN_PROGRESS}
+        )
+        self.repository.update(notification=notification)
+        updated_before = notification.updated_at
+
+        self.repository.find_stale_in_progress(
+            updated_before=updated_before, limit=10
+        )
+
+        self.notification_repository_mock.update_many.assert_called_once_with(
+            notifications=[notification]
+        )
+        find_stale = self.notification_repository_mock.find_stale_in_progress
+        find_stale.assert_called_once_with(
+            updated_before=updated_before, limit=10, after=None
+        )
+
+    def test_get_reads_buffered_writes(self):
+        notification = get_notification_fixture()
+        self.repository.insert(notification=notification)
+
+        actual = self.repository.get(notification_id=notification.id)
+
+        self.assertEqual(notification, actual)
+        self.assertIsNot(notification, actual)
+        self.notification_repository_mock.get.assert_not_called()
+        self.notification_repository_mock.insert_many.assert_not_called()
+
+    def test_get_delegates_when_nothing_is_buffered(self):
+        notification = get_notification_fixture()
+        self.notification_repository_mock.get.return_value = notification
+
+        actual = self.repository.get(notification_id=notification.id)
+
+        self.assertEqual(notification, actual)
+        self.notification_repository_mock.get.assert_called_once_with(
+            notification_id=notification.id
+        )
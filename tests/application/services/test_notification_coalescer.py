@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from sl_notifications_broker.application.services.notification_coalescer import (
+    NotificationCoalescer,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationMessage,
+    SecondLifeUser,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestNotificationCoalescer(TestCase):
+    def setUp(self) -> None:
+        self.created_at = datetime(2022, 1, 1)
+        self.recipient = get_notification_fixture().to
+        self.coalescer = NotificationCoalescer(
+            window=timedelta(seconds=5), max_notifications=3, max_body_length=20
+        )
+        super().setUp()
+
+    def get_notification(self, body="hi", seconds=0, recipient=None):
+        return get_notification_fixture(
+            {
+                "send_to": recipient or self.recipient,
+                "message": NotificationMessage(body=body),
+                "created_at": self.created_at + timedelta(seconds=seconds),
+            }
+        )
+
+    def test_coalesce_merges_bodies_per_recipient(self):
+        other = SecondLifeUser(
+            second_life_username="other",
+            second_life_uuid=get_notification_fixture().to.second_life_uuid,
+        )
+        first = self.get_notification(body="a", seconds=1)
+        second = self.get_notification(body="b", seconds=0)
+        alone = self.get_notification(body="c", recipient=other)
+
+        actual = self.coalescer.coalesce([first, alone, second])
+
+        self.assertEqual(2, len(actual))
+        self.assertEqual([second, first], actual[0].notifications)
+        self.assertEqual("b\na", actual[0].delivery.message.body)
+        self.assertEqual(self.recipient, actual[0].delivery.to)
+        self.assertIs(alone, actual[1].delivery)
+
+    def test_coalesce_respects_window_and_size_limits(self):
+        notifications = [
+            self.get_notification(seconds=0),
+            self.get_notification(seconds=1),
+            self.get_notification(seconds=2),
+            self.get_notification(seconds=3),
+            self.get_notification(seconds=10),
+            self.get_notification(body="x" * 19, seconds=10),
+        ]
+
+        actual = self.coalescer.coalesce(notifications)
+
+        self.assertEqual(
+            [3, 1, 1, 1], [len(group.notifications) for group in actual]
+        )
+
+    def test_merged_delivery_id_is_stable(self):
+        notifications = [self.get_notification() for _ in range(2)]
+
+        first = self.coalescer.coalesce(notifications)[0].delivery
+        second = self.coalescer.coalesce(notifications)[0].delivery
+
+        self.assertEqual(first.idempotency_key, second.idempotency_key)
+        self.assertNotIn(first, notifications)
@@ -0,0 +1,53 @@
+import logging
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.services.notification_outcome_recorder import (
+    NotificationOutcomeRecorder,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationStatus,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestNotificationOutcomeRecorder(TestCase):
+    def setUp(self) -> None:
+        self.notification_repository_mock = Mock(
+            spec=NotificationRepositoryPort
+        )
+        self.outcome_recorder = NotificationOutcomeRecorder(
+            notification_repository=self.notification_repository_mock
+        )
+        self.notification = get_notification_fixture(
+            {"status": NotificationStatus.IN_PROGRESS}
+        )
+        super().setUp()
+
+    def test_record_success_does_not_render_disabled_log_arguments(self):
+        logger = logging.getLogger()
+        level = logger.level
+        logger.setLevel(logging.INFO)
+        self.addCleanup(logger.setLevel, level)
+
+        with patch.object(Notification, "__repr__") as repr_mock:
+            self.outcome_recorder.record_success(
+                notification=self.notification, worker=get_worker_fixture()
+            )
+
+        repr_mock.assert_not_called()
+        self.assertTrue(self.notification.is_successful)
+
+    def test_record_failure_logs_notification(self):
+        with self.assertLogs(level=logging.ERROR) as logs:
+            self.outcome_recorder.record_failure(
+                notification=self.notification
+            )
+
+        self.assertIn(str(self.notification.id), logs.output[0])
+        self.assertIn("status=failed", logs.output[0])
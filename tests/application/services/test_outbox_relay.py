@@ -0,0 +1,56 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.services.outbox_relay import (
+    OutboxRelay,
+)
+from sl_notifications_broker.application.use_cases.relay_outbox import (
+    RelayOutbox,
+)
+
+
+class TestOutboxRelay(TestCase):
+    def test_relay_runs_in_background_until_stopped(self):
+        relayed = threading.Event()
+        relay_outbox_mock = Mock(spec=RelayOutbox)
+        relay_outbox_mock.batch_size = 10
+        relay_outbox_mock.side_effect = lambda: relayed.set() or 0
+        outbox_relay = OutboxRelay(
+            relay_outbox=relay_outbox_mock, poll_interval=0.01
+        )
+
+        outbox_relay.start()
+        self.assertTrue(relayed.wait(timeout=2))
+        outbox_relay.stop()
+
+        calls = relay_outbox_mock.call_count
+        self.assertGreaterEqual(calls, 1)
+        self.assertEqual(calls, relay_outbox_mock.call_count)
+
+    def test_relay_keeps_running_after_failure(self):
+        relayed = threading.Event()
+        relay_outbox_mock = Mock(spec=RelayOutbox)
+        relay_outbox_mock.batch_size = 10
+        relay_outbox_mock.side_effect = self.__failing_then(relayed)
+        outbox_relay = OutboxRelay(
+            relay_outbox=relay_outbox_mock, poll_interval=0.01
+        )
+
+        with self.assertLogs(level="ERROR"):
+            outbox_relay.start()
+            self.assertTrue(relayed.wait(timeout=2))
+            outbox_relay.stop()
+
+    @staticmethod
+    def __failing_then(relayed: threading.Event):
+        failed = threading.Event()
+
+        def relay():
+            if not failed.is_set():
+                failed.set()
+                raise Exception
+            relayed.set()
+            return 0
+
+        return relay
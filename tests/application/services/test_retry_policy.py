@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from sl_notifications_broker.application.services.retry_policy import (
+    RetryPolicy,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestRetryPolicy(TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2022, 1, 1)
+        super().setUp()
+
+    def test_delay_grows_exponentially_up_to_max_delay(self):
+        policy = RetryPolicy(
+            base_delay=timedelta(seconds=1),
+            max_delay=timedelta(seconds=10),
+            jitter=0,
+        )
+
+        actual = [policy.delay(attempts) for attempts in range(6)]
+
+        self.assertEqual([1, 2, 4, 8, 10, 10], actual)
+
+    def test_delay_with_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(
+            base_delay=timedelta(seconds=8), jitter=0.5, seed=1234
+        )
+
+        actual = {policy.delay(0) for _ in range(100)}
+
+        self.assertGreater(len(actual), 1)
+        self.assertTrue(all(4 <= delay <= 8 for delay in actual))
+
+    def test_delay_when_attempts_is_huge(self):
+        policy = RetryPolicy(max_delay=timedelta(seconds=10), jitter=0)
+
+        self.assertEqual(10, policy.delay(10 ** 6))
+
+    def test_next_attempt_at_when_attempts_remain(self):
+        policy = RetryPolicy(base_delay=timedelta(seconds=2), jitter=0)
+        notification = get_notification_fixture({"attempts": 1})
+
+        actual = policy.next_attempt_at(notification=notification, now=self.now)
+
+        self.assertEqual(self.now + timedelta(seconds=4), actual)
+
+    def test_next_attempt_at_when_attempts_are_exhausted(self):
+        policy = RetryPolicy(max_attempts=3)
+        notification = get_notification_fixture({"attempts": 2})
+
+        actual = policy.next_attempt_at(notification=notification, now=self.now)
+
+        self.assertIsNone(actual)
+
+    def test_init_when_arguments_are_invalid(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with self.assertRaises(ValueError):
+            RetryPolicy(jitter=1.5)
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from sl_notifications_broker.application.services.retry_policy import (
+    RetryPolicy,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationStatus,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestRetryScheduler(TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2022, 1, 1)
+        self.scheduler = RetryScheduler(
+            retry_policy=RetryPolicy(
+                max_attempts=3, base_delay=timedelta(seconds=10), jitter=0
+            ),
+            clock=lambda: self.now,
+        )
+        super().setUp()
+
+    def get_failed_attempt(self, attempts: int = 0):
+        return get_notification_fixture(
+            {"status": NotificationStatus.IN_PROGRESS, "attempts": attempts}
+        )
+
+    def test_schedule_requeues_notification_with_backoff(self):
+        notification = self.get_failed_attempt()
+
+        self.assertTrue(self.scheduler.schedule(notification=notification))
+
+        self.assertEqual(NotificationStatus.PENDING, notification.status)
+        self.assertEqual(1, notification.attempts)
+        self.assertEqual(
+            self.now + timedelta(seconds=10), notification.next_attempt_at
+        )
+        self.assertEqual(1, len(self.scheduler))
+
+    def test_schedule_when_attempts_are_exhausted(self):
+        notification = self.get_failed_attempt(attempts=2)
+
+        self.assertFalse(self.scheduler.schedule(notification=notification))
+
+        self.assertEqual(NotificationStatus.IN_PROGRESS, notification.status)
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_pop_due_returns_retries_in_due_order(self):
+        later = self.get_failed_attempt(attempts=1)
+        sooner = self.get_failed_attempt()
+        self.scheduler.schedule(notification=later)
+        self.scheduler.schedule(notification=sooner)
+
+        self.assertEqual([], self.scheduler.pop_due())
+        self.assertEqual(sooner.next_attempt_at, self.scheduler.next_due_at)
+
+        self.now += timedelta(seconds=20)
+        self.assertEqual([sooner, later], self.scheduler.pop_due())
+        self.assertEqual([], self.scheduler.pop_due())
+        self.assertIsNone(self.scheduler.next_due_at)
+
+    def test_pop_due_skips_superseded_entries(self):
+        notification = self.get_failed_attempt()
+        self.scheduler.schedule(notification=notification)
+        notification.set_in_progress()
+        self.scheduler.schedule(notification=notification)
+
+        self.now += timedelta(seconds=10)
+        self.assertEqual([], self.scheduler.pop_due())
+
+        self.now += timedelta(seconds=10)
+        actual = self.scheduler.pop_due()
+
+        self.assertEqual([notification], actual)
+        self.assertEqual(2, actual[0].attempts)
+
+    def test_defer_does_not_spend_an_attempt(self):
+        notification = self.get_failed_attempt(attempts=2)
+
+        self.scheduler.defer(
+            notification=notification, delay=timedelta(seconds=3)
+        )
+
+        self.assertEqual(NotificationStatus.PENDING, notification.status)
+        self.assertEqual(2, notification.attempts)
+        self.assertEqual(
+            self.now + timedelta(seconds=3), self.scheduler.next_due_at
+        )
+        self.now += timedelta(seconds=3)
+        self.assertEqual([notification], self.scheduler.pop_due())
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from sl_notifications_broker.application.services.token_buckets import (
+    TokenBuckets,
+)
+
+
+class TestTokenBuckets(TestCase):
+    def setUp(self) -> None:
+        self.buckets = TokenBuckets(rate=2, burst=3)
+        super().setUp()
+
+    def test_burst_is_available_right_away(self):
+        for _ in range(3):
+            self.assertEqual(0, self.buckets.wait_time(key="a", now=0))
+            self.buckets.consume(key="a", now=0)
+
+        self.assertEqual(0.5, self.buckets.wait_time(key="a", now=0))
+
+    def test_tokens_refill_at_rate(self):
+        for _ in range(3):
+            self.buckets.consume(key="a", now=0)
+
+        self.assertEqual(0.25, self.buckets.wait_time(key="a", now=0.25))
+        self.assertEqual(0, self.buckets.wait_time(key="a", now=0.5))
+
+    def test_keys_are_limited_independently(self):
+        for _ in range(3):
+            self.buckets.consume(key="a", now=0)
+
+        self.assertEqual(0, self.buckets.wait_time(key="b", now=0))
+
+    def test_idle_full_buckets_are_evicted(self):
+        buckets = TokenBuckets(rate=1, burst=1, max_keys=2)
+        for key in ("a", "b"):
+            buckets.consume(key=key, now=0)
+
+        buckets.consume(key="c", now=0)
+        self.assertEqual(3, len(buckets))
+
+        buckets.consume(key="d", now=10)
+        self.assertEqual(2, len(buckets))
+
+    def test_init_when_arguments_are_invalid(self):
+        with self.assertRaises(ValueError):
+            TokenBuckets(rate=0, burst=1)
+        with self.assertRaises(ValueError):
+            TokenBuckets(rate=1, burst=0.5)
@@ -0,0 +1,80 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.services.worker_attempts import (
+    WorkerAttempts,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.application.services.worker_selector import (
+    WorkerSelector,
+)
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestWorkerAttempts(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_worker_fixture()
+        self.circuit_breaker_mock = Mock(spec=WorkerCircuitBreaker)
+        self.worker_selector_mock = Mock(spec=WorkerSelector)
+        self.worker_attempts = WorkerAttempts(
+            circuit_breaker=self.circuit_breaker_mock,
+            worker_selector=self.worker_selector_mock,
+        )
+        self.started_at = self.worker_attempts.start(worker=self.worker)
+        super().setUp()
+
+    def test_finish_when_worker_delivered(self):
+        self.assertTrue(
+            self.worker_attempts.finish(
+                worker=self.worker, started_at=self.started_at
+            )
+        )
+
+        self.circuit_breaker_mock.record_success.assert_called_once_with(
+            worker=self.worker
+        )
+        self.assertTrue(
+            self.worker_selector_mock.on_call_finished.call_args.kwargs[
+                "succeeded"
+            ]
+        )
+
+    def test_finish_when_worker_failed(self):
+        self.assertFalse(
+            self.worker_attempts.finish(
+                worker=self.worker,
+                started_at=self.started_at,
+                error=WorkerCommunicationFailure(),
+            )
+        )
+
+        self.circuit_breaker_mock.record_failure.assert_called_once_with(
+            worker=self.worker
+        )
+
+    def test_finish_when_rate_limited_releases_the_worker(self):
+        with self.assertRaises(WorkerRateLimited):
+            self.worker_attempts.finish(
+                worker=self.worker,
+                started_at=self.started_at,
+                error=WorkerRateLimited(retry_after=1.0),
+            )
+
+        self.circuit_breaker_mock.release.assert_called_once_with(
+            worker=self.worker
+        )
+        self.circuit_breaker_mock.record_failure.assert_not_called()
+
+    def test_sooner_keeps_the_shortest_retry_after(self):
+        later = WorkerRateLimited(retry_after=2.0)
+        sooner = WorkerRateLimited(retry_after=1.0)
+
+        self.assertIs(later, WorkerAttempts.sooner(None, later))
+        self.assertIs(sooner, WorkerAttempts.sooner(later, sooner))
+        self.assertIs(sooner, WorkerAttempts.sooner(sooner, later))
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.worker_circuit_breaker import (
+    WorkerCircuitBreaker,
+)
+from sl_notifications_broker.domain.entities.worker import CircuitState
+from sl_notifications_broker.infrastructure.in_memory.worker_repository import (
+    InMemoryWorkerRepository,
+)
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestWorkerCircuitBreaker(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_worker_fixture()
+        self.worker_repository = InMemoryWorkerRepository()
+        self.worker_repository.insert(worker=self.worker)
+        self.worker_repository_mock = Mock(
+            spec=WorkerRepositoryPort, wraps=self.worker_repository
+        )
+        self.circuit_breaker = WorkerCircuitBreaker(
+            worker_repository=self.worker_repository_mock,
+            failure_threshold=2,
+            reset_timeout=timedelta(hours=1),
+        )
+        super().setUp()
+
+    def get_stored(self):
+        return self.worker_repository.get(worker_uuid=self.worker.id)
+
+    def test_acquire_when_circuit_is_closed(self):
+        self.assertTrue(self.circuit_breaker.acquire(worker=self.worker))
+        self.assertTrue(self.circuit_breaker.acquire(worker=self.worker))
+
+    def test_acquire_when_circuit_is_open(self):
+        self.circuit_breaker.record_failure(worker=self.worker)
+        self.circuit_breaker.record_failure(worker=self.worker)
+
+        self.assertEqual(CircuitState.OPEN, self.worker.circuit_state)
+        self.assertFalse(self.circuit_breaker.acquire(worker=self.worker))
+
+    def test_acquire_when_circuit_is_half_open_allows_single_probe(self):
+        self.worker.record_failure(failure_threshold=1)
+        self.worker.heartbeat()
+
+        self.assertTrue(self.circuit_breaker.acquire(worker=self.worker))
+        self.assertFalse(self.circuit_breaker.acquire(worker=self.worker))
+
+        self.circuit_breaker.release(worker=self.worker)
+        self.assertTrue(self.circuit_breaker.acquire(worker=self.worker))
+
+    def test_acquire_when_reset_timeout_has_elapsed(self):
+        circuit_breaker = WorkerCircuitBreaker(
+            worker_repository=self.worker_repository_mock,
+            failure_threshold=1,
+            reset_timeout=timedelta(0),
+        )
+        circuit_breaker.record_failure(worker=self.worker)
+        self.worker_repository_mock.reset_mock()
+
+        self.assertTrue(circuit_breaker.acquire(worker=self.worker))
+
+        self.assertEqual(CircuitState.HALF_OPEN, self.worker.circuit_state)
+        self.worker_repository_mock.half_open_circuit.assert_called_once_with(
+            worker_uuid=self.worker.id, reset_timeout=timedelta(0)
+        )
+
+    def test_record_failure_persists_failure_count(self):
+        self.circuit_breaker.record_failure(worker=self.worker)
+
+        self.assertEqual(1, self.worker.failure_count)
+        self.assertEqual(1, self.get_stored().failure_count)
+        self.worker_repository_mock.update.assert_not_called()
+
+    def test_record_success_when_worker_is_healthy(self):
+        self.circuit_breaker.record_success(worker=self.worker)
+
+        self.worker_repository_mock.record_circuit_success.assert_not_called()
+
+    def test_record_success_after_failures(self):
+        self.circuit_breaker.record_failure(worker=self.worker)
+        self.worker_repository_mock.reset_mock()
+
+        self.circuit_breaker.record_success(worker=self.worker)
+
+        self.assertEqual(0, self.worker.failure_count)
+        self.assertEqual(0, self.get_stored().failure_count)
+        self.worker_repository_mock.update.assert_not_called()
+
+    def test_record_failure_adds_up_failures_from_other_copies(self):
+        other_copy = self.worker_repository.get(worker_uuid=self.worker.id)
+
+        self.circuit_breaker.record_failure(worker=self.worker)
+        self.circuit_breaker.record_failure(worker=other_copy)
+
+        self.assertEqual(2, self.get_stored().failure_count)
+        self.assertEqual(CircuitState.OPEN, self.get_stored().circuit_state)
+        self.assertEqual(CircuitState.OPEN, other_copy.circuit_state)
+
+    def test_record_failure_keeps_stored_status(self):
+        stored = self.worker_repository.get(worker_uuid=self.worker.id)
+        stored.set_offline()
+        self.worker_repository.update(worker=stored)
+
+        self.circuit_breaker.record_failure(worker=self.worker)
+
+        self.assertFalse(self.get_stored().is_online)
+        self.assertEqual(stored.updated_at, self.get_stored().updated_at)
+        self.assertTrue(self.worker.is_online)
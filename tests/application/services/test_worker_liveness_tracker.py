@@ -0,0 +1,76 @@
+from unittest import TestCase
+from uuid import uuid4
+
+from sl_notifications_broker.application.services.worker_liveness_tracker import (
+    WorkerLivenessTracker,
+)
+from tests.fixtures.clock_fixture import FakeClock
+
+
+class TestWorkerLivenessTracker(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.tracker = WorkerLivenessTracker(timeout=30, clock=self.clock)
+        super().setUp()
+
+    def test_pop_expired_when_nothing_expired(self):
+        self.tracker.track(worker_uuid=uuid4())
+
+        self.assertEqual([], self.tracker.pop_expired())
+        self.assertEqual(1, len(self.tracker))
+
+    def test_pop_expired_returns_workers_past_deadline_once(self):
+        lost_worker, alive_worker = uuid4(), uuid4()
+        self.tracker.track(worker_uuid=lost_worker)
+        self.clock.now = 20
+        self.tracker.track(worker_uuid=alive_worker)
+        self.clock.now = 30
+
+        self.assertEqual([lost_worker], self.tracker.pop_expired())
+        self.assertEqual([], self.tracker.pop_expired())
+        self.assertEqual(1, len(self.tracker))
+
+    def test_heartbeat_pushes_deadline_forward(self):
+        worker_uuid = uuid4()
+        self.tracker.track(worker_uuid=worker_uuid)
+        self.clock.now = 25
+        self.tracker.track(worker_uuid=worker_uuid)
+        self.clock.now = 40
+
+        self.assertEqual([], self.tracker.pop_expired())
+
+        self.clock.now = 55
+        self.assertEqual([worker_uuid], self.tracker.pop_expired())
+
+    def test_forget_stops_tracking_worker(self):
+        worker_uuid = uuid4()
+        self.tracker.track(worker_uuid=worker_uuid)
+
+        self.tracker.forget(worker_uuid=worker_uuid)
+        self.clock.now = 100
+
+        self.assertEqual([], self.tracker.pop_expired())
+
+    def test_repeated_heartbeats_keep_heap_bounded(self):
+        worker_uuid = uuid4()
+        for second in range(1000):
+            self.clock.now = second
+            self.tracker.track(worker_uuid=worker_uuid)
+
+        self.clock.now = 1029
+        self.assertEqual([worker_uuid], self.tracker.pop_expired())
+
+    def test_track_with_age_never_shortens_a_deadline(self):
+        worker_uuid = uuid4()
+        self.tracker.track(worker_uuid=worker_uuid)
+        self.tracker.track(worker_uuid=worker_uuid, age=20)
+        self.clock.now = 29
+
+        self.assertEqual([], self.tracker.pop_expired())
+
+        other_uuid = uuid4()
+        self.tracker.track(worker_uuid=other_uuid, age=20)
+        self.clock.now = 40
+        self.assertEqual(
+            {worker_uuid, other_uuid}, set(self.tracker.pop_expired())
+        )
@@ -0,0 +1,126 @@
+from unittest import TestCase
+
+from sl_notifications_broker.application.services.worker_selector import (
+    LatencyWeightedWorkerSelector,
+    LeastInFlightWorkerSelector,
+    RoundRobinWorkerSelector,
+)
+from sl_notifications_broker.domain.entities.worker import WorkerStatus
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestRoundRobinWorkerSelector(TestCase):
+    def setUp(self) -> None:
+        self.workers = [get_worker_fixture() for _ in range(3)]
+        self.selector = RoundRobinWorkerSelector()
+        super().setUp()
+
+    def test_select_rotates_first_worker(self):
+        actual = [
+            self.selector.select(workers=self.workers)[0] for _ in range(4)
+        ]
+
+        self.assertEqual(self.workers + self.workers[:1], actual)
+
+    def test_select_keeps_every_worker_as_fallback(self):
+        self.selector.select(workers=self.workers)
+
+        actual = self.selector.select(workers=self.workers)
+
+        self.assertEqual(self.workers[1:] + self.workers[:1], actual)
+
+    def test_select_skips_offline_workers(self):
+        offline_worker = get_worker_fixture(
+            {"worker_status": WorkerStatus.OFFLINE}
+        )
+
+        actual = self.selector.select(workers=[offline_worker] + self.workers)
+
+        self.assertNotIn(offline_worker, actual)
+        self.assertEqual(3, len(actual))
+
+    def test_select_when_no_worker_is_online(self):
+        offline_worker = get_worker_fixture(
+            {"worker_status": WorkerStatus.OFFLINE}
+        )
+
+        self.assertEqual([], self.selector.select(workers=[offline_worker]))
+
+
+class TestLeastInFlightWorkerSelector(TestCase):
+    def setUp(self) -> None:
+        self.workers = [get_worker_fixture() for _ in range(3)]
+        self.selector = LeastInFlightWorkerSelector()
+        super().setUp()
+
+    def test_select_prefers_least_busy_worker(self):
+        self.selector.on_call_started(worker=self.workers[0])
+        self.selector.on_call_started(worker=self.workers[0])
+        self.selector.on_call_started(worker=self.workers[1])
+
+        actual = self.selector.select(workers=self.workers)
+
+        self.assertEqual(
+            [self.workers[2], self.workers[1], self.workers[0]], actual
+        )
+
+    def test_on_call_finished_releases_in_flight_slot(self):
+        self.selector.on_call_started(worker=self.workers[0])
+        self.selector.on_call_finished(
+            worker=self.workers[0], elapsed=0.1, succeeded=True
+        )
+
+        self.assertEqual(0, self.selector.in_flight(worker=self.workers[0]))
+        self.assertEqual(self.workers, self.selector.select(self.workers))
+
+
+class TestLatencyWeightedWorkerSelector(TestCase):
+    def setUp(self) -> None:
+        self.fast_worker = get_worker_fixture()
+        self.slow_worker = get_worker_fixture()
+        self.selector = LatencyWeightedWorkerSelector(alpha=0.5, seed=42)
+        super().setUp()
+
+    def test_on_call_finished_updates_ewma(self):
+        self.selector.on_call_finished(
+            worker=self.fast_worker, elapsed=1.0, succeeded=True
+        )
+        self.selector.on_call_finished(
+            worker=self.fast_worker, elapsed=3.0, succeeded=True
+        )
+
+        self.assertEqual(2.0, self.selector.latency(worker=self.fast_worker))
+
+    def test_select_tries_unmeasured_workers_first(self):
+        self.selector.on_call_finished(
+            worker=self.fast_worker, elapsed=0.01, succeeded=True
+        )
+
+        actual = self.selector.select(
+            workers=[self.fast_worker, self.slow_worker]
+        )
+
+        self.assertEqual([self.slow_worker, self.fast_worker], actual)
+
+    def test_select_favours_faster_workers(self):
+        self.selector.on_call_finished(
+            worker=self.fast_worker, elapsed=0.05, succeeded=True
+        )
+        self.selector.on_call_finished(
+            worker=self.slow_worker, elapsed=2.0, succeeded=False
+        )
+
+        firsts = [
+            self.selector.select(workers=[self.slow_worker, self.fast_worker])[
+                0
+            ]
+            for _ in range(200)
+        ]
+
+        self.assertGreater(
+            firsts.count(self.fast_worker), firsts.count(self.slow_worker)
+        )
+
+    def test_alpha_must_be_in_range(self):
+        with self.assertRaises(ValueError):
+            LatencyWeightedWorkerSelector(alpha=0)
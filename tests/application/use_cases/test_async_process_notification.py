@@ -0,0 +1,180 @@
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.use_cases.async_process_notification import (
+    AsyncProcessNotification,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationInvalidStatus,
+    NotificationStatus,
+)
+from sl_notifications_broker.infrastructure.in_memory.async_worker_interface import (
+    InMemoryAsyncWorkerInterface,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestAsyncProcessNotification(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.notification_fixture = get_notification_fixture()
+        self.worker_fixture = get_worker_fixture()
+
+        self.worker_repository_mock = Mock(spec=WorkerRepositoryPort)
+        self.worker_repository_mock.get_all.return_value = [self.worker_fixture]
+        self.notification_repository_mock = Mock(
+            spec=NotificationRepositoryPort
+        )
+        self.worker_interface = InMemoryAsyncWorkerInterface()
+        super().setUp()
+
+    def get_use_case(self, **kwargs) -> AsyncProcessNotification:
+        return AsyncProcessNotification(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=kwargs.pop(
+                "worker_interface", self.worker_interface
+            ),
+            notification_repository=self.notification_repository_mock,
+            **kwargs,
+        )
+
+    def get_last_updated_status(self) -> NotificationStatus:
+        return self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ].status
+
+    async def test_call_when_notification_status_is_not_pending(self):
+        self.notification_fixture.set_in_progress()
+        with self.assertRaises(NotificationInvalidStatus):
+            await self.get_use_case()(notification=self.notification_fixture)
+
+    async def test_call_when_no_worker_is_found(self):
+        self.worker_repository_mock.get_all.return_value = []
+        with self.assertRaises(WorkerNotFound):
+            await self.get_use_case()(notification=self.notification_fixture)
+
+    async def test_call_when_worker_succeeds_to_process_notification(self):
+        await self.get_use_case()(notification=self.notification_fixture)
+
+        self.assertEqual(
+            NotificationStatus.SUCCESS, self.get_last_updated_status()
+        )
+        self.assertEqual(
+            [(self.worker_fixture.id, self.notification_fixture.id)],
+            self.worker_interface.delivered,
+        )
+
+    async def test_call_when_all_worker_fails_to_process_notification(self):
+        worker_interface = InMemoryAsyncWorkerInterface(failure_rate=1.0)
+
+        await self.get_use_case(worker_interface=worker_interface)(
+            notification=self.notification_fixture
+        )
+
+        self.assertEqual(
+            NotificationStatus.FAILED, self.get_last_updated_status()
+        )
+
+    async def test_call_when_first_worker_times_out(self):
+        slow_worker = get_worker_fixture()
+        self.worker_repository_mock.get_all.return_value = [
+            slow_worker,
+            self.worker_fixture,
+        ]
+
+        class SlowFirstWorkerInterface(InMemoryAsyncWorkerInterface):
+            async def process_notification(self, worker, notification):
+                if worker is slow_worker:
+                    await asyncio.sleep(10)
+                await super().process_notification(
+                    worker=worker, notification=notification
+                )
+
+        worker_interface = SlowFirstWorkerInterface()
+        await self.get_use_case(
+            worker_interface=worker_interface, call_timeout=0.01
+        )(notification=self.notification_fixture)
+
+        self.assertEqual(
+            NotificationStatus.SUCCESS, self.get_last_updated_status()
+        )
+        self.assertEqual(
+            [(self.worker_fixture.id, self.notification_fixture.id)],
+            worker_interface.delivered,
+        )
+
+    async def test_call_when_cancelled_does_not_record_outcome(self):
+        worker_interface = InMemoryAsyncWorkerInterface(latency=10)
+        task = asyncio.ensure_future(
+            self.get_use_case(worker_interface=worker_interface)(
+                notification=self.notification_fixture
+            )
+        )
+        while not worker_interface.max_in_flight:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(
+            NotificationStatus.IN_PROGRESS, self.get_last_updated_status()
+        )
+
+    async def test_call_keeps_many_worker_calls_in_flight(self):
+        worker_interface = InMemoryAsyncWorkerInterface(latency=0.05)
+        process_notification = self.get_use_case(
+            worker_interface=worker_interface, max_in_flight=150
+        )
+        notifications = [get_notification_fixture() for _ in range(200)]
+
+        await asyncio.gather(
+            *(
+                process_notification(notification=notification)
+                for notification in notifications
+            )
+        )
+
+        self.assertEqual(150, worker_interface.max_in_flight)
+        self.assertEqual(200, len(worker_interface.delivered))
+
+    async def test_call_when_rate_limited_defers_without_worker_failure(self):
+        class RateLimitedWorkerInterface(InMemoryAsyncWorkerInterface):
+            async def process_notification(self, worker, notification):
+                raise WorkerRateLimited(retry_after=2.0)
+
+        await self.get_use_case(worker_interface=RateLimitedWorkerInterface())(
+            notification=self.notification_fixture
+        )
+
+        self.assertEqual(0, self.worker_fixture.failure_count)
+        self.worker_repository_mock.record_circuit_failure.assert_not_called()
+        actual = self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ]
+        self.assertEqual(NotificationStatus.PENDING, actual.status)
+        self.assertEqual(0, actual.attempts)
+
+    async def test_call_keeps_repository_calls_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+        self.notification_repository_mock.update.side_effect = (
+            lambda notification: threads.append(threading.get_ident())
+        )
+
+        await self.get_use_case()(notification=self.notification_fixture)
+
+        self.assertEqual(2, len(threads))
+        self.assertNotIn(loop_thread, threads)
@@ -1,12 +1,31 @@
+from datetime import timedelta
 from unittest import TestCase
 from unittest.mock import Mock
 
+from sl_notifications_broker.application.ports.idempotency_index_port import (
+    NotificationCreationInProgress,
+)
+from sl_notifications_broker.application.ports.notification_queue_port import (
+    NotificationQueuePort,
+)
 from sl_notifications_broker.application.use_cases.create_notification import (
     CreateNotification,
 )
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+)
 from sl_notifications_broker.domain.events.notification_created_event import (
     NotificationCreatedEvent,
 )
+from sl_notifications_broker.domain.factories.event_factory import EventFactory
+from sl_notifications_broker.infrastructure.in_memory.idempotency_index import (
+    InMemoryIdempotencyIndex,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+from tests.fixtures.clock_fixture import FakeClock
 from tests.fixtures.domain.notification_fixture import get_notification_fixture
 
 
@@ -64,3 +83,167 @@ class TestCreateNotification(TestCase):
         self.event_factory_mock.notification_created_factory.assert_not_called()
 
         self.message_bus_mock.publish.assert_not_called()
+
+    def test_call_when_outbox_is_enabled(self):
+        create_notification = CreateNotification(
+            notification_repository=self.notification_repository_mock,
+            message_bus=self.message_bus_mock,
+            event_factory=self.event_factory_mock,
+            use_outbox=True,
+        )
+
+        create_notification(notification=self.notification)
+
+        self.notification_repository_mock.insert_with_outbox.assert_called_once_with(
+            notification=self.notification,
+            message=self.notification_created_event,
+        )
+        self.notification_repository_mock.insert.assert_not_called()
+        self.message_bus_mock.publish.assert_not_called()
+
+    def test_call_pushes_notification_to_queue(self):
+        notification_queue_mock = Mock(spec=NotificationQueuePort)
+        create_notification = CreateNotification(
+            notification_repository=self.notification_repository_mock,
+            message_bus=self.message_bus_mock,
+            event_factory=self.event_factory_mock,
+            notification_queue=notification_queue_mock,
+        )
+
+        create_notification(notification=self.notification)
+
+        notification_queue_mock.push_many.assert_called_once_with(
+            notifications=[self.notification]
+        )
+        self.notification_repository_mock.insert.assert_called_once_with(
+            notification=self.notification
+        )
+
+
+class TestCreateNotificationIdempotency(TestCase):
+    def setUp(self) -> None:
+        self.notification_repository = InMemoryNotificationRepository()
+        self.message_bus_mock = Mock()
+        self.clock = FakeClock()
+        self.create_notification = CreateNotification(
+            notification_repository=self.notification_repository,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            idempotency_index=InMemoryIdempotencyIndex(clock=self.clock),
+            duplicate_window=timedelta(seconds=60),
+        )
+        self.notification = get_notification_fixture()
+        super().setUp()
+
+    def get_retry(self) -> Notification:
+        # A client retry carries the same content under a fresh uuid4().
+        return get_notification_fixture(
+            {
+                "send_to": self.notification.to,
+                "message": self.notification.message,
+            }
+        )
+
+    def test_call_with_same_key_returns_existing_notification(self):
+        first = self.create_notification(
+            notification=self.notification, idempotency_key="request-1"
+        )
+        second = self.create_notification(
+            notification=get_notification_fixture(),
+            idempotency_key="request-1",
+        )
+
+        self.assertEqual(self.notification, first)
+        self.assertEqual(self.notification, second)
+        self.message_bus_mock.publish.assert_called_once()
+
+    def test_call_without_key_deduplicates_by_content_in_window(self):
+        self.create_notification(notification=self.notification)
+
+        duplicate = self.create_notification(notification=self.get_retry())
+        self.clock.now = 60
+        retry = self.get_retry()
+        created = self.create_notification(notification=retry)
+
+        self.assertEqual(self.notification, duplicate)
+        self.assertEqual(retry, created)
+        self.assertEqual(2, self.message_bus_mock.publish.call_count)
+
+    def test_call_with_different_content_is_not_a_duplicate(self):
+        self.create_notification(notification=self.notification)
+        other_body = get_notification_fixture(
+            {
+                "send_to": self.notification.to,
+                "message": NotificationMessage(body="Another message"),
+            }
+        )
+        other_recipient = get_notification_fixture(
+            {"message": self.notification.message}
+        )
+
+        for notification in (other_body, other_recipient):
+            self.assertEqual(
+                notification,
+                self.create_notification(notification=notification),
+            )
+
+    def test_call_when_insert_fails_releases_key(self):
+        notification_repository_mock = Mock(
+            wraps=self.notification_repository
+        )
+        notification_repository_mock.insert.side_effect = [Exception, None]
+        create_notification = CreateNotification(
+            notification_repository=notification_repository_mock,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            idempotency_index=InMemoryIdempotencyIndex(clock=self.clock),
+        )
+
+        with self.assertRaises(Exception):
+            create_notification(
+                notification=self.notification, idempotency_key="request-1"
+            )
+        retry = self.get_retry()
+        actual = create_notification(
+            notification=retry, idempotency_key="request-1"
+        )
+
+        self.assertEqual(retry, actual)
+
+    def test_call_when_publish_fails_keeps_key(self):
+        self.message_bus_mock.publish.side_effect = [Exception, None]
+
+        with self.assertRaises(Exception):
+            self.create_notification(
+                notification=self.notification, idempotency_key="request-1"
+            )
+        actual = self.create_notification(
+            notification=self.get_retry(), idempotency_key="request-1"
+        )
+
+        self.assertEqual(self.notification, actual)
+        self.assertEqual(
+            [self.notification],
+            self.notification_repository.claim_pending(
+                limit=10, lease_seconds=60
+            ),
+        )
+
+    def test_call_when_duplicate_is_not_stored_yet(self):
+        index = InMemoryIdempotencyIndex()
+        index.reserve(
+            key="key:request-1",
+            notification_id=get_notification_fixture().id,
+            ttl_seconds=60,
+        )
+        create_notification = CreateNotification(
+            notification_repository=self.notification_repository,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            idempotency_index=index,
+        )
+
+        with self.assertRaises(NotificationCreationInProgress):
+            create_notification(
+                notification=self.notification, idempotency_key="request-1"
+            )
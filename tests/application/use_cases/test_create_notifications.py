@@ -0,0 +1,314 @@
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sl_notifications_broker.application.ports.idempotency_index_port import (
+    NotificationCreationInProgress,
+)
+from sl_notifications_broker.application.ports.notification_queue_port import (
+    NotificationQueuePort,
+)
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.use_cases.create_notifications import (
+    CreateNotifications,
+    InvalidNotificationSpec,
+    NotificationSpec,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationPriority,
+)
+from sl_notifications_broker.domain.factories.event_factory import EventFactory
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    MessageBusPort,
+)
+from sl_notifications_broker.infrastructure.in_memory.idempotency_index import (
+    InMemoryIdempotencyIndex,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+
+
+def get_spec(**overrides) -> NotificationSpec:
+    values = {
+        "second_life_uuid": uuid4(),
+        "second_life_username": "resident",
+        "message": "message",
+    }
+    values.update(overrides)
+    return NotificationSpec(**values)
+
+
+class TestCreateNotifications(TestCase):
+    def setUp(self) -> None:
+        self.notification_repository_mock = Mock(
+            spec=NotificationRepositoryPort
+        )
+        self.message_bus_mock = Mock(spec=MessageBusPort)
+        self.create_notifications = CreateNotifications(
+            notification_repository=self.notification_repository_mock,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            chunk_size=2,
+        )
+        super().setUp()
+
+    def test_call_writes_and_publishes_in_chunks(self):
+        results = list(self.create_notifications(get_spec() for _ in range(5)))
+
+        self.assertEqual([0, 1, 2, 3, 4], [result.index for result in results])
+        self.assertTrue(all(result.is_created for result in results))
+        insert_many_calls = (
+            self.notification_repository_mock.insert_many.call_args_list
+        )
+        self.assertEqual(
+            [2, 2, 1],
+            [len(call.kwargs["notifications"]) for call in insert_many_calls],
+        )
+        published = [
+            message.notification.id
+            for call in self.message_bus_mock.publish_many.call_args_list
+            for message in call.kwargs["messages"]
+        ]
+        self.assertEqual(
+            [result.notification.id for result in results], published
+        )
+        self.notification_repository_mock.insert.assert_not_called()
+        self.message_bus_mock.publish.assert_not_called()
+
+    def test_call_is_lazy(self):
+        consumed = []
+
+        def specs():
+            for index in range(10):
+                consumed.append(index)
+                yield get_spec()
+
+        results = self.create_notifications(specs())
+        next(results)
+
+        self.assertEqual([0, 1], consumed)
+        self.assertEqual(
+            1, self.notification_repository_mock.insert_many.call_count
+        )
+
+    def test_call_reports_invalid_specs(self):
+        specs = [
+            get_spec(),
+            get_spec(message=""),
+            get_spec(second_life_uuid="not-a-uuid"),
+            get_spec(message="x" * 1024),
+            get_spec(priority="urgent"),
+            get_spec(priority="high"),
+        ]
+
+        results = list(self.create_notifications(specs))
+
+        self.assertEqual(
+            [True, False, False, False, False, True],
+            [result.is_created for result in results],
+        )
+        for result in results[1:5]:
+            self.assertIsInstance(result.error, InvalidNotificationSpec)
+        self.assertEqual(
+            NotificationPriority.HIGH, results[5].notification.priority
+        )
+
+    def test_call_when_chunk_write_fails(self):
+        error = RuntimeError("database is down")
+        self.notification_repository_mock.insert_many.side_effect = [
+            error,
+            None,
+        ]
+
+        results = list(self.create_notifications(get_spec() for _ in range(3)))
+
+        self.assertEqual([error, error, None], [r.error for r in results])
+        self.assertIsNone(results[0].notification)
+        self.assertTrue(results[2].is_created)
+        self.assertEqual(1, self.message_bus_mock.publish_many.call_count)
+
+    def test_call_with_outbox_and_queue(self):
+        notification_queue_mock = Mock(spec=NotificationQueuePort)
+        create_notifications = CreateNotifications(
+            notification_repository=self.notification_repository_mock,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            use_outbox=True,
+            notification_queue=notification_queue_mock,
+        )
+
+        results = list(create_notifications([get_spec(), get_spec()]))
+
+        insert_many_with_outbox = (
+            self.notification_repository_mock.insert_many_with_outbox
+        )
+        insert_many_with_outbox.assert_called_once()
+        self.assertEqual(
+            [result.notification for result in results],
+            insert_many_with_outbox.call_args.kwargs["notifications"],
+        )
+        self.assertEqual(
+            [result.notification.id for result in results],
+            [
+                message.notification.id
+                for message in insert_many_with_outbox.call_args.kwargs[
+                    "messages"
+                ]
+            ],
+        )
+        self.notification_repository_mock.insert_with_outbox.assert_not_called()
+        self.message_bus_mock.publish_many.assert_not_called()
+        notification_queue_mock.push_many.assert_called_once_with(
+            notifications=[result.notification for result in results]
+        )
+
+    def test_call_with_idempotency_index(self):
+        notification_repository = InMemoryNotificationRepository()
+        create_notifications = CreateNotifications(
+            notification_repository=notification_repository,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            chunk_size=2,
+            idempotency_index=InMemoryIdempotencyIndex(),
+        )
+        recipient = uuid4()
+        specs = [
+            get_spec(second_life_uuid=recipient),
+            get_spec(second_life_uuid=recipient),
+            get_spec(idempotency_key="key"),
+            get_spec(idempotency_key="key"),
+        ]
+
+        results = list(create_notifications(specs))
+
+        self.assertEqual(
+            [True, False, True, False],
+            [result.is_created for result in results],
+        )
+        self.assertTrue(results[1].duplicate)
+        self.assertEqual(results[0].notification, results[1].notification)
+        self.assertEqual(results[2].notification, results[3].notification)
+        self.assertEqual(
+            results[0].notification,
+            notification_repository.get(
+                notification_id=results[0].notification.id
+            ),
+        )
+
+    def test_call_when_publish_fails_keeps_stored_notifications(self):
+        idempotency_index = InMemoryIdempotencyIndex()
+        notification_repository = InMemoryNotificationRepository()
+        error = RuntimeError("message bus is down")
+        self.message_bus_mock.publish_many.side_effect = error
+        create_notifications = CreateNotifications(
+            notification_repository=notification_repository,
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            idempotency_index=idempotency_index,
+        )
+        specs = [get_spec(idempotency_key="key"), get_spec()]
+
+        results = list(create_notifications(specs))
+
+        self.assertEqual([error, error], [r.error for r in results])
+        self.assertTrue(all(result.is_created for result in results))
+        self.assertEqual(
+            results[0].notification,
+            notification_repository.get(
+                notification_id=results[0].notification.id
+            ),
+        )
+        self.message_bus_mock.publish_many.side_effect = None
+        (retry,) = create_notifications([get_spec(idempotency_key="key")])
+        self.assertTrue(retry.duplicate)
+        self.assertEqual(results[0].notification, retry.notification)
+
+    def test_call_when_input_fails_releases_unwritten_keys(self):
+        idempotency_index = InMemoryIdempotencyIndex()
+        create_notifications = CreateNotifications(
+            notification_repository=InMemoryNotificationRepository(),
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            idempotency_index=idempotency_index,
+        )
+
+        def specs():
+            yield get_spec(idempotency_key="key")
+            raise RuntimeError("client went away")
+
+        with self.assertRaises(RuntimeError):
+            list(create_notifications(specs()))
+
+        self.assertEqual(0, len(idempotency_index))
+        (retry,) = create_notifications([get_spec(idempotency_key="key")])
+        self.assertTrue(retry.is_created)
+
+    def test_call_when_duplicate_is_not_stored_yet(self):
+        idempotency_index = InMemoryIdempotencyIndex()
+        idempotency_index.reserve(
+            key="key:key", notification_id=uuid4(), ttl_seconds=60
+        )
+        create_notifications = CreateNotifications(
+            notification_repository=InMemoryNotificationRepository(),
+            message_bus=self.message_bus_mock,
+            event_factory=EventFactory(),
+            idempotency_index=idempotency_index,
+        )
+
+        (result,) = create_notifications([get_spec(idempotency_key="key")])
+
+        self.assertIsInstance(result.error, NotificationCreationInProgress)
+
+
+class TestCreateNotificationsStream(IsolatedAsyncioTestCase):
+    async def test_stream_accepts_async_iterators(self):
+        notification_repository_mock = Mock(spec=NotificationRepositoryPort)
+        create_notifications = CreateNotifications(
+            notification_repository=notification_repository_mock,
+            message_bus=Mock(spec=MessageBusPort),
+            event_factory=EventFactory(),
+            chunk_size=2,
+        )
+
+        async def specs():
+            for _ in range(3):
+                yield get_spec()
+            yield get_spec(second_life_username="")
+
+        results = [
+            result async for result in create_notifications.stream(specs())
+        ]
+
+        self.assertEqual(
+            [True, True, True, False],
+            [result.is_created for result in results],
+        )
+        self.assertEqual(2, notification_repository_mock.insert_many.call_count)
+
+    async def test_stream_keeps_blocking_calls_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+        notification_repository_mock = Mock(spec=NotificationRepositoryPort)
+        notification_repository_mock.insert_many.side_effect = (
+            lambda notifications: threads.append(threading.get_ident())
+        )
+        create_notifications = CreateNotifications(
+            notification_repository=notification_repository_mock,
+            message_bus=Mock(spec=MessageBusPort),
+            event_factory=EventFactory(),
+        )
+
+        async def specs():
+            yield get_spec()
+
+        results = [
+            result async for result in create_notifications.stream(specs())
+        ]
+
+        self.assertTrue(results[0].is_created)
+        self.assertEqual(1, len(threads))
+        self.assertNotIn(loop_thread, threads)
@@ -0,0 +1,51 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.use_cases.dispatch_next_notifications import (
+    DispatchNextNotifications,
+)
+from sl_notifications_broker.application.use_cases.process_notification_batch import (
+    ProcessNotificationBatch,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationPriority,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_queue import (
+    InMemoryWeightedFairQueue,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestDispatchNextNotifications(TestCase):
+    def setUp(self) -> None:
+        self.notification_queue = InMemoryWeightedFairQueue()
+        self.process_notification_batch_mock = Mock(
+            spec=ProcessNotificationBatch
+        )
+        self.process_notification_batch_mock.side_effect = (
+            lambda notifications: notifications
+        )
+        self.dispatch_next_notifications = DispatchNextNotifications(
+            notification_queue=self.notification_queue,
+            process_notification_batch=self.process_notification_batch_mock,
+            batch_size=2,
+        )
+        super().setUp()
+
+    def test_call_when_queue_is_empty(self):
+        self.assertEqual([], self.dispatch_next_notifications())
+        self.process_notification_batch_mock.assert_not_called()
+
+    def test_call_dispatches_what_the_queue_picks(self):
+        low = [
+            get_notification_fixture({"priority": NotificationPriority.LOW})
+            for _ in range(5)
+        ]
+        high = get_notification_fixture({"priority": NotificationPriority.HIGH})
+        self.notification_queue.push_many(notifications=low + [high])
+
+        actual = self.dispatch_next_notifications()
+
+        self.assertEqual(2, len(actual))
+        self.assertIn(high, actual)
+        self.assertEqual(4, len(self.notification_queue))
@@ -1,18 +1,32 @@
+import time
 from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import Mock
 
+from sl_notifications_broker.application.decorators.rate_limited_worker_interface import (
+    RateLimitedWorkerInterface,
+)
 from sl_notifications_broker.application.ports.notification_repository_port import (
     NotificationRepositoryPort,
 )
 from sl_notifications_broker.application.ports.worker_interface_port import (
     WorkerCommunicationFailure,
     WorkerInterfacePort,
+    WorkerRateLimited,
 )
 from sl_notifications_broker.application.ports.worker_repository_port import (
     WorkerNotFound,
     WorkerRepositoryPort,
 )
+from sl_notifications_broker.application.services.retry_policy import (
+    RetryPolicy,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.application.services.token_buckets import (
+    TokenBuckets,
+)
 from sl_notifications_broker.application.use_cases.process_notification import (
     ProcessNotification,
 )
@@ -20,6 +34,7 @@ from sl_notifications_broker.domain.entities.notification import (
     NotificationInvalidStatus,
     NotificationStatus,
 )
+from sl_notifications_broker.domain.entities.worker import WorkerStatus
 from tests.fixtures.domain.notification_fixture import get_notification_fixture
 from tests.fixtures.domain.worker_fixture import get_worker_fixture
 
@@ -73,6 +88,26 @@ class TestProcessNotification(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_call_when_all_workers_fail_and_retry_is_scheduled(self):
+        process_notification = ProcessNotification(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=self.worker_interface_mock,
+            notification_repository=self.notification_repository_mock,
+            retry_scheduler=RetryScheduler(retry_policy=RetryPolicy()),
+        )
+        self.worker_interface_mock.process_notification.side_effect = (
+            WorkerCommunicationFailure
+        )
+
+        process_notification(notification=self.notification_fixture)
+
+        actual = self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ]
+        self.assertEqual(NotificationStatus.PENDING, actual.status)
+        self.assertEqual(1, actual.attempts)
+        self.assertIsNotNone(actual.next_attempt_at)
+
     def test_call_when_worker_succeeds_to_process_notification(self):
         expected = NotificationStatus.SUCCESS
 
@@ -83,3 +118,181 @@ class TestProcessNotification(TestCase):
         ].status
 
         self.assertEqual(expected, actual)
+
+    def test_call_when_only_worker_is_offline(self):
+        self.worker_repository_mock.get_all.return_value = [
+            get_worker_fixture({"worker_status": WorkerStatus.OFFLINE})
+        ]
+
+        self.process_notification(notification=self.notification_fixture)
+
+        self.worker_interface_mock.process_notification.assert_not_called()
+        actual = self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ].status
+        self.assertEqual(NotificationStatus.FAILED, actual)
+
+    def test_call_spreads_notifications_across_workers(self):
+        workers = [self.worker_fixture, get_worker_fixture()]
+        self.worker_repository_mock.get_all.return_value = workers
+
+        for _ in range(2):
+            self.process_notification(notification=get_notification_fixture())
+
+        actual = [
+            call[1]["worker"]
+            for call in (
+                self.worker_interface_mock.process_notification.call_args_list
+            )
+        ]
+        self.assertEqual(workers, actual)
+
+    def test_call_skips_workers_with_open_circuit(self):
+        self.worker_fixture.record_failure(failure_threshold=1)
+
+        self.process_notification(notification=self.notification_fixture)
+
+        self.worker_interface_mock.process_notification.assert_not_called()
+
+    def test_call_when_rate_limited_defers_without_worker_failure(self):
+        self.worker_interface_mock.process_notification.side_effect = (
+            WorkerRateLimited(retry_after=2.0)
+        )
+
+        self.process_notification(notification=self.notification_fixture)
+
+        self.assertEqual(0, self.worker_fixture.failure_count)
+        self.worker_repository_mock.update.assert_not_called()
+        actual = self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ]
+        self.assertEqual(NotificationStatus.PENDING, actual.status)
+        self.assertEqual(0, actual.attempts)
+        self.assertIsNotNone(actual.next_attempt_at)
+
+    def test_call_when_recipient_is_throttled_stops_trying_workers(self):
+        self.worker_repository_mock.get_all.return_value = [
+            get_worker_fixture(),
+            get_worker_fixture(),
+        ]
+        process_notification = ProcessNotification(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=RateLimitedWorkerInterface(
+                worker_interface=self.worker_interface_mock,
+                recipient_limiter=TokenBuckets(rate=1, burst=1),
+            ),
+            notification_repository=self.notification_repository_mock,
+        )
+        recipient = self.notification_fixture.to
+        notifications = [
+            get_notification_fixture({"send_to": recipient}) for _ in range(5)
+        ]
+
+        for notification in notifications:
+            process_notification(notification=notification)
+
+        stored = {
+            call.kwargs["notification"].id: call.kwargs["notification"]
+            for call in self.notification_repository_mock.update.call_args_list
+        }
+        self.assertEqual(
+            [NotificationStatus.SUCCESS] + [NotificationStatus.PENDING] * 4,
+            [stored[notification.id].status for notification in notifications],
+        )
+        self.assertEqual(
+            1, self.worker_interface_mock.process_notification.call_count
+        )
+
+    def test_call_when_worker_fails_feeds_back_failure_count(self):
+        self.worker_interface_mock.process_notification.side_effect = (
+            WorkerCommunicationFailure
+        )
+        stored = deepcopy(self.worker_fixture)
+        stored.record_failure(failure_threshold=3)
+        self.worker_repository_mock.record_circuit_failure.return_value = stored
+
+        self.process_notification(notification=self.notification_fixture)
+
+        self.assertEqual(1, self.worker_fixture.failure_count)
+        record_circuit_failure = (
+            self.worker_repository_mock.record_circuit_failure
+        )
+        record_circuit_failure.assert_called_once()
+        self.assertEqual(
+            self.worker_fixture.id,
+            record_circuit_failure.call_args.kwargs["worker_uuid"],
+        )
+        self.worker_repository_mock.update.assert_not_called()
+
+    def get_hedged_process_notification(self) -> ProcessNotification:
+        return ProcessNotification(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=self.worker_interface_mock,
+            notification_repository=self.notification_repository_mock,
+            hedge_delay=0.02,
+        )
+
+    def test_call_when_hedged_and_first_worker_is_slow(self):
+        slow_worker = get_worker_fixture()
+        self.worker_repository_mock.get_all.return_value = [
+            slow_worker,
+            self.worker_fixture,
+        ]
+
+        def process_notification(worker, notification):
+            if worker is slow_worker:
+                time.sleep(0.3)
+
+        self.worker_interface_mock.process_notification.side_effect = (
+            process_notification
+        )
+
+        started_at = time.perf_counter()
+        self.get_hedged_process_notification()(
+            notification=self.notification_fixture
+        )
+
+        self.assertLess(time.perf_counter() - started_at, 0.3)
+        self.assertEqual(
+            2, self.worker_interface_mock.process_notification.call_count
+        )
+        self.assertEqual(2, self.notification_repository_mock.update.call_count)
+        actual = self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ].status
+        self.assertEqual(NotificationStatus.SUCCESS, actual)
+
+    def test_call_when_hedged_and_first_worker_answers_in_time(self):
+        self.worker_repository_mock.get_all.return_value = [
+            self.worker_fixture,
+            get_worker_fixture(),
+        ]
+
+        self.get_hedged_process_notification()(
+            notification=self.notification_fixture
+        )
+
+        self.worker_interface_mock.process_notification.assert_called_once()
+        self.assertEqual(2, self.notification_repository_mock.update.call_count)
+
+    def test_call_when_hedged_and_all_workers_fail(self):
+        self.worker_repository_mock.get_all.return_value = [
+            self.worker_fixture,
+            get_worker_fixture(),
+            get_worker_fixture(),
+        ]
+        self.worker_interface_mock.process_notification.side_effect = (
+            WorkerCommunicationFailure
+        )
+
+        self.get_hedged_process_notification()(
+            notification=self.notification_fixture
+        )
+
+        self.assertEqual(
+            3, self.worker_interface_mock.process_notification.call_count
+        )
+        actual = self.notification_repository_mock.update.call_args_list[-1][1][
+            "notification"
+        ].status
+        self.assertEqual(NotificationStatus.FAILED, actual)
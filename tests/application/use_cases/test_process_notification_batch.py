@@ -0,0 +1,199 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationRepositoryPort,
+)
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerInterfacePort,
+)
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.notification_coalescer import (
+    NotificationCoalescer,
+)
+from sl_notifications_broker.application.use_cases.process_notification_batch import (
+    ProcessNotificationBatch,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationInvalidStatus,
+    NotificationStatus,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestProcessNotificationBatch(TestCase):
+    def setUp(self) -> None:
+        self.notification_fixtures = [
+            get_notification_fixture() for _ in range(5)
+        ]
+        self.worker_fixture = get_worker_fixture()
+
+        self.worker_repository_mock = Mock(spec=WorkerRepositoryPort)
+        self.worker_repository_mock.get_all.return_value = [self.worker_fixture]
+
+        self.worker_interface_mock = Mock(spec=WorkerInterfacePort)
+        self.notification_repository_mock = Mock(
+            spec=NotificationRepositoryPort
+        )
+        self.process_notification_batch = ProcessNotificationBatch(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=self.worker_interface_mock,
+            notification_repository=self.notification_repository_mock,
+            max_concurrency=2,
+        )
+        super().setUp()
+
+    def test_call_when_batch_is_empty(self):
+        actual = self.process_notification_batch(notifications=[])
+
+        self.assertEqual([], actual)
+        self.worker_repository_mock.get_all.assert_not_called()
+        self.notification_repository_mock.update_many.assert_not_called()
+
+    def test_call_when_a_notification_status_is_not_pending(self):
+        self.notification_fixtures[2].set_in_progress()
+
+        with self.assertRaises(NotificationInvalidStatus):
+            self.process_notification_batch(
+                notifications=self.notification_fixtures
+            )
+
+        self.notification_repository_mock.update_many.assert_not_called()
+
+    def test_call_when_no_worker_is_found(self):
+        self.worker_repository_mock.get_all.return_value = []
+
+        with self.assertRaises(WorkerNotFound):
+            self.process_notification_batch(
+                notifications=self.notification_fixtures
+            )
+
+    def test_call_moves_whole_batch_to_in_progress_with_one_update(self):
+        self.process_notification_batch(
+            notifications=iter(self.notification_fixtures)
+        )
+
+        self.notification_repository_mock.update_many.assert_called_once()
+        updated = self.notification_repository_mock.update_many.call_args[1][
+            "notifications"
+        ]
+        self.assertEqual(self.notification_fixtures, updated)
+        self.worker_repository_mock.get_all.assert_called_once_with()
+
+    def test_call_when_worker_succeeds_to_process_notifications(self):
+        actual = self.process_notification_batch(
+            notifications=self.notification_fixtures
+        )
+
+        self.assertEqual(self.notification_fixtures, actual)
+        self.assertTrue(
+            all(
+                notification.status == NotificationStatus.SUCCESS
+                for notification in actual
+            )
+        )
+        self.assertEqual(
+            len(self.notification_fixtures),
+            self.notification_repository_mock.update.call_count,
+        )
+        self.assertTrue(
+            all(
+                notification.is_pending
+                for notification in self.notification_fixtures
+            )
+        )
+
+    def test_call_when_all_worker_fails_to_process_notifications(self):
+        self.worker_interface_mock.process_notification.side_effect = (
+            WorkerCommunicationFailure
+        )
+
+        actual = self.process_notification_batch(
+            notifications=self.notification_fixtures
+        )
+
+        self.assertTrue(
+            all(
+                notification.status == NotificationStatus.FAILED
+                for notification in actual
+            )
+        )
+
+    def test_call_when_first_worker_fails_and_second_succeeds(self):
+        failing_worker = get_worker_fixture()
+        self.worker_repository_mock.get_all.return_value = [
+            failing_worker,
+            self.worker_fixture,
+        ]
+
+        def process_notification(worker, notification):
+            if worker is failing_worker:
+                raise WorkerCommunicationFailure
+
+        self.worker_interface_mock.process_notification.side_effect = (
+            process_notification
+        )
+
+        actual = self.process_notification_batch(
+            notifications=self.notification_fixtures
+        )
+
+        self.assertTrue(
+            all(notification.is_successful for notification in actual)
+        )
+
+    def test_call_with_coalescer_records_outcome_per_notification(self):
+        recipient = self.notification_fixtures[0].to
+        notifications = [
+            get_notification_fixture({"send_to": recipient}) for _ in range(3)
+        ] + [get_notification_fixture()]
+        process_notification_batch = ProcessNotificationBatch(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=self.worker_interface_mock,
+            notification_repository=self.notification_repository_mock,
+            coalescer=NotificationCoalescer(),
+        )
+
+        actual = process_notification_batch(notifications=notifications)
+
+        self.assertEqual(notifications, actual)
+        self.assertTrue(
+            all(notification.is_successful for notification in actual)
+        )
+        self.assertEqual(
+            2, self.worker_interface_mock.process_notification.call_count
+        )
+        self.assertEqual(
+            len(notifications),
+            self.notification_repository_mock.update.call_count,
+        )
+
+    def test_call_with_coalescer_when_delivery_fails(self):
+        recipient = self.notification_fixtures[0].to
+        notifications = [
+            get_notification_fixture({"send_to": recipient}) for _ in range(3)
+        ]
+        self.worker_interface_mock.process_notification.side_effect = (
+            WorkerCommunicationFailure
+        )
+        process_notification_batch = ProcessNotificationBatch(
+            worker_repository=self.worker_repository_mock,
+            worker_interface=self.worker_interface_mock,
+            notification_repository=self.notification_repository_mock,
+            coalescer=NotificationCoalescer(),
+        )
+
+        actual = process_notification_batch(notifications=notifications)
+
+        self.assertTrue(
+            all(
+                notification.status == NotificationStatus.FAILED
+                for notification in actual
+            )
+        )
+        self.worker_interface_mock.process_notification.assert_called_once()
@@ -0,0 +1,127 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.worker_liveness_tracker import (
+    WorkerLivenessTracker,
+)
+from sl_notifications_broker.application.use_cases.record_worker_heartbeat import (
+    RecordWorkerHeartbeat,
+)
+from sl_notifications_broker.domain.entities.worker import (
+    CircuitState,
+    WorkerStatus,
+)
+from sl_notifications_broker.infrastructure.in_memory.worker_repository import (
+    InMemoryWorkerRepository,
+)
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestRecordWorkerHeartbeat(TestCase):
+    def setUp(self) -> None:
+        self.worker = get_worker_fixture(
+            {"worker_status": WorkerStatus.OFFLINE}
+        )
+        self.worker_repository = InMemoryWorkerRepository()
+        self.worker_repository.insert(worker=self.worker)
+        self.worker_repository_mock = Mock(
+            spec=WorkerRepositoryPort, wraps=self.worker_repository
+        )
+        self.clock = FakeClock()
+        self.liveness_tracker = WorkerLivenessTracker(
+            timeout=30, clock=self.clock
+        )
+        self.record_worker_heartbeat = RecordWorkerHeartbeat(
+            worker_repository=self.worker_repository_mock,
+            liveness_tracker=self.liveness_tracker,
+            flush_interval=5,
+            clock=self.clock,
+        )
+        super().setUp()
+
+    def get_stored(self):
+        return self.worker_repository.get(worker_uuid=self.worker.id)
+
+    def test_call_tracks_liveness_without_persisting(self):
+        self.record_worker_heartbeat(worker_uuid=self.worker.id)
+
+        self.assertEqual(1, len(self.liveness_tracker))
+        self.worker_repository_mock.record_heartbeats.assert_not_called()
+
+    def test_repeated_heartbeats_are_coalesced_into_one_write(self):
+        updated_at = self.worker.updated_at
+        for second in range(6):
+            self.clock.now = second
+            self.record_worker_heartbeat(worker_uuid=self.worker.id)
+
+        record_heartbeats = self.worker_repository_mock.record_heartbeats
+        record_heartbeats.assert_called_once()
+        self.assertEqual(
+            [self.worker.id],
+            list(record_heartbeats.call_args.kwargs["heartbeats"]),
+        )
+        self.assertTrue(self.get_stored().is_online)
+        self.assertGreater(self.get_stored().updated_at, updated_at)
+        self.worker_repository_mock.update_many.assert_not_called()
+
+    def test_flush_skips_unknown_workers(self):
+        self.record_worker_heartbeat(worker_uuid=get_worker_fixture().id)
+
+        with self.assertLogs(level="WARNING"):
+            actual = self.record_worker_heartbeat.flush()
+
+        self.assertEqual(0, actual)
+        self.assertEqual(0, len(self.liveness_tracker))
+
+    def test_flush_keeps_circuit_changes_made_since_the_heartbeat(self):
+        self.record_worker_heartbeat(worker_uuid=self.worker.id)
+        for _ in range(3):
+            self.worker_repository.record_circuit_failure(
+                worker_uuid=self.worker.id, failure_threshold=3
+            )
+
+        self.record_worker_heartbeat.flush()
+
+        stored = self.get_stored()
+        self.assertTrue(stored.is_online)
+        self.assertEqual(3, stored.failure_count)
+        self.assertNotEqual(CircuitState.CLOSED, stored.circuit_state)
+
+    def test_start_flushes_quiet_heartbeats_on_a_timer(self):
+        record_worker_heartbeat = RecordWorkerHeartbeat(
+            worker_repository=self.worker_repository_mock,
+            liveness_tracker=self.liveness_tracker,
+            flush_interval=0.01,
+        )
+        flushed = threading.Event()
+
+        def record_heartbeats(heartbeats):
+            workers = self.worker_repository.record_heartbeats(
+                heartbeats=heartbeats
+            )
+            flushed.set()
+            return workers
+
+        self.worker_repository_mock.record_heartbeats.side_effect = (
+            record_heartbeats
+        )
+
+        record_worker_heartbeat.start()
+        record_worker_heartbeat(worker_uuid=self.worker.id)
+        self.assertTrue(flushed.wait(timeout=5))
+        record_worker_heartbeat.stop()
+
+        self.assertTrue(self.get_stored().is_online)
+
+    def test_stop_persists_pending_heartbeats(self):
+        self.record_worker_heartbeat(worker_uuid=self.worker.id)
+
+        self.record_worker_heartbeat.stop()
+
+        self.worker_repository_mock.record_heartbeats.assert_called_once()
+        self.assertTrue(self.get_stored().is_online)
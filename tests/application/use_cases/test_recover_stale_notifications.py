@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from sl_notifications_broker.application.use_cases.recover_stale_notifications import (
+    RecoverStaleNotifications,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationStatus,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestRecoverStaleNotifications(TestCase):
+    def setUp(self) -> None:
+        self.repository = InMemoryNotificationRepository()
+        stale_at = datetime.now() - timedelta(hours=1)
+        self.stale_notifications = [
+            get_notification_fixture(
+                {
+                    "status": NotificationStatus.IN_PROGRESS,
+                    "updated_at": stale_at + timedelta(seconds=seconds),
+                }
+            )
+            for seconds in range(5)
+        ]
+        self.fresh_notification = get_notification_fixture(
+            {"status": NotificationStatus.IN_PROGRESS}
+        )
+        self.pending_notification = get_notification_fixture(
+            {"updated_at": stale_at}
+        )
+        self.repository.insert_many(
+            notifications=self.stale_notifications
+            + [self.fresh_notification, self.pending_notification]
+        )
+        super().setUp()
+
+    def get_status(self, notification) -> NotificationStatus:
+        return self.repository.get(notification_id=notification.id).status
+
+    def test_call_requeues_only_stale_in_progress_notifications(self):
+        recover = RecoverStaleNotifications(
+            notification_repository=self.repository,
+            stale_after=timedelta(minutes=10),
+            page_size=2,
+        )
+
+        actual = recover()
+
+        self.assertEqual(5, actual)
+        for notification in self.stale_notifications:
+            self.assertEqual(
+                NotificationStatus.PENDING, self.get_status(notification)
+            )
+        self.assertEqual(
+            NotificationStatus.IN_PROGRESS,
+            self.get_status(self.fresh_notification),
+        )
+
+    def test_call_is_bounded_and_resumes_from_cursor(self):
+        recover = RecoverStaleNotifications(
+            notification_repository=self.repository,
+            stale_after=timedelta(minutes=10),
+            page_size=2,
+            max_pages=1,
+        )
+
+        self.assertEqual(2, recover())
+        self.assertEqual(2, recover())
+        self.assertEqual(1, recover())
+        self.assertEqual(0, recover())
+
+    def test_requeued_notifications_can_be_claimed_again(self):
+        RecoverStaleNotifications(
+            notification_repository=self.repository,
+            stale_after=timedelta(minutes=10),
+        )()
+
+        claimed = self.repository.claim_pending(limit=10, lease_seconds=30)
+
+        self.assertEqual(6, len(claimed))
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.outbox_repository_port import (
+    OutboxRepositoryPort,
+)
+from sl_notifications_broker.application.use_cases.relay_outbox import (
+    RelayOutbox,
+)
+from sl_notifications_broker.domain.events.notification_created_event import (
+    NotificationCreatedEvent,
+)
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    MessageBusPort,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestRelayOutbox(TestCase):
+    def setUp(self) -> None:
+        self.messages = [
+            NotificationCreatedEvent.factory(
+                notification=get_notification_fixture()
+            )
+            for _ in range(3)
+        ]
+        self.outbox_repository_mock = Mock(spec=OutboxRepositoryPort)
+        self.outbox_repository_mock.get_unpublished.return_value = (
+            self.messages
+        )
+        self.message_bus_mock = Mock(spec=MessageBusPort)
+        self.relay_outbox = RelayOutbox(
+            outbox_repository=self.outbox_repository_mock,
+            message_bus=self.message_bus_mock,
+            batch_size=3,
+        )
+        super().setUp()
+
+    def test_call_when_outbox_is_empty(self):
+        self.outbox_repository_mock.get_unpublished.return_value = []
+
+        actual = self.relay_outbox()
+
+        self.assertEqual(0, actual)
+        self.outbox_repository_mock.mark_published.assert_not_called()
+
+    def test_call_publishes_and_marks_batch(self):
+        actual = self.relay_outbox()
+
+        self.assertEqual(3, actual)
+        self.outbox_repository_mock.get_unpublished.assert_called_once_with(
+            limit=3
+        )
+        self.message_bus_mock.publish_many.assert_called_once_with(
+            messages=self.messages
+        )
+        self.outbox_repository_mock.mark_published.assert_called_once_with(
+            message_ids=[
+                message.message_header.message_id for message in self.messages
+            ]
+        )
+
+    def test_call_when_publish_fails_keeps_batch_unpublished(self):
+        self.message_bus_mock.publish_many.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            self.relay_outbox()
+
+        self.outbox_repository_mock.mark_published.assert_not_called()
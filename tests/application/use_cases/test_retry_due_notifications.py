@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.services.retry_policy import (
+    RetryPolicy,
+)
+from sl_notifications_broker.application.services.retry_scheduler import (
+    RetryScheduler,
+)
+from sl_notifications_broker.application.use_cases.retry_due_notifications import (
+    RetryDueNotifications,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationStatus,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestRetryDueNotifications(TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2022, 1, 1)
+        self.retry_scheduler = RetryScheduler(
+            retry_policy=RetryPolicy(base_delay=timedelta(seconds=5), jitter=0),
+            clock=lambda: self.now,
+        )
+        self.process_notification_mock = Mock()
+        self.retry_due_notifications = RetryDueNotifications(
+            retry_scheduler=self.retry_scheduler,
+            process_notification=self.process_notification_mock,
+        )
+        super().setUp()
+
+    def test_call_processes_only_due_retries(self):
+        notification = get_notification_fixture(
+            {"status": NotificationStatus.IN_PROGRESS}
+        )
+        self.retry_scheduler.schedule(notification=notification)
+
+        self.assertEqual(0, self.retry_due_notifications())
+        self.process_notification_mock.assert_not_called()
+
+        self.now += timedelta(seconds=5)
+        self.assertEqual(1, self.retry_due_notifications())
+        self.process_notification_mock.assert_called_once_with(notification)
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import Mock
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+    WorkerRepositoryPort,
+)
+from sl_notifications_broker.application.services.worker_liveness_tracker import (
+    WorkerLivenessTracker,
+)
+from sl_notifications_broker.application.use_cases.sweep_lost_workers import (
+    SweepLostWorkers,
+)
+from sl_notifications_broker.domain.entities.worker import WorkerStatus
+from sl_notifications_broker.infrastructure.in_memory.worker_repository import (
+    InMemoryWorkerRepository,
+)
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestSweepLostWorkers(TestCase):
+    def setUp(self) -> None:
+        self.started_at = datetime(2022, 1, 1)
+        self.clock = FakeClock()
+        self.lost_worker = get_worker_fixture(
+            {"updated_at": self.started_at}
+        )
+        self.alive_worker = get_worker_fixture(
+            {"updated_at": self.started_at}
+        )
+        self.worker_repository = InMemoryWorkerRepository()
+        self.worker_repository.insert(worker=self.lost_worker)
+        self.worker_repository.insert(worker=self.alive_worker)
+        self.worker_repository_mock = Mock(
+            spec=WorkerRepositoryPort, wraps=self.worker_repository
+        )
+        self.worker_repository_mock.get_all.return_value = []
+        self.liveness_tracker = WorkerLivenessTracker(
+            timeout=30, clock=self.clock
+        )
+        self.sweep_lost_workers = SweepLostWorkers(
+            worker_repository=self.worker_repository_mock,
+            liveness_tracker=self.liveness_tracker,
+            clock=self.clock,
+            wall_clock=self.wall_clock,
+        )
+        super().setUp()
+
+    def wall_clock(self) -> datetime:
+        return self.started_at + timedelta(seconds=self.clock.now)
+
+    def heartbeat(self, worker) -> None:
+        # Persisted by another replica; this tracker never saw it.
+        self.worker_repository.record_heartbeats(
+            heartbeats={worker.id: self.wall_clock()}
+        )
+
+    def get_stored(self, worker):
+        return self.worker_repository.get(worker_uuid=worker.id)
+
+    def test_call_when_no_worker_expired(self):
+        self.liveness_tracker.track(worker_uuid=self.lost_worker.id)
+
+        self.assertEqual([], self.sweep_lost_workers())
+        self.worker_repository_mock.get.assert_not_called()
+        self.worker_repository_mock.update_many.assert_not_called()
+
+    def test_call_moves_expired_workers_offline(self):
+        self.liveness_tracker.track(worker_uuid=self.lost_worker.id)
+        self.clock.now = 20
+        self.liveness_tracker.track(worker_uuid=self.alive_worker.id)
+        self.heartbeat(self.alive_worker)
+        self.clock.now = 35
+
+        actual = self.sweep_lost_workers()
+
+        self.assertEqual([self.lost_worker], actual)
+        self.assertFalse(actual[0].is_online)
+        self.assertFalse(self.get_stored(self.lost_worker).is_online)
+        self.assertTrue(self.get_stored(self.alive_worker).is_online)
+        self.worker_repository_mock.get.assert_called_once_with(
+            worker_uuid=self.lost_worker.id
+        )
+        self.worker_repository_mock.update_many.assert_not_called()
+
+    def test_call_keeps_workers_heartbeating_after_the_read(self):
+        stale_copy = self.get_stored(self.lost_worker)
+        self.worker_repository_mock.get.side_effect = (
+            lambda worker_uuid: stale_copy
+        )
+        self.liveness_tracker.track(worker_uuid=self.lost_worker.id)
+        self.clock.now = 35
+        self.heartbeat(self.lost_worker)
+
+        self.assertEqual([], self.sweep_lost_workers())
+        self.assertTrue(self.get_stored(self.lost_worker).is_online)
+
+    def test_call_skips_deleted_workers(self):
+        self.worker_repository_mock.get.side_effect = WorkerNotFound
+        self.liveness_tracker.track(worker_uuid=self.lost_worker.id)
+        self.clock.now = 35
+
+        self.assertEqual([], self.sweep_lost_workers())
+
+    def test_call_keeps_workers_heartbeating_to_other_replicas(self):
+        self.liveness_tracker.track(worker_uuid=self.lost_worker.id)
+        self.clock.now = 25
+        self.heartbeat(self.lost_worker)
+        self.clock.now = 35
+
+        self.assertEqual([], self.sweep_lost_workers())
+        self.clock.now = 56
+        self.assertEqual([self.lost_worker], self.sweep_lost_workers())
+
+    def test_call_sweeps_online_workers_never_heard_from(self):
+        offline_worker = get_worker_fixture(
+            {
+                "updated_at": self.started_at,
+                "worker_status": WorkerStatus.OFFLINE,
+            }
+        )
+        self.worker_repository.insert(worker=offline_worker)
+        self.worker_repository_mock.get_all.return_value = (
+            self.worker_repository.get_all()
+        )
+        self.clock.now = 10
+
+        self.assertEqual([], self.sweep_lost_workers())
+        self.clock.now = 31
+
+        self.assertCountEqual(
+            [self.lost_worker, self.alive_worker], self.sweep_lost_workers()
+        )
+        self.assertEqual(1, self.worker_repository_mock.get_all.call_count)
@@ -0,0 +1,189 @@
+import random
+import string
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import UUID
+
+from sl_notifications_broker.domain.codecs.notification_codec import (
+    NotificationCodec,
+    NotificationDecodeError,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    NotificationPriority,
+    NotificationStatus,
+    SecondLifeUser,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+ROUND_TRIPS = 300
+
+
+def get_random_notification(rng: random.Random) -> Notification:
+    created_at = datetime(2000, 1, 1) + timedelta(
+        seconds=rng.randrange(0, 10 ** 9),
+        microseconds=rng.choice([0, rng.randrange(0, 10 ** 6)]),
+    )
+    alphabet = string.printable + "çãéü漢字🙂"
+    return Notification(
+        send_to=SecondLifeUser(
+            second_life_username="".join(
+                rng.choices(alphabet, k=rng.randrange(0, 64))
+            ),
+            second_life_uuid=UUID(int=rng.getrandbits(128), version=4),
+        ),
+        message=NotificationMessage(
+            body="".join(rng.choices(alphabet, k=rng.randrange(0, 1024)))
+        ),
+        status=rng.choice(list(NotificationStatus)),
+        priority=rng.choice(list(NotificationPriority)),
+        notification_id=UUID(int=rng.getrandbits(128), version=4),
+        created_at=created_at,
+        updated_at=created_at
+        + timedelta(microseconds=rng.choice([0, rng.randrange(0, 10 ** 9)])),
+        attempts=rng.randrange(0, 10),
+        next_attempt_at=rng.choice(
+            [None, created_at + timedelta(seconds=rng.randrange(0, 3600))]
+        ),
+    )
+
+
+class TestNotificationCodec(TestCase):
+    def setUp(self) -> None:
+        self.codec = NotificationCodec()
+        self.rng = random.Random(1234)
+        super().setUp()
+
+    def assertSameNotification(self, expected, actual):
+        self.assertEqual(expected, actual)
+        self.assertEqual(expected.as_dict(), actual.as_dict())
+
+    def test_to_dict_is_json_safe(self):
+        notification = get_notification_fixture()
+
+        actual = self.codec.to_dict(notification)
+
+        self.assertEqual(str(notification.id), actual["notification_id"])
+        self.assertEqual(
+            str(notification.to.second_life_uuid),
+            actual["send_to"]["second_life_uuid"],
+        )
+        self.assertEqual(
+            notification.created_at.isoformat(), actual["created_at"]
+        )
+
+    def test_from_dict_accepts_as_dict_output(self):
+        notification = get_notification_fixture(
+            {"created_at": datetime(2022, 1, 1, 10, 30)}
+        )
+
+        actual = self.codec.from_dict(notification.as_dict())
+
+        self.assertSameNotification(notification, actual)
+
+    def test_dict_round_trip(self):
+        for _ in range(ROUND_TRIPS):
+            notification = get_random_notification(self.rng)
+            actual = self.codec.from_dict(self.codec.to_dict(notification))
+            self.assertSameNotification(notification, actual)
+
+    def test_binary_round_trip(self):
+        for _ in range(ROUND_TRIPS):
+            notification = get_random_notification(self.rng)
+            actual = self.codec.decode(self.codec.encode(notification))
+            self.assertSameNotification(notification, actual)
+
+    def test_batch_round_trip(self):
+        notifications = [
+            get_random_notification(self.rng) for _ in range(ROUND_TRIPS)
+        ]
+
+        actual_binary = self.codec.decode_many(
+            self.codec.encode_many(notifications)
+        )
+        actual_dicts = self.codec.from_dict_many(
+            self.codec.to_dict_many(notifications)
+        )
+
+        for expected, binary, from_dict in zip(
+            notifications, actual_binary, actual_dicts
+        ):
+            self.assertSameNotification(expected, binary)
+            self.assertSameNotification(expected, from_dict)
+        self.assertEqual(len(notifications), len(actual_binary))
+
+    def test_decode_many_when_batch_is_empty(self):
+        self.assertEqual([], self.codec.decode_many(self.codec.encode_many([])))
+
+    def test_decode_when_record_is_truncated(self):
+        data = self.codec.encode(get_notification_fixture())
+
+        with self.assertRaises(NotificationDecodeError):
+            self.codec.decode(data[:-1])
+
+        with self.assertRaises(NotificationDecodeError):
+            self.codec.decode(data[:10])
+
+    def test_decode_when_version_is_unknown(self):
+        data = bytearray(self.codec.encode(get_notification_fixture()))
+        data[0] = 99
+
+        with self.assertRaises(NotificationDecodeError):
+            self.codec.decode(bytes(data))
+
+    def test_decode_when_there_are_trailing_bytes(self):
+        data = self.codec.encode(get_notification_fixture())
+
+        with self.assertRaises(NotificationDecodeError):
+            self.codec.decode(data + b"\x00")
+
+    def test_to_dict_returns_a_dict_owned_by_the_caller(self):
+        codec = NotificationCodec(cache_size=16)
+        notification = get_notification_fixture()
+
+        first = codec.to_dict(notification)
+        first["message"] = "changed"
+        first["send_to"]["second_life_username"] = "changed"
+
+        actual = codec.to_dict(notification)
+        self.assertEqual(notification.message.body, actual["message"])
+        self.assertEqual(
+            notification.to.second_life_username,
+            actual["send_to"]["second_life_username"],
+        )
+
+    def test_to_dict_follows_content_not_identity(self):
+        codec = NotificationCodec(cache_size=16)
+        notification = get_notification_fixture()
+        same_identity = get_notification_fixture(
+            {
+                "notification_id": notification.id,
+                "created_at": notification.created_at,
+                "updated_at": notification.updated_at,
+                "message": NotificationMessage(body="other body"),
+            }
+        )
+
+        codec.to_dict(notification)
+
+        self.assertEqual("other body", codec.to_dict(same_identity)["message"])
+
+    def test_to_dict_serializes_each_version_once_when_cached(self):
+        codec = NotificationCodec(cache_size=16)
+        notification = get_notification_fixture()
+        build_dict = NotificationCodec._NotificationCodec__build_dict
+
+        with patch.object(
+            NotificationCodec,
+            "_NotificationCodec__build_dict",
+            wraps=build_dict,
+        ) as build_dict_mock:
+            codec.to_dict(notification)
+            codec.to_dict(notification)
+            notification.set_in_progress()
+            actual = codec.to_dict(notification)
+
+        self.assertEqual(2, build_dict_mock.call_count)
+        self.assertEqual(NotificationStatus.IN_PROGRESS.value, actual["status"])
@@ -1,4 +1,5 @@
-from datetime import datetime
+from copy import copy
+from datetime import datetime, timedelta
 from unittest import TestCase
 from uuid import uuid4
 
@@ -6,9 +7,11 @@ from sl_notifications_broker.domain.entities.notification import (
     Notification,
     NotificationInvalidStatus,
     NotificationMessage,
+    NotificationPriority,
     NotificationStatus,
     SecondLifeUser,
 )
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
 
 
 class TestNotification(TestCase):
@@ -125,6 +128,9 @@ class TestNotification(TestCase):
             "send_to": send_to,
             "status": self.notification.status.value,
             "updated_at": str(self.notification.updated_at),
+            "attempts": 0,
+            "next_attempt_at": None,
+            "priority": "normal",
         }
 
         actual = self.notification.as_dict()
@@ -150,6 +156,145 @@ class TestNotification(TestCase):
 
         self.assertEqual(expected, actual)
 
-        expected_dict = expected.__dict__
-        actual_dict = actual.__dict__
+        expected_dict = expected.as_dict()
+        actual_dict = actual.as_dict()
         self.assertDictEqual(expected_dict, actual_dict)
+
+    def test_idempotency_key_is_derived_from_id(self):
+        self.assertEqual(
+            str(self.notification_id), self.notification.idempotency_key
+        )
+
+    def test_has_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.notification.__dict__  # pylint: disable=pointless-statement
+
+    def test_hash_is_keyed_on_id(self):
+        same_notification = Notification(
+            send_to=self.send_to,
+            message=NotificationMessage(body="Another body."),
+            notification_id=self.notification_id,
+        )
+
+        self.assertEqual(hash(self.notification), hash(same_notification))
+        self.assertEqual(1, len({self.notification, same_notification}))
+
+    def test_with_status_returns_transitioned_copy(self):
+        actual = self.notification.with_status(
+            status=NotificationStatus.IN_PROGRESS
+        )
+
+        self.assertIsNot(self.notification, actual)
+        self.assertEqual(self.notification, actual)
+        self.assertEqual(NotificationStatus.IN_PROGRESS, actual.status)
+        self.assertEqual(NotificationStatus.PENDING, self.notification.status)
+        self.assertIs(self.notification.to, actual.to)
+        self.assertIs(self.notification.message, actual.message)
+        self.assertNotEqual(self.updated_at, actual.updated_at)
+
+    def test_with_status_when_transition_is_not_allowed(self):
+        with self.assertRaises(NotificationInvalidStatus):
+            self.notification.with_status(status=NotificationStatus.SUCCESS)
+
+        with self.assertRaises(NotificationInvalidStatus):
+            self.notification.with_status(status=NotificationStatus.PENDING)
+
+    def test_requeue_when_status_is_in_progress(self):
+        self.notification.set_in_progress()
+        updated_at = self.notification.updated_at
+
+        self.notification.requeue()
+
+        self.assertEqual(NotificationStatus.PENDING, self.notification.status)
+        self.assertNotEqual(updated_at, self.notification.updated_at)
+
+    def test_schedule_retry_when_status_is_in_progress(self):
+        self.notification.set_in_progress()
+        next_attempt_at = datetime.now() + timedelta(seconds=30)
+
+        self.notification.schedule_retry(next_attempt_at=next_attempt_at)
+
+        self.assertEqual(NotificationStatus.PENDING, self.notification.status)
+        self.assertEqual(1, self.notification.attempts)
+        self.assertEqual(next_attempt_at, self.notification.next_attempt_at)
+        self.assertFalse(self.notification.is_due(now=datetime.now()))
+        self.assertTrue(self.notification.is_due(now=next_attempt_at))
+
+    def test_schedule_retry_when_status_is_not_in_progress(self):
+        with self.assertRaises(NotificationInvalidStatus):
+            self.notification.schedule_retry(next_attempt_at=datetime.now())
+
+    def test_retry_state_survives_copy_and_dict_round_trip(self):
+        self.notification.set_in_progress()
+        self.notification.schedule_retry(
+            next_attempt_at=datetime.now() + timedelta(seconds=30)
+        )
+
+        copied = self.notification.with_status(NotificationStatus.IN_PROGRESS)
+        restored = Notification.from_dict(data=self.notification.as_dict())
+
+        for actual in (copied, restored):
+            self.assertEqual(1, actual.attempts)
+            self.assertEqual(
+                self.notification.next_attempt_at, actual.next_attempt_at
+            )
+
+    def test_requeue_when_status_is_not_in_progress(self):
+        with self.assertRaises(NotificationInvalidStatus):
+            self.notification.requeue()
+
+        self.notification.set_in_progress()
+        self.notification.set_success()
+        with self.assertRaises(NotificationInvalidStatus):
+            self.notification.requeue()
+
+    def test_copy_shares_immutable_fields(self):
+        actual = copy(self.notification)
+
+        self.assertIsNot(self.notification, actual)
+        self.assertEqual(self.notification.as_dict(), actual.as_dict())
+
+    def test_from_dict_when_microseconds_are_zero(self):
+        created_at = datetime(2022, 1, 1, 10, 30)
+        data = self.notification.as_dict()
+        data["created_at"] = str(created_at)
+        data["updated_at"] = str(created_at)
+
+        actual = Notification.from_dict(data=data)
+
+        self.assertEqual(created_at, actual.created_at)
+        self.assertEqual(created_at, actual.updated_at)
+
+    def test_from_dict_when_uuids_are_strings(self):
+        data = self.notification.as_dict()
+        data["notification_id"] = str(self.notification_id)
+        data["send_to"]["second_life_uuid"] = str(self.send_to.second_life_uuid)
+
+        actual = Notification.from_dict(data=data)
+
+        self.assertEqual(self.notification_id, actual.id)
+        self.assertEqual(self.send_to, actual.to)
+
+    def test_priority_defaults_to_normal(self):
+        self.assertEqual(
+            NotificationPriority.NORMAL, self.notification.priority
+        )
+
+    def test_priority_survives_copy_and_dict_round_trip(self):
+        notification = get_notification_fixture(
+            {"priority": NotificationPriority.HIGH}
+        )
+
+        copied = notification.with_status(NotificationStatus.IN_PROGRESS)
+        restored = Notification.from_dict(data=notification.as_dict())
+
+        self.assertEqual(NotificationPriority.HIGH, copied.priority)
+        self.assertEqual(NotificationPriority.HIGH, restored.priority)
+
+    def test_from_dict_when_priority_is_missing(self):
+        data = self.notification.as_dict()
+        del data["priority"]
+
+        actual = Notification.from_dict(data=data)
+
+        self.assertEqual(NotificationPriority.NORMAL, actual.priority)
@@ -1,8 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest import TestCase
 from uuid import uuid4
 
-from sl_notifications_broker.domain.entities.worker import Worker, WorkerStatus
+from sl_notifications_broker.domain.entities.worker import (
+    CircuitState,
+    Worker,
+    WorkerStatus,
+)
 
 
 class TestWorker(TestCase):
@@ -28,6 +32,9 @@ class TestWorker(TestCase):
             "worker_url": self.worker_url,
             "created_at": str(self.created_at),
             "updated_at": str(self.updated_at),
+            "circuit_state": CircuitState.CLOSED.value,
+            "failure_count": 0,
+            "circuit_opened_at": None,
         }
 
         actual = self.worker.as_dict()
@@ -40,3 +47,100 @@ class TestWorker(TestCase):
         data = self.worker.as_dict()
 
         self.assertNotEqual(str(self.updated_at), data["updated_at"])
+
+    def test_properties(self):
+        self.assertEqual(self.worker_uuid, self.worker.id)
+        self.assertEqual(self.worker_status, self.worker.status)
+        self.assertEqual(self.worker_url, self.worker.url)
+        self.assertEqual(self.created_at, self.worker.created_at)
+        self.assertEqual(self.updated_at, self.worker.updated_at)
+
+    def test_from_dict(self):
+        self.worker.record_failure(failure_threshold=1)
+
+        actual = Worker.from_dict(data=self.worker.as_dict())
+
+        self.assertEqual(self.worker.as_dict(), actual.as_dict())
+
+    def test_record_failure_when_below_threshold(self):
+        self.worker.record_failure(failure_threshold=2)
+
+        self.assertEqual(1, self.worker.failure_count)
+        self.assertEqual(CircuitState.CLOSED, self.worker.circuit_state)
+
+    def test_record_failure_when_threshold_is_reached(self):
+        self.worker.record_failure(failure_threshold=2)
+        self.worker.record_failure(failure_threshold=2)
+
+        self.assertEqual(CircuitState.OPEN, self.worker.circuit_state)
+        self.assertIsNotNone(self.worker.circuit_opened_at)
+
+    def test_record_failure_when_half_open(self):
+        self.worker.record_failure(failure_threshold=1)
+        self.worker.try_half_open(reset_timeout=timedelta(0))
+
+        self.worker.record_failure(failure_threshold=10)
+
+        self.assertEqual(CircuitState.OPEN, self.worker.circuit_state)
+
+    def test_record_success_closes_circuit(self):
+        self.worker.record_failure(failure_threshold=1)
+
+        self.worker.record_success()
+
+        self.assertEqual(CircuitState.CLOSED, self.worker.circuit_state)
+        self.assertEqual(0, self.worker.failure_count)
+        self.assertIsNone(self.worker.circuit_opened_at)
+
+    def test_try_half_open_when_reset_timeout_has_not_elapsed(self):
+        self.worker.record_failure(failure_threshold=1)
+
+        actual = self.worker.try_half_open(reset_timeout=timedelta(hours=1))
+
+        self.assertFalse(actual)
+        self.assertEqual(CircuitState.OPEN, self.worker.circuit_state)
+
+    def test_try_half_open_when_reset_timeout_has_elapsed(self):
+        self.worker.record_failure(failure_threshold=1)
+
+        actual = self.worker.try_half_open(reset_timeout=timedelta(0))
+
+        self.assertTrue(actual)
+        self.assertEqual(CircuitState.HALF_OPEN, self.worker.circuit_state)
+
+    def test_heartbeat_when_circuit_is_open(self):
+        self.worker.record_failure(failure_threshold=1)
+
+        self.worker.heartbeat()
+
+        self.assertEqual(CircuitState.HALF_OPEN, self.worker.circuit_state)
+
+    def test_equality_and_hash_are_keyed_on_id(self):
+        same_worker = Worker(
+            worker_uuid=self.worker_uuid,
+            worker_status=WorkerStatus.OFFLINE,
+            worker_url="https://anotherurl.com",
+        )
+
+        self.assertEqual(self.worker, same_worker)
+        self.assertNotEqual(self.worker, self.worker_uuid)
+        self.assertEqual({self.worker: 1}[same_worker], 1)
+
+    def test_has_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.worker.__dict__  # pylint: disable=pointless-statement
+
+    def test_set_offline(self):
+        self.worker.set_offline()
+
+        self.assertEqual(WorkerStatus.OFFLINE, self.worker.status)
+        self.assertNotEqual(self.updated_at, self.worker.updated_at)
+
+    def test_heartbeat_brings_offline_worker_back_online(self):
+        self.worker.set_offline()
+        heartbeat_at = datetime(2022, 1, 1)
+
+        self.worker.heartbeat(at=heartbeat_at)
+
+        self.assertTrue(self.worker.is_online)
+        self.assertEqual(heartbeat_at, self.worker.updated_at)
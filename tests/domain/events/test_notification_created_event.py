@@ -0,0 +1,96 @@
+import pickle
+from unittest import TestCase
+from unittest.mock import patch
+
+from sl_notifications_broker.domain.codecs.notification_codec import (
+    DEFAULT_NOTIFICATION_CODEC,
+    NotificationCodec,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationPriority,
+)
+from sl_notifications_broker.domain.events.notification_created_event import (
+    NotificationCreatedEvent,
+)
+from sl_notifications_broker.domain.ports.message_bus_port import MessageType
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestNotificationCreatedEvent(TestCase):
+    def setUp(self) -> None:
+        self.notification = get_notification_fixture()
+        self.codec = NotificationCodec()
+        super().setUp()
+
+    def test_factory_builds_header(self):
+        event = NotificationCreatedEvent.factory(notification=self.notification)
+
+        self.assertEqual(MessageType.EVENT, event.message_header.message_type)
+        self.assertEqual(
+            "second_life_notification_created",
+            event.message_header.message_name,
+        )
+
+    def test_message_body_is_built_lazily_and_memoized(self):
+        with patch.object(
+            DEFAULT_NOTIFICATION_CODEC,
+            "to_dict",
+            wraps=DEFAULT_NOTIFICATION_CODEC.to_dict,
+        ) as to_dict_mock:
+            event = NotificationCreatedEvent.factory(
+                notification=self.notification
+            )
+            to_dict_mock.assert_not_called()
+
+            first = event.message_body
+            second = event.message_body
+
+        self.assertIs(first, second)
+        to_dict_mock.assert_called_once()
+        self.assertEqual(self.codec.to_dict(self.notification), first)
+
+    def test_message_body_reflects_notification_at_creation(self):
+        event = NotificationCreatedEvent.factory(notification=self.notification)
+
+        self.notification.set_in_progress()
+
+        self.assertEqual("pending", event.message_body["status"])
+
+    def test_message_body_is_not_shared_between_events(self):
+        event = NotificationCreatedEvent.factory(notification=self.notification)
+        event.message_body["message"] = "changed"
+
+        other_event = NotificationCreatedEvent.factory(
+            notification=self.notification
+        )
+
+        self.assertEqual(
+            self.notification.message.body, other_event.message_body["message"]
+        )
+
+    def test_event_survives_pickling(self):
+        event = NotificationCreatedEvent.factory(notification=self.notification)
+
+        unpickled = pickle.loads(pickle.dumps(event))
+
+        self.assertEqual(event.message_header, unpickled.message_header)
+        self.assertEqual(event.message_body, unpickled.message_body)
+
+    def test_events_are_equal_when_header_and_body_match(self):
+        event = NotificationCreatedEvent.factory(notification=self.notification)
+        same_event = NotificationCreatedEvent(
+            message_header=event.message_header,
+            notification=self.notification,
+        )
+
+        self.assertEqual(event, same_event)
+
+    def test_priority_is_carried_in_event_and_body(self):
+        notification = get_notification_fixture(
+            {"priority": NotificationPriority.HIGH}
+        )
+
+        event = NotificationCreatedEvent.factory(notification=notification)
+
+        self.assertEqual(NotificationPriority.HIGH, event.priority)
+        self.assertEqual("high", event.message_body["priority"])
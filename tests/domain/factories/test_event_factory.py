@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from sl_notifications_broker.domain.factories.event_factory import (
+    EventFactory,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestEventFactory(TestCase):
+    def test_notification_created_many(self):
+        notifications = [get_notification_fixture() for _ in range(5)]
+
+        events = EventFactory.notification_created_many(
+            notifications=notifications
+        )
+
+        self.assertEqual(
+            notifications, [event.notification for event in events]
+        )
+        message_ids = {event.message_header.message_id for event in events}
+        self.assertEqual(5, len(message_ids))
+        self.assertTrue(all(message_id.version == 4 for message_id in message_ids))
+        self.assertEqual(
+            1, len({event.message_header.created_at for event in events})
+        )
+
+    def test_notification_created_many_when_batch_is_empty(self):
+        self.assertEqual(
+            [], EventFactory.notification_created_many(notifications=[])
+        )
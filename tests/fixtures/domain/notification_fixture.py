@@ -26,4 +26,7 @@ def get_notification_fixture(values: Optional[Dict] = None):
         notification_id=custom_values.get("notification_id"),
         created_at=custom_values.get("created_at"),
         updated_at=custom_values.get("updated_at"),
+        attempts=custom_values.get("attempts", 0),
+        next_attempt_at=custom_values.get("next_attempt_at"),
+        priority=custom_values.get("priority"),
     )
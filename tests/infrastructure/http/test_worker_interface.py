@@ -0,0 +1,220 @@
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+    WorkerRateLimited,
+)
+from sl_notifications_broker.application.use_cases.process_notification import (
+    ProcessNotification,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationMessage,
+    NotificationStatus,
+)
+from sl_notifications_broker.infrastructure.http.worker_interface import (
+    HttpWorkerInterface,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+from sl_notifications_broker.infrastructure.in_memory.worker_repository import (
+    InMemoryWorkerRepository,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class SecondLifeUrlHandler(BaseHTTPRequestHandler):
+    # Stand-in for an in-world HTTP-in URL. The notification body picks the
+    # behaviour: "slow", "fail", "busy" or "close".
+    protocol_version = "HTTP/1.1"
+    timeout = 0.3
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        message = json.loads(body)["message"]
+        self.server.requests.append(
+            (self.client_address, self.headers["Idempotency-Key"], message)
+        )
+        time.sleep(self.server.latency)
+        if message == "slow":
+            time.sleep(0.5)
+        status = {"fail": 500, "busy": 429}.get(message, 200)
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        if status == 429:
+            self.send_header("Retry-After", "2")
+        if message == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(b"OK")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpWorkerInterface(TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), SecondLifeUrlHandler
+        )
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.latency = 0.0
+        threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+        host, port = self.server.server_address
+        self.worker = get_worker_fixture(
+            {"worker_url": f"http://{host}:{port}/cap/worker"}
+        )
+        self.worker_interface = HttpWorkerInterface(read_timeout=0.2)
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.worker_interface.close()
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def __notification(self, message="ok"):
+        return get_notification_fixture(
+            {"message": NotificationMessage(body=message)}
+        )
+
+    def __client_addresses(self):
+        return {address for address, _, _ in self.server.requests}
+
+    def test_process_notification_reuses_connection(self):
+        notifications = [self.__notification() for _ in range(3)]
+
+        for notification in notifications:
+            self.worker_interface.process_notification(
+                worker=self.worker, notification=notification
+            )
+
+        self.assertEqual(
+            [notification.idempotency_key for notification in notifications],
+            [key for _, key, _ in self.server.requests],
+        )
+        self.assertEqual(1, len(self.__client_addresses()))
+
+    def test_process_notification_when_idle_connection_was_closed(self):
+        self.worker_interface.process_notification(
+            worker=self.worker, notification=self.__notification()
+        )
+        # Past the handler timeout, the server drops the idle connection.
+        time.sleep(0.5)
+
+        self.worker_interface.process_notification(
+            worker=self.worker, notification=self.__notification()
+        )
+
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(2, len(self.__client_addresses()))
+
+    def test_process_notification_when_read_times_out(self):
+        with self.assertRaises(WorkerCommunicationFailure):
+            self.worker_interface.process_notification(
+                worker=self.worker, notification=self.__notification("slow")
+            )
+
+        self.worker_interface.process_notification(
+            worker=self.worker, notification=self.__notification()
+        )
+        self.assertEqual(2, len(self.__client_addresses()))
+
+    def test_process_notification_when_worker_is_unreachable(self):
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            host, port = unused.getsockname()
+        worker = get_worker_fixture({"worker_url": f"http://{host}:{port}/"})
+
+        with self.assertRaises(WorkerCommunicationFailure):
+            self.worker_interface.process_notification(
+                worker=worker, notification=self.__notification()
+            )
+
+    def test_process_notification_maps_error_statuses(self):
+        with self.assertRaises(WorkerRateLimited):
+            self.worker_interface.process_notification(
+                worker=self.worker, notification=self.__notification("busy")
+            )
+        with self.assertRaises(WorkerCommunicationFailure):
+            self.worker_interface.process_notification(
+                worker=self.worker, notification=self.__notification("fail")
+            )
+
+    def test_process_notification_reads_retry_after(self):
+        with self.assertRaises(WorkerRateLimited) as throttled:
+            self.worker_interface.process_notification(
+                worker=self.worker, notification=self.__notification("busy")
+            )
+
+        self.assertEqual(2.0, throttled.exception.retry_after)
+        self.assertIn(self.worker.url, str(throttled.exception))
+
+    def test_process_notification_when_worker_answers_429_defers(self):
+        worker_repository = InMemoryWorkerRepository()
+        worker_repository.insert(worker=self.worker)
+        notification_repository = InMemoryNotificationRepository()
+        notification = self.__notification("busy")
+        notification_repository.insert(notification=notification)
+        process_notification = ProcessNotification(
+            worker_repository=worker_repository,
+            worker_interface=self.worker_interface,
+            notification_repository=notification_repository,
+        )
+
+        process_notification(notification=notification)
+
+        stored = notification_repository.get(notification_id=notification.id)
+        self.assertEqual(NotificationStatus.PENDING, stored.status)
+        self.assertEqual(0, stored.attempts)
+        self.assertGreater(
+            stored.next_attempt_at, datetime.now() + timedelta(seconds=1)
+        )
+        self.assertEqual(
+            0,
+            worker_repository.get(worker_uuid=self.worker.id).failure_count,
+        )
+
+    def test_process_notifications_with_pipelining(self):
+        self.server.latency = 0.05
+        worker_interface = HttpWorkerInterface(pipelining=True)
+        messages = ["ok", "fail", "busy", "close", "ok"]
+
+        outcomes = worker_interface.process_notifications(
+            worker=self.worker,
+            notifications=[self.__notification(m) for m in messages],
+        )
+        worker_interface.close()
+
+        self.assertIsNone(outcomes[0])
+        self.assertIsInstance(outcomes[1], WorkerCommunicationFailure)
+        self.assertIsInstance(outcomes[2], WorkerRateLimited)
+        self.assertEqual(2.0, outcomes[2].retry_after)
+        self.assertIsNone(outcomes[3])
+        self.assertIsInstance(outcomes[4], WorkerCommunicationFailure)
+        self.assertEqual(
+            ["ok", "fail", "busy", "close"],
+            [message for _, _, message in self.server.requests],
+        )
+        self.assertEqual(1, len(self.__client_addresses()))
+
+    def test_process_notifications_without_pipelining(self):
+        outcomes = self.worker_interface.process_notifications(
+            worker=self.worker,
+            notifications=[self.__notification(m) for m in ("ok", "fail")],
+        )
+
+        self.assertIsNone(outcomes[0])
+        self.assertIsInstance(outcomes[1], WorkerCommunicationFailure)
+        self.assertEqual(1, len(self.__client_addresses()))
@@ -0,0 +1,42 @@
+from unittest import IsolatedAsyncioTestCase
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+)
+from sl_notifications_broker.infrastructure.in_memory.async_worker_interface import (
+    InMemoryAsyncWorkerInterface,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestInMemoryAsyncWorkerInterface(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.notification = get_notification_fixture()
+        self.worker = get_worker_fixture()
+        super().setUp()
+
+    async def test_process_notification_when_worker_is_healthy(self):
+        worker_interface = InMemoryAsyncWorkerInterface()
+
+        await worker_interface.process_notification(
+            worker=self.worker, notification=self.notification
+        )
+
+        self.assertEqual(
+            [(self.worker.id, self.notification.id)],
+            worker_interface.delivered,
+        )
+
+    async def test_process_notification_when_worker_is_failing(self):
+        worker_interface = InMemoryAsyncWorkerInterface(
+            failing_worker_ids=[self.worker.id]
+        )
+
+        with self.assertRaises(WorkerCommunicationFailure):
+            await worker_interface.process_notification(
+                worker=self.worker, notification=self.notification
+            )
+
+        self.assertEqual([], worker_interface.delivered)
+        self.assertEqual(1, worker_interface.max_in_flight)
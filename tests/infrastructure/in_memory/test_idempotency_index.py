@@ -0,0 +1,66 @@
+from unittest import TestCase
+from uuid import uuid4
+
+from sl_notifications_broker.infrastructure.in_memory.idempotency_index import (
+    InMemoryIdempotencyIndex,
+)
+from tests.fixtures.clock_fixture import FakeClock
+
+
+class TestInMemoryIdempotencyIndex(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.index = InMemoryIdempotencyIndex(max_keys=3, clock=self.clock)
+        super().setUp()
+
+    def reserve(self, key, notification_id, ttl_seconds=10):
+        return self.index.reserve(
+            key=key, notification_id=notification_id, ttl_seconds=ttl_seconds
+        )
+
+    def test_reserve_returns_first_id_for_a_key(self):
+        first, second = uuid4(), uuid4()
+
+        self.assertEqual(first, self.reserve("a", first))
+        self.assertEqual(first, self.reserve("a", second))
+
+    def test_reserve_when_key_has_expired(self):
+        first, second = uuid4(), uuid4()
+        self.reserve("a", first)
+        self.clock.now = 10
+
+        actual = self.reserve("a", second)
+
+        self.assertEqual(second, actual)
+
+    def test_release_only_drops_own_reservation(self):
+        first, second = uuid4(), uuid4()
+        self.reserve("a", first)
+
+        self.index.release(key="a", notification_id=second)
+        self.assertEqual(first, self.reserve("a", second))
+
+        self.index.release(key="a", notification_id=first)
+        self.assertEqual(second, self.reserve("a", second))
+
+    def test_index_is_bounded_by_least_recently_used(self):
+        ids = {key: uuid4() for key in "abcd"}
+        for key in "abc":
+            self.reserve(key, ids[key])
+        self.reserve("a", uuid4())
+
+        self.reserve("d", ids["d"])
+
+        self.assertEqual(3, len(self.index))
+        self.assertEqual(ids["a"], self.reserve("a", uuid4()))
+        new_id = uuid4()
+        self.assertEqual(new_id, self.reserve("b", new_id))
+
+    def test_expired_keys_are_evicted(self):
+        for key in "abc":
+            self.reserve(key, uuid4(), ttl_seconds=1)
+        self.clock.now = 5
+
+        self.reserve("d", uuid4(), ttl_seconds=1)
+
+        self.assertEqual(1, len(self.index))
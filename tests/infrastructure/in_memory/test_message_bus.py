@@ -0,0 +1,102 @@
+import threading
+from typing import List
+from unittest import TestCase
+
+from sl_notifications_broker.domain.events.notification_created_event import (
+    NotificationCreatedEvent,
+)
+from sl_notifications_broker.domain.ports.message_bus_port import (
+    Message,
+    MessageHandler,
+)
+from sl_notifications_broker.infrastructure.in_memory.message_bus import (
+    InMemoryMessageBus,
+    MessageBusFull,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class RecordingHandler(MessageHandler):
+    def __init__(self) -> None:
+        self.messages: List[Message] = []
+        self.lock = threading.Lock()
+
+    def handle(self, message: Message) -> None:
+        with self.lock:
+            self.messages.append(message)
+
+
+class FailingHandler(MessageHandler):
+    def handle(self, message: Message) -> None:
+        raise Exception
+
+
+def get_event() -> NotificationCreatedEvent:
+    return NotificationCreatedEvent.factory(
+        notification=get_notification_fixture()
+    )
+
+
+class TestInMemoryMessageBus(TestCase):
+    def setUp(self) -> None:
+        self.handler = RecordingHandler()
+        self.message_bus = InMemoryMessageBus(max_queue_size=10, consumers=3)
+        self.message_bus.subscribe(
+            message_name="second_life_notification_created",
+            handler=self.handler,
+        )
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.message_bus.stop()
+        super().tearDown()
+
+    def test_publish_dispatches_to_subscribed_handlers(self):
+        event = get_event()
+        self.message_bus.start()
+
+        self.message_bus.publish(message=event)
+        self.message_bus.join()
+
+        self.assertEqual([event], self.handler.messages)
+
+    def test_publish_many_dispatches_every_message(self):
+        events = [get_event() for _ in range(50)]
+        self.message_bus.start()
+
+        self.message_bus.publish_many(messages=events)
+        self.message_bus.join()
+
+        self.assertCountEqual(events, self.handler.messages)
+
+    def test_publish_when_queue_is_full(self):
+        message_bus = InMemoryMessageBus(max_queue_size=1, publish_timeout=0)
+        message_bus.publish(message=get_event())
+
+        with self.assertRaises(MessageBusFull):
+            message_bus.publish(message=get_event())
+
+    def test_handler_failure_does_not_stop_consumers(self):
+        event = get_event()
+        self.message_bus.subscribe(
+            message_name="second_life_notification_created",
+            handler=FailingHandler(),
+        )
+        self.message_bus.start()
+
+        with self.assertLogs(level="ERROR"):
+            self.message_bus.publish(message=event)
+            self.message_bus.join()
+        self.message_bus.publish(message=event)
+        self.message_bus.join()
+
+        self.assertEqual([event, event], self.handler.messages)
+
+    def test_stop_delivers_messages_published_before(self):
+        events = [get_event() for _ in range(5)]
+        self.message_bus.publish_many(messages=events)
+
+        self.message_bus.start()
+        self.message_bus.stop()
+
+        self.assertCountEqual(events, self.handler.messages)
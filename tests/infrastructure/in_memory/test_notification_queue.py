@@ -0,0 +1,84 @@
+from collections import Counter
+from unittest import TestCase
+
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationPriority,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_queue import (
+    InMemoryWeightedFairQueue,
+)
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+WEIGHTS = {
+    NotificationPriority.HIGH: 4,
+    NotificationPriority.NORMAL: 2,
+    NotificationPriority.LOW: 1,
+}
+
+
+class TestInMemoryWeightedFairQueue(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.queue = InMemoryWeightedFairQueue(
+            weights=WEIGHTS, max_wait=60, clock=self.clock
+        )
+        super().setUp()
+
+    def push(self, priority: NotificationPriority, count: int):
+        notifications = [
+            get_notification_fixture({"priority": priority})
+            for _ in range(count)
+        ]
+        self.queue.push_many(notifications=notifications)
+        return notifications
+
+    def test_pop_many_when_queue_is_empty(self):
+        self.assertEqual([], self.queue.pop_many(limit=10))
+
+    def test_pop_many_keeps_fifo_order_within_a_priority(self):
+        notifications = self.push(NotificationPriority.NORMAL, 5)
+
+        self.assertEqual(notifications[:3], self.queue.pop_many(limit=3))
+        self.assertEqual(notifications[3:], self.queue.pop_many(limit=3))
+        self.assertEqual(0, len(self.queue))
+
+    def test_pop_many_shares_dispatches_by_weight(self):
+        for priority in NotificationPriority:
+            self.push(priority, 100)
+
+        actual = Counter(
+            notification.priority
+            for notification in self.queue.pop_many(limit=70)
+        )
+
+        self.assertEqual(40, actual[NotificationPriority.HIGH])
+        self.assertEqual(20, actual[NotificationPriority.NORMAL])
+        self.assertEqual(10, actual[NotificationPriority.LOW])
+
+    def test_high_priority_does_not_wait_behind_a_low_priority_blast(self):
+        self.push(NotificationPriority.LOW, 1000)
+        high = self.push(NotificationPriority.HIGH, 1)
+
+        self.assertIn(high[0], self.queue.pop_many(limit=2))
+
+    def test_starving_level_gets_parity_with_highest_priority(self):
+        self.push(NotificationPriority.LOW, 100)
+        self.clock.now = 60
+        self.push(NotificationPriority.HIGH, 100)
+
+        actual = Counter(
+            notification.priority
+            for notification in self.queue.pop_many(limit=20)
+        )
+
+        self.assertEqual(10, actual[NotificationPriority.LOW])
+        self.assertEqual(10, actual[NotificationPriority.HIGH])
+
+    def test_init_when_weights_are_invalid(self):
+        with self.assertRaises(ValueError):
+            InMemoryWeightedFairQueue(weights={NotificationPriority.HIGH: 1})
+        with self.assertRaises(ValueError):
+            InMemoryWeightedFairQueue(
+                weights={**WEIGHTS, NotificationPriority.LOW: 0}
+            )
@@ -0,0 +1,233 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from sl_notifications_broker.application.ports.notification_repository_port import (
+    NotificationNotFound,
+)
+from sl_notifications_broker.domain.entities.notification import (
+    NotificationStatus,
+)
+from sl_notifications_broker.domain.events.notification_created_event import (
+    NotificationCreatedEvent,
+)
+from sl_notifications_broker.infrastructure.in_memory.notification_repository import (
+    InMemoryNotificationRepository,
+)
+from tests.fixtures.clock_fixture import FakeClock
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+class TestInMemoryNotificationRepository(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.repository = InMemoryNotificationRepository(clock=self.clock)
+        created_at = datetime(2022, 1, 1)
+        self.notifications = [
+            get_notification_fixture(
+                {"created_at": created_at + timedelta(minutes=minutes)}
+            )
+            for minutes in (3, 1, 2)
+        ]
+        self.repository.insert_many(notifications=self.notifications)
+        super().setUp()
+
+    def test_get_when_notification_does_not_exist(self):
+        with self.assertRaises(NotificationNotFound):
+            self.repository.get(notification_id=get_notification_fixture().id)
+
+    def test_update_when_notification_does_not_exist(self):
+        with self.assertRaises(NotificationNotFound):
+            self.repository.update(notification=get_notification_fixture())
+
+    def test_stored_notification_is_isolated_from_caller(self):
+        self.notifications[0].set_in_progress()
+
+        actual = self.repository.get(notification_id=self.notifications[0].id)
+
+        self.assertEqual(NotificationStatus.PENDING, actual.status)
+
+    def test_claim_pending_returns_oldest_first(self):
+        actual = self.repository.claim_pending(limit=2, lease_seconds=30)
+
+        self.assertEqual([self.notifications[1], self.notifications[2]], actual)
+        self.assertTrue(all(n.is_in_progress for n in actual))
+        self.assertTrue(
+            self.repository.get(
+                notification_id=self.notifications[1].id
+            ).is_in_progress
+        )
+
+    def test_claim_pending_does_not_hand_out_claimed_notifications(self):
+        self.repository.claim_pending(limit=2, lease_seconds=30)
+
+        actual = self.repository.claim_pending(limit=10, lease_seconds=30)
+
+        self.assertEqual([self.notifications[0]], actual)
+
+    def test_claim_pending_skips_notifications_no_longer_pending(self):
+        self.notifications[1].set_in_progress()
+        self.repository.update(notification=self.notifications[1])
+
+        actual = self.repository.claim_pending(limit=10, lease_seconds=30)
+
+        self.assertEqual([self.notifications[2], self.notifications[0]], actual)
+
+    def test_claim_pending_reclaims_expired_leases(self):
+        self.repository.claim_pending(limit=1, lease_seconds=30)
+        self.clock.now = 31
+
+        actual = self.repository.claim_pending(limit=1, lease_seconds=30)
+
+        self.assertEqual([self.notifications[1]], actual)
+
+    def test_claim_pending_does_not_reclaim_completed_notifications(self):
+        claimed = self.repository.claim_pending(limit=1, lease_seconds=30)[0]
+        claimed.set_success()
+        self.repository.update(notification=claimed)
+        self.clock.now = 31
+
+        actual = self.repository.claim_pending(limit=1, lease_seconds=30)
+
+        self.assertEqual([self.notifications[2]], actual)
+
+    def test_claim_pending_waits_for_scheduled_retries(self):
+        claimed = self.repository.claim_pending(limit=3, lease_seconds=30)
+        waiting, due = claimed[0], claimed[1]
+        waiting.schedule_retry(
+            next_attempt_at=datetime.now() + timedelta(hours=1)
+        )
+        due.schedule_retry(next_attempt_at=datetime.now() - timedelta(1))
+        self.repository.update_many(notifications=[waiting, due])
+
+        actual = self.repository.claim_pending(limit=3, lease_seconds=30)
+
+        self.assertEqual([due], actual)
+        self.assertEqual(1, actual[0].attempts)
+
+    def test_claim_pending_when_expired_lease_is_rescheduled(self):
+        notification = self.repository.claim_pending(
+            limit=1, lease_seconds=30
+        )[0]
+        self.clock.now = 30
+        self.repository.claim_pending(limit=0, lease_seconds=30)
+        notification.schedule_retry(
+            next_attempt_at=datetime.now() + timedelta(hours=1)
+        )
+        self.repository.update(notification=notification)
+
+        actual = self.repository.claim_pending(limit=3, lease_seconds=30)
+
+        self.assertNotIn(notification, actual)
+        self.assertEqual(2, len(actual))
+
+    def test_update_many_when_a_notification_does_not_exist(self):
+        self.notifications[0].set_in_progress()
+        unknown = get_notification_fixture()
+
+        with self.assertRaises(NotificationNotFound):
+            self.repository.update_many(
+                notifications=[self.notifications[0], unknown]
+            )
+
+        self.assertTrue(
+            self.repository.get(
+                notification_id=self.notifications[0].id
+            ).is_pending
+        )
+
+    def test_insert_with_outbox_stores_notification_and_message(self):
+        notification = get_notification_fixture()
+        message = NotificationCreatedEvent.factory(notification=notification)
+
+        self.repository.insert_with_outbox(
+            notification=notification, message=message
+        )
+
+        self.assertEqual(
+            notification, self.repository.get(notification_id=notification.id)
+        )
+        self.assertEqual([message], self.repository.get_unpublished(limit=10))
+
+    def test_insert_many_with_outbox_stores_notifications_and_messages(self):
+        notifications = [get_notification_fixture() for _ in range(2)]
+        messages = [
+            NotificationCreatedEvent.factory(notification=notification)
+            for notification in notifications
+        ]
+
+        self.repository.insert_many_with_outbox(
+            notifications=notifications, messages=messages
+        )
+
+        for notification in notifications:
+            self.assertEqual(
+                notification,
+                self.repository.get(notification_id=notification.id),
+            )
+        self.assertEqual(messages, self.repository.get_unpublished(limit=10))
+
+    def test_mark_published_removes_messages_from_outbox(self):
+        messages = []
+        for _ in range(3):
+            notification = get_notification_fixture()
+            messages.append(
+                NotificationCreatedEvent.factory(notification=notification)
+            )
+            self.repository.insert_with_outbox(
+                notification=notification, message=messages[-1]
+            )
+
+        self.assertEqual(messages[:2], self.repository.get_unpublished(limit=2))
+
+        self.repository.mark_published(
+            message_ids=[messages[0].message_header.message_id]
+        )
+
+        self.assertEqual(messages[1:], self.repository.get_unpublished(limit=5))
+
+    def test_find_stale_in_progress_pages_by_updated_at(self):
+        claimed = self.repository.claim_pending(limit=3, lease_seconds=30)
+        updated_before = max(n.updated_at for n in claimed) + timedelta(1)
+
+        first_page = self.repository.find_stale_in_progress(
+            updated_before=updated_before, limit=2
+        )
+        second_page = self.repository.find_stale_in_progress(
+            updated_before=updated_before,
+            limit=2,
+            after=first_page.next_cursor,
+        )
+
+        self.assertEqual(2, len(first_page.notifications))
+        self.assertIsNotNone(first_page.next_cursor)
+        self.assertEqual(1, len(second_page.notifications))
+        self.assertIsNone(second_page.next_cursor)
+        self.assertCountEqual(
+            claimed, first_page.notifications + second_page.notifications
+        )
+
+    def test_find_stale_in_progress_follows_status_changes(self):
+        claimed = self.repository.claim_pending(limit=3, lease_seconds=30)
+        claimed[0].set_success()
+        self.repository.update(notification=claimed[0])
+        updated_before = max(n.updated_at for n in claimed) + timedelta(1)
+
+        page = self.repository.find_stale_in_progress(
+            updated_before=updated_before, limit=10
+        )
+
+        self.assertCountEqual(claimed[1:], page.notifications)
+        self.assertEqual(
+            [n.updated_at for n in page.notifications],
+            sorted(n.updated_at for n in page.notifications),
+        )
+
+    def test_find_stale_in_progress_ignores_recent_notifications(self):
+        claimed = self.repository.claim_pending(limit=3, lease_seconds=30)
+
+        page = self.repository.find_stale_in_progress(
+            updated_before=min(n.updated_at for n in claimed), limit=10
+        )
+
+        self.assertEqual([], page.notifications)
+        self.assertIsNone(page.next_cursor)
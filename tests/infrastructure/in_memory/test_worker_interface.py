@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from sl_notifications_broker.application.ports.worker_interface_port import (
+    WorkerCommunicationFailure,
+)
+from sl_notifications_broker.infrastructure.in_memory.worker_interface import (
+    InMemoryWorkerInterface,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestInMemoryWorkerInterface(TestCase):
+    def test_process_notification_records_delivery(self):
+        worker_interface = InMemoryWorkerInterface()
+        worker, notification = get_worker_fixture(), get_notification_fixture()
+
+        worker_interface.process_notification(
+            worker=worker, notification=notification
+        )
+
+        self.assertEqual(
+            [(worker.id, notification.id)], worker_interface.delivered
+        )
+
+    def test_process_notification_when_worker_is_failing(self):
+        worker = get_worker_fixture()
+        worker_interface = InMemoryWorkerInterface(
+            failing_worker_ids=[worker.id]
+        )
+
+        with self.assertRaises(WorkerCommunicationFailure):
+            worker_interface.process_notification(
+                worker=worker, notification=get_notification_fixture()
+            )
+        self.assertEqual([], worker_interface.delivered)
+
+    def test_failure_rate_is_reproducible_with_seed(self):
+        def failures(seed):
+            worker_interface = InMemoryWorkerInterface(
+                failure_rate=0.5, seed=seed
+            )
+            outcomes = []
+            for _ in range(50):
+                try:
+                    worker_interface.process_notification(
+                        worker=get_worker_fixture(),
+                        notification=get_notification_fixture(),
+                    )
+                    outcomes.append(False)
+                except WorkerCommunicationFailure:
+                    outcomes.append(True)
+            return outcomes
+
+        self.assertEqual(failures(seed=7), failures(seed=7))
+        self.assertTrue(0 < sum(failures(seed=7)) < 50)
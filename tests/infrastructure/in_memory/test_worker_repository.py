@@ -0,0 +1,76 @@
+from datetime import timedelta
+from unittest import TestCase
+
+from sl_notifications_broker.application.ports.worker_repository_port import (
+    WorkerNotFound,
+)
+from sl_notifications_broker.domain.entities.worker import CircuitState
+from sl_notifications_broker.infrastructure.in_memory.worker_repository import (
+    InMemoryWorkerRepository,
+)
+from tests.fixtures.domain.worker_fixture import get_worker_fixture
+
+
+class TestInMemoryWorkerRepository(TestCase):
+    def setUp(self) -> None:
+        self.repository = InMemoryWorkerRepository()
+        self.worker = get_worker_fixture()
+        self.repository.insert(worker=self.worker)
+        super().setUp()
+
+    def get_stored(self):
+        return self.repository.get(worker_uuid=self.worker.id)
+
+    def test_get_when_worker_does_not_exist(self):
+        with self.assertRaises(WorkerNotFound):
+            self.repository.get(worker_uuid=get_worker_fixture().id)
+
+    def test_update_when_worker_does_not_exist(self):
+        with self.assertRaises(WorkerNotFound):
+            self.repository.update(worker=get_worker_fixture())
+
+    def test_update_many_when_a_worker_does_not_exist(self):
+        self.worker.set_offline()
+
+        with self.assertRaises(WorkerNotFound):
+            self.repository.update_many(
+                workers=[self.worker, get_worker_fixture()]
+            )
+
+        self.assertTrue(self.get_stored().is_online)
+
+    def test_stored_worker_is_isolated_from_caller(self):
+        self.worker.set_offline()
+        self.assertTrue(self.get_stored().is_online)
+
+        self.repository.update(worker=self.worker)
+        actual = self.repository.get_all()
+
+        self.assertEqual([self.worker], actual)
+        self.assertFalse(actual[0].is_online)
+        self.assertIsNot(self.worker, actual[0])
+
+    def test_circuit_operations_change_only_the_circuit(self):
+        stale_copy = self.get_stored()
+        stored = self.get_stored()
+        stored.set_offline()
+        self.repository.update(worker=stored)
+
+        self.repository.record_circuit_failure(
+            worker_uuid=stale_copy.id, failure_threshold=1
+        )
+        actual = self.repository.half_open_circuit(
+            worker_uuid=stale_copy.id, reset_timeout=timedelta(0)
+        )
+
+        self.assertEqual(CircuitState.HALF_OPEN, actual.circuit_state)
+        self.assertEqual(1, actual.failure_count)
+        self.assertFalse(actual.is_online)
+        self.assertEqual(stored.updated_at, actual.updated_at)
+        self.assertIsNot(actual, self.get_stored())
+
+    def test_record_circuit_failure_when_worker_does_not_exist(self):
+        with self.assertRaises(WorkerNotFound):
+            self.repository.record_circuit_failure(
+                worker_uuid=get_worker_fixture().id, failure_threshold=1
+            )
@@ -0,0 +1,191 @@
+import multiprocessing
+import time
+from datetime import datetime
+from functools import partial
+from unittest import TestCase
+from uuid import uuid4
+
+from sl_notifications_broker.domain.entities.notification import (
+    Notification,
+    NotificationMessage,
+    SecondLifeUser,
+)
+from sl_notifications_broker.infrastructure.multiprocess.sharded_processing_engine import (
+    ProcessingEngineStopped,
+    ShardedProcessingEngine,
+    ShardFailed,
+    ShardReport,
+    by_notification_id,
+    shard_for,
+)
+from tests.fixtures.domain.notification_fixture import get_notification_fixture
+
+
+def _record(outcomes, shard, notification):
+    if notification.message.body == "fail":
+        raise RuntimeError
+    outcomes.put((shard, notification.to.second_life_uuid, notification.id))
+
+
+def _recording_factory(outcomes, shard):
+    return partial(_record, outcomes, shard)
+
+
+def _broken_factory(shard):
+    raise RuntimeError(f"shard {shard} cannot start")
+
+
+def _notification_to(recipient, body="message"):
+    return Notification(
+        send_to=SecondLifeUser(
+            second_life_username="recipient", second_life_uuid=recipient
+        ),
+        message=NotificationMessage(body=body),
+    )
+
+
+class TestShardedProcessingEngine(TestCase):
+    def setUp(self) -> None:
+        self.outcomes = multiprocessing.Queue()
+        self.engine = ShardedProcessingEngine(
+            process_notification_factory=partial(
+                _recording_factory, self.outcomes
+            ),
+            shards=3,
+        )
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self.engine.shutdown(timeout=5)
+        super().tearDown()
+
+    def __drain_outcomes(self, count):
+        return [self.outcomes.get(timeout=5) for _ in range(count)]
+
+    def test_shard_for_is_stable_and_in_range(self):
+        key = uuid4()
+
+        self.assertEqual(shard_for(key, 7), shard_for(key, 7))
+        self.assertEqual(key.int % 7, shard_for(key, 7))
+
+    def test_shard_of_by_notification_id(self):
+        notification = get_notification_fixture()
+        engine = ShardedProcessingEngine(
+            process_notification_factory=_recording_factory,
+            shards=4,
+            shard_key=by_notification_id,
+        )
+
+        self.assertEqual(
+            notification.id.int % 4, engine.shard_of(notification)
+        )
+
+    def test_submit_many_keeps_recipient_order_on_one_shard(self):
+        recipients = [uuid4() for _ in range(4)]
+        notifications = [
+            _notification_to(recipient)
+            for _ in range(5)
+            for recipient in recipients
+        ]
+
+        with self.engine:
+            self.engine.submit_many(notifications)
+            outcomes = self.__drain_outcomes(len(notifications))
+
+        for recipient in recipients:
+            expected = [
+                notification.id
+                for notification in notifications
+                if notification.to.second_life_uuid == recipient
+            ]
+            received = [
+                (shard, notification_id)
+                for shard, to, notification_id in outcomes
+                if to == recipient
+            ]
+            self.assertEqual(expected, [item[1] for item in received])
+            self.assertEqual(
+                {shard_for(recipient, 3)}, {item[0] for item in received}
+            )
+
+    def test_shutdown_drains_and_reports(self):
+        recipient = uuid4()
+        notification = _notification_to(recipient)
+        failing = _notification_to(recipient, body="fail")
+        self.engine.start()
+
+        shard = self.engine.submit(notification)
+        self.engine.submit(notification)
+        self.engine.submit(failing)
+        reports = self.engine.shutdown(timeout=5)
+
+        self.assertEqual(3, len(reports))
+        self.assertIn(
+            ShardReport(shard=shard, processed=1, failed=1, skipped=1),
+            reports,
+        )
+        self.assertFalse(self.engine.is_running)
+
+    def test_resubmitted_versions_are_processed_again(self):
+        recipient = uuid4()
+        notification = _notification_to(recipient)
+        failing = _notification_to(recipient, body="fail")
+        self.engine.start()
+
+        shard = self.engine.submit(notification)
+        self.engine.submit(failing)
+        self.engine.submit(failing)
+        notification.set_in_progress()
+        notification.schedule_retry(next_attempt_at=datetime.now())
+        self.engine.submit(notification)
+        reports = self.engine.shutdown(timeout=5)
+
+        self.assertIn(
+            ShardReport(shard=shard, processed=2, failed=2, skipped=0),
+            reports,
+        )
+
+    def test_init_rejects_zero_shards(self):
+        with self.assertRaises(ValueError):
+            ShardedProcessingEngine(
+                process_notification_factory=_recording_factory, shards=0
+            )
+
+    def test_submit_when_stopped(self):
+        with self.assertRaises(ProcessingEngineStopped):
+            self.engine.submit(get_notification_fixture())
+
+    def test_dead_shard_rejects_submissions_and_returns_queued_work(self):
+        engine = ShardedProcessingEngine(
+            process_notification_factory=_broken_factory,
+            shards=1,
+            queue_size=1,
+        )
+        engine.start()
+        accepted = []
+        deadline = time.monotonic() + 10
+        with self.assertRaises(ShardFailed) as failure:
+            while time.monotonic() < deadline:
+                notification = get_notification_fixture()
+                engine.submit(notification)
+                accepted.append(notification)
+
+        (report,) = engine.shutdown(timeout=5)
+
+        self.assertEqual([0], failure.exception.shards)
+        self.assertEqual(1, len(failure.exception.notifications))
+        self.assertFalse(report.drained)
+        self.assertEqual(
+            [notification.id for notification in accepted],
+            [notification.id for notification in report.unprocessed],
+        )
+
+    def test_shutdown_without_timeout_returns_when_shard_is_dead(self):
+        engine = ShardedProcessingEngine(
+            process_notification_factory=_broken_factory, shards=2
+        )
+
+        with engine:
+            pass
+
+        self.assertFalse(engine.is_running)